@@ -0,0 +1,124 @@
+"""
+Benchmark fixtures. Each benchmark times its workload, normalizes it against a calibration workload (so the baseline is
+portable between machines) and fails when it is slower than the committed baseline by more than the tolerance.
+
+The benchmarks are timing sensitive, so they are deselected unless they are enabled, to keep correctness runs on busy
+machines (eg: CI) deterministic:
+
+    FLUX_BENCHMARK=1 pytest benchmarks
+
+The Benchmark workflow (.github/workflows/benchmark.yml) runs them weekly and on demand.
+
+Environment variables:
+ - FLUX_BENCHMARK=1: run the benchmarks
+ - FLUX_BENCHMARK_UPDATE=1: update baseline.json with the results of this run instead of comparing against it
+ - FLUX_BENCHMARK_TOLERANCE: the allowed slowdown as a fraction of the baseline, defaults to 1.0 (ie: 2x slower)
+"""
+import json
+import os
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+BENCHMARKS_PATH = Path(__file__).parent
+BASELINE_PATH = BENCHMARKS_PATH / "baseline.json"
+UPDATE = os.environ.get("FLUX_BENCHMARK_UPDATE") == "1"
+ENABLED = UPDATE or os.environ.get("FLUX_BENCHMARK") == "1"
+TOLERANCE = float(os.environ.get("FLUX_BENCHMARK_TOLERANCE", "1.0"))
+
+REPEAT = 5
+RETRIES = 2
+"""The number of times a benchmark slower than the baseline is measured again before failing."""
+TARGET_SECONDS = 0.005
+"""The approximate duration of each timed repetition."""
+
+_results: dict[str, float] = {}
+
+
+@dataclass
+class _CalibrationObject:
+    id: int
+    name: str
+    fields: dict
+
+
+def _calibration_workload():
+    for i in range(100):
+        _CalibrationObject(id=i, name="calibration", fields={"id": i, "name": "calibration"})
+
+
+def _time_per_call(fn: Callable[[], object]) -> float:
+    timer = timeit.Timer(fn)
+    elapsed = timer.timeit(number=1)
+    number = max(1, int(TARGET_SECONDS / max(elapsed, 1e-7)))
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def pytest_collection_modifyitems(config, items):
+    if ENABLED:
+        return
+    deselected = [item for item in items if BENCHMARKS_PATH in item.path.parents]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if BENCHMARKS_PATH not in item.path.parents]
+
+
+@pytest.fixture(scope="session")
+def calibration() -> float:
+    return _time_per_call(_calibration_workload)
+
+
+@pytest.fixture(scope="session")
+def baseline() -> dict[str, float]:
+    if UPDATE or not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())["benchmarks"]
+
+
+@pytest.fixture
+def benchmark(request, calibration: float, baseline: dict[str, float]) -> Callable[[Callable[[], object]], float]:
+    """Time fn (the per-operation time, in seconds) and compare it against the baseline of this test."""
+
+    def run(fn: Callable[[], object], operations: int = 1) -> float:
+        expected = baseline.get(request.node.name)
+        reference = calibration
+        for attempt in range(RETRIES + 1):
+            if attempt:
+                # the machine may have been busy, so calibrate again right before measuring again
+                reference = _time_per_call(_calibration_workload)
+            per_operation = _time_per_call(fn) / operations
+            normalized = per_operation / reference
+            if expected is None or normalized <= expected * (1 + TOLERANCE):
+                break
+
+        _results[request.node.name] = normalized
+        if expected is not None and normalized > expected * (1 + TOLERANCE):
+            pytest.fail(
+                f"{request.node.name} regressed: {normalized:.4f} against a baseline of {expected:.4f} "
+                f"({per_operation * 1e6:.2f}us per operation)"
+            )
+        return per_operation
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if UPDATE and _results:
+        # merged with the existing baseline, so a subset of the benchmarks can be updated with -k
+        benchmarks = json.loads(BASELINE_PATH.read_text())["benchmarks"] if BASELINE_PATH.exists() else {}
+        benchmarks.update(_results)
+        content = {
+            "description": "Per-operation time of each benchmark, relative to the calibration workload in conftest.py",
+            "benchmarks": dict(sorted(benchmarks.items())),
+        }
+        BASELINE_PATH.write_text(json.dumps(content, indent=2) + "\n")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if _results and (UPDATE or config.option.verbose > 0):
+        terminalreporter.section("benchmarks (relative to calibration)")
+        for name, normalized in sorted(_results.items()):
+            terminalreporter.write_line(f"{name:<70} {normalized:10.4f}")
@@ -0,0 +1,192 @@
+"""
+Synthetic keyword arguments for every data model with a __post_init__, at a configurable size. The size is the number of
+elements in the collections of the model (eg: the fields of a Record, or the job shifts of a TimeEntry).
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from flux_sdk.etl.data_models.query import MongoQuery, SQLQuery
+from flux_sdk.etl.data_models.record import CompactRecord, Record, RecordFields
+from flux_sdk.etl.data_models.schema import (
+    CustomObjectReference,
+    EmployeeLookup,
+    EmployeeReference,
+    Schema,
+    SchemaDataType,
+    SchemaField,
+)
+from flux_sdk.time_and_attendance.capabilities.job_management.data_models import (
+    AddressCompatibleValue,
+    Attribute,
+    AttributeValue,
+    EmployeePayRateOverride,
+    GetEmployeesPayRateOverridesResponse,
+    GetJobAttributesRequest,
+    GetJobAttributesResponse,
+    PayRateCompatibleValue,
+    RipplingAttribute,
+)
+from flux_sdk.time_and_attendance.capabilities.time_entry_management.data_models import (
+    Break,
+    BreakType,
+    GetBreakTypesResponse,
+    JobShift,
+    TimeEntry,
+)
+
+START = datetime(2024, 1, 1, 9, tzinfo=timezone.utc)
+
+Kwargs = dict[str, Any]
+
+
+def record(size: int, index: int = 0) -> Kwargs:
+    fields = {f"field_{i}": f"value_{i}" if i % 2 else i for i in range(size)}
+    return dict(primary_key=f"record_{index}", fields=fields, references={"owner": "employee_1"}, checkpoint=START)
+
+
+def compact_record(size: int, index: int = 0) -> Kwargs:
+    kwargs = record(size, index)
+    kwargs["fields"] = RecordFields.from_dict(kwargs["fields"])
+    return kwargs
+
+
+def sql_query(size: int, index: int = 0) -> Kwargs:
+    args = {f"arg_{i}": i for i in range(size)}
+    text = "SELECT * FROM records WHERE " + " AND ".join(f"c_{i} = @arg_{i}" for i in range(size))
+    return dict(text=text, args=args)
+
+
+def mongo_query(size: int, index: int = 0) -> Kwargs:
+    return dict(
+        collection=f"collection_{index}",
+        filter={f"field_{i}": {"$gte": i} for i in range(size)},
+        projection={f"field_{i}": 1 for i in range(size)},
+    )
+
+
+def schema_field(size: int, index: int = 0) -> Kwargs:
+    return dict(
+        name=f"field_{index}",
+        data_type=SchemaDataType.Enum,
+        enum_values=[f"value_{i}" for i in range(size)],
+    )
+
+
+def custom_object_reference(size: int, index: int = 0) -> Kwargs:
+    return dict(object=f"object_{index}", lookup="external_id")
+
+
+def employee_reference(size: int, index: int = 0) -> Kwargs:
+    return dict(lookup=EmployeeLookup.WORK_EMAIL, description=f"reference_{index}")
+
+
+def schema(size: int, index: int = 0) -> Kwargs:
+    return dict(
+        name=f"schema_{index}",
+        category_name="Category",
+        category_description="Synthetic schema",
+        primary_key_field="field_0",
+        name_field="field_1",
+        fields=[SchemaField(name=f"field_{i}", data_type=SchemaDataType.String) for i in range(max(size, 2))],
+        references={f"reference_{i}": CustomObjectReference(object="object", lookup="id") for i in range(size)},
+        owner=("field_0", EmployeeReference(lookup=EmployeeLookup.WORK_EMAIL)),
+    )
+
+
+def job_shift(size: int, index: int = 0) -> Kwargs:
+    start = START + timedelta(hours=index)
+    return dict(
+        id=f"shift_{index}",
+        job_attributes={f"attribute_{i}": f"value_{i}" for i in range(size)},
+        start_time=start,
+        end_time=start + timedelta(hours=1),
+    )
+
+
+def break_(size: int, index: int = 0) -> Kwargs:
+    start = START + timedelta(hours=index)
+    return dict(id=f"break_{index}", start_time=start, end_time=start + timedelta(minutes=30), break_type_id="meal")
+
+
+def break_type(size: int, index: int = 0) -> Kwargs:
+    return dict(id=f"break_type_{index}", name=f"Break {index}")
+
+
+def get_break_types_response(size: int, index: int = 0) -> Kwargs:
+    return dict(break_types=[BreakType(**break_type(size, i)) for i in range(size)])
+
+
+def time_entry(size: int, index: int = 0) -> Kwargs:
+    return dict(
+        id=f"time_entry_{index}",
+        user_id="user_1",
+        job_shifts=[JobShift(**job_shift(1, i)) for i in range(size)],
+        breaks=[Break(**break_(1, i)) for i in range(size)],
+        start_time=START,
+        end_time=START + timedelta(hours=size),
+    )
+
+
+def pay_rate_compatible_value(size: int, index: int = 0) -> Kwargs:
+    return dict(pay_rate=f"{index}.5")
+
+
+def address_compatible_value(size: int, index: int = 0) -> Kwargs:
+    return dict(street_line_1=f"{index} Main St", zip_code="94107", city="San Francisco", state="CA", country_code="US")
+
+
+def attribute_value(size: int, index: int = 0) -> Kwargs:
+    values = [PayRateCompatibleValue(**pay_rate_compatible_value(size, i)) for i in range(size)]
+    return dict(id=f"attribute_value_{index}", name=f"Value {index}", associated_attribute_values=values)
+
+
+def attribute(size: int, index: int = 0) -> Kwargs:
+    return dict(
+        id=f"attribute_{index}",
+        name=f"Attribute {index}",
+        compatible_rippling_attributes=[RipplingAttribute.PAY_RATE],
+        attribute_values=[AttributeValue(**attribute_value(1, i)) for i in range(size)],
+    )
+
+
+def get_job_attributes_request(size: int, index: int = 0) -> Kwargs:
+    return dict(requested_attribute_values=True, requested_attributes=[f"attribute_{i}" for i in range(size)])
+
+
+def get_job_attributes_response(size: int, index: int = 0) -> Kwargs:
+    return dict(attributes=[Attribute(**attribute(1, i)) for i in range(size)])
+
+
+def employee_pay_rate_override(size: int, index: int = 0) -> Kwargs:
+    return dict(employee_id=f"employee_{index}", attribute_value_id="attribute_value_0", pay_rate="42.5")
+
+
+def get_employees_pay_rate_overrides_response(size: int, index: int = 0) -> Kwargs:
+    overrides = [EmployeePayRateOverride(**employee_pay_rate_override(1, i)) for i in range(size)]
+    return dict(employee_pay_rate_overrides_per_attribute={"job_title": overrides})
+
+
+MODELS: dict[type, Callable[[int, int], Kwargs]] = {
+    Record: record,
+    CompactRecord: compact_record,
+    SQLQuery: sql_query,
+    MongoQuery: mongo_query,
+    SchemaField: schema_field,
+    CustomObjectReference: custom_object_reference,
+    EmployeeReference: employee_reference,
+    Schema: schema,
+    JobShift: job_shift,
+    Break: break_,
+    BreakType: break_type,
+    GetBreakTypesResponse: get_break_types_response,
+    TimeEntry: time_entry,
+    PayRateCompatibleValue: pay_rate_compatible_value,
+    AddressCompatibleValue: address_compatible_value,
+    AttributeValue: attribute_value,
+    Attribute: attribute,
+    GetJobAttributesRequest: get_job_attributes_request,
+    GetJobAttributesResponse: get_job_attributes_response,
+    EmployeePayRateOverride: employee_pay_rate_override,
+    GetEmployeesPayRateOverridesResponse: get_employees_pay_rate_overrides_response,
+}
+"""The synthetic keyword arguments of each model, called with (size, index)."""
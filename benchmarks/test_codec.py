@@ -0,0 +1,54 @@
+"""
+Encoding and decoding throughput of the Record codec, see conftest.py for how the results are compared against
+baseline.json. Decoding should be about as fast as unpickling the same Records.
+"""
+import pickle
+import timeit
+from datetime import date, datetime, timezone
+
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.helpers.codec import decode_records, encode_records
+
+ROWS = 2_000
+
+
+def _records() -> list[Record]:
+    return [
+        Record(
+            primary_key=f"invoice_{i}",
+            fields={
+                "number": f"INV-{i}",
+                "count": i,
+                "total": i * 1.5,
+                "paid": i % 2 == 0,
+                "due": date(2024, 1, 1 + i % 28),
+                "updated": datetime(2024, 1, 2, 3, 4, i % 60, tzinfo=timezone.utc),
+                "customer": f"customer_{i % 3}",
+                "note": None if i % 2 else "rush",
+            },
+            references={"customer": f"customer_{i % 3}"} if i % 4 else None,
+            checkpoint=1_000 + i,
+        )
+        for i in range(ROWS)
+    ]
+
+
+def test_encode(benchmark):
+    records = _records()
+    benchmark(lambda: encode_records(records), operations=ROWS)
+
+
+def test_decode(benchmark):
+    data = encode_records(_records())
+    benchmark(lambda: decode_records(data), operations=ROWS)
+
+
+def test_decode_against_pickle():
+    # a ratio on the same machine, so unlike the baselines it holds without calibration;
+    # decoding builds validated Records where pickle restores them, and measures about 1.6-2x
+    records = _records()
+    data = encode_records(records)
+    pickled = pickle.dumps(records, pickle.HIGHEST_PROTOCOL)
+    decoding = min(timeit.repeat(lambda: decode_records(data), number=5, repeat=7))
+    unpickling = min(timeit.repeat(lambda: pickle.loads(pickled), number=5, repeat=7))
+    assert decoding < unpickling * 3, f"decoding took {decoding:.4f}s against {unpickling:.4f}s unpickling"
@@ -0,0 +1,38 @@
+"""
+Construction and validation throughput of every data model with a __post_init__, see conftest.py for how the results
+are compared against baseline.json.
+"""
+import pytest
+
+from benchmarks.synthetic import MODELS
+from flux_sdk.flux_core.validation import validate_batch
+
+SIZES = [1, 10, 100]
+BATCH_SIZES = [10, 100]
+
+VALIDATED_MODELS = [cls for cls in MODELS if hasattr(cls, "__field_rules__")]
+
+
+def _id(cls: type) -> str:
+    return cls.__name__
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("cls", MODELS, ids=_id)
+def test_construct(benchmark, cls, size):
+    kwargs = MODELS[cls](size, 0)
+    benchmark(lambda: cls(**kwargs))
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("cls", VALIDATED_MODELS, ids=_id)
+def test_validate(benchmark, cls, size):
+    obj = cls.from_trusted(**MODELS[cls](size, 0))
+    benchmark(obj.validate)
+
+
+@pytest.mark.parametrize("batch_size", BATCH_SIZES)
+@pytest.mark.parametrize("cls", VALIDATED_MODELS, ids=_id)
+def test_validate_batch(benchmark, cls, batch_size):
+    rows = [MODELS[cls](10, i) for i in range(batch_size)]
+    benchmark(lambda: validate_batch(cls, rows), operations=batch_size)
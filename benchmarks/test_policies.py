@@ -0,0 +1,49 @@
+"""
+Record construction throughput under each validation policy, see conftest.py for how the results are compared against
+baseline.json. Sampling should cost much less than validating every Record once the shapes are known.
+"""
+import timeit
+
+import pytest
+
+from benchmarks.synthetic import record
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.flux_core.sampling import SamplingPolicy
+from flux_sdk.flux_core.validation import trusted_construction, validation_policy
+
+SIZES = [5, 20]
+ROWS = 1000
+
+
+def _construct_all(rows: list[dict]):
+    for kwargs in rows:
+        Record(**kwargs)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_validated(benchmark, size):
+    rows = [record(size, i) for i in range(ROWS)]
+    benchmark(lambda: _construct_all(rows), operations=ROWS)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_sampled(benchmark, size):
+    rows = [record(size, i) for i in range(ROWS)]
+    with validation_policy(SamplingPolicy(every=100)):
+        benchmark(lambda: _construct_all(rows), operations=ROWS)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_trusted(benchmark, size):
+    rows = [record(size, i) for i in range(ROWS)]
+    with trusted_construction():
+        benchmark(lambda: _construct_all(rows), operations=ROWS)
+
+
+def test_sampling_speedup():
+    # a ratio on the same machine, so unlike the baselines it holds without calibration
+    rows = [record(20, i) for i in range(ROWS)]
+    validated = min(timeit.repeat(lambda: _construct_all(rows), number=5, repeat=5))
+    with validation_policy(SamplingPolicy(every=100)):
+        sampled = min(timeit.repeat(lambda: _construct_all(rows), number=5, repeat=5))
+    assert sampled < validated * 0.8, f"sampling took {sampled:.4f}s against {validated:.4f}s validating every Record"
@@ -0,0 +1,113 @@
+"""
+Compare the construction cost of the @validated data models against the equivalent chain of check_field calls.
+
+Run from the repository root with:
+
+    python -m benchmarks.validation_plans
+"""
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from flux_sdk.etl.data_models.record import Checkpoint, Field, Record
+from flux_sdk.flux_core.validation import check_field
+from flux_sdk.time_and_attendance.capabilities.time_entry_management.data_models import Break, JobShift
+
+
+@dataclass(kw_only=True)
+class CheckFieldRecord:
+    primary_key: str
+    fields: dict[str, Field]
+    references: Optional[dict[str, str]] = None
+    checkpoint: Optional[Checkpoint] = None
+    drop: Optional[bool] = None
+
+    def __post_init__(self):
+        check_field(self, "primary_key", str, required=True)
+        check_field(self, "fields", dict[str, Field], required=True)
+        check_field(self, "references", dict[str, str])
+        check_field(self, "checkpoint", Checkpoint)
+        check_field(self, "drop", bool)
+
+
+@dataclass(kw_only=True)
+class CheckFieldJobShift:
+    id: str
+    job_attributes: dict[str, str]
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    description: Optional[str] = None
+
+    def __post_init__(self):
+        check_field(self, "id", str, required=True)
+        check_field(self, "job_attributes", dict[str, Any], required=True)
+        check_field(self, "start_time", datetime, required=True)
+        if self.start_time.tzinfo is None:
+            raise ValueError("No time zone provided for start_time")
+        check_field(self, "end_time", datetime)
+        if self.end_time is not None and self.end_time.tzinfo is None:
+            raise ValueError("No time zone provided for end_time")
+        check_field(self, "description", str)
+
+
+@dataclass(kw_only=True)
+class CheckFieldBreak:
+    id: str
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    description: Optional[str] = None
+    break_type_id: str
+
+    def __post_init__(self):
+        check_field(self, "id", str, required=True)
+        check_field(self, "start_time", datetime, required=True)
+        if self.start_time.tzinfo is None:
+            raise ValueError("No time zone provided for start_time")
+        check_field(self, "end_time", datetime)
+        if self.end_time is not None and self.end_time.tzinfo is None:
+            raise ValueError("No time zone provided for end_time")
+        check_field(self, "description", str)
+        check_field(self, "break_type_id", str, required=True)
+
+
+NOW = datetime.now(timezone.utc)
+
+CASES = [
+    (
+        "Record",
+        Record,
+        CheckFieldRecord,
+        dict(
+            primary_key="record_1",
+            fields={f"field_{i}": i for i in range(10)},
+            references={"customer_id": "customer_1"},
+            checkpoint=NOW,
+            drop=False,
+        ),
+    ),
+    (
+        "JobShift",
+        JobShift,
+        CheckFieldJobShift,
+        dict(id="shift_1", job_attributes={"job_title": "Cashier"}, start_time=NOW, end_time=NOW, description="Shift"),
+    ),
+    (
+        "Break",
+        Break,
+        CheckFieldBreak,
+        dict(id="break_1", start_time=NOW, end_time=NOW, description="Lunch", break_type_id="meal"),
+    ),
+]
+
+
+def main(number: int = 100_000):
+    print(f"{'model':<10} {'check_field (us)':>18} {'@validated (us)':>18} {'speedup':>8}")
+    for name, validated_cls, check_field_cls, kwargs in CASES:
+        chain = min(timeit.repeat(lambda: check_field_cls(**kwargs), number=number, repeat=3)) / number * 1e6
+        plan = min(timeit.repeat(lambda: validated_cls(**kwargs), number=number, repeat=3)) / number * 1e6
+        print(f"{name:<10} {chain:>18.3f} {plan:>18.3f} {chain / plan:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from flux_sdk.etl.data_models.query import Connector, Query
+from flux_sdk.etl.data_models.record import Checkpoint, Record
+from flux_sdk.etl.data_models.schema import Schema
+
+
+class AsyncSingleObjectImport(ABC):
+    """The asynchronous equivalent of SingleObjectImport.
+
+    Implement this class instead of SingleObjectImport when "process_records" has to perform I/O for each batch (eg:
+    looking up related rows, or calling an API to enrich them). Since the hooks are coroutines, several batches can be
+    processed concurrently (see etl.helpers.async_runner.run_async) rather than one request at a time.
+    """
+
+    @staticmethod
+    @abstractmethod
+    def get_schema() -> Schema:
+        """A function that defines schema for the records being imported.
+
+        See SingleObjectImport.get_schema.
+
+        :return: Schema
+        """
+
+    @staticmethod
+    @abstractmethod
+    async def prepare_query(connector: Connector, schema: Schema, checkpoint: Optional[Checkpoint]) -> Query:
+        """A coroutine that prepares the query that should be run by Rippling to extract records.
+
+        See SingleObjectImport.prepare_query.
+
+        :param connector: This indicates what type of connector is configured, which may change the returned Query.
+        :param schema: The schema generated in the "get_schema" hook for this object.
+        :param checkpoint: If included, this is an incremental sync and the implementation should adjust the Query
+        accordingly to sort by the checkpoint.
+        :return: Query
+        """
+
+    @staticmethod
+    @abstractmethod
+    async def process_records(schema: Schema, records: list[Record]) -> list[Record]:
+        """A coroutine that post process the results from `prepare_query` to fit in the schema.
+
+        See SingleObjectImport.process_records. Several batches may be processed concurrently, so implementations
+        should not rely on state shared between calls.
+
+        :param schema: The schema generated in the "get_schema" hook for this object.
+        :param records: The batch of records to be updated
+        :return: Records
+        """
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
 from typing import Optional
 
 from flux_sdk.etl.data_models.query import Connector, Query
 from flux_sdk.etl.data_models.record import Checkpoint, Record
+from flux_sdk.etl.data_models.record_batch import RecordBatch
 from flux_sdk.etl.data_models.schema import Schema
 
 
@@ -46,6 +48,28 @@ class SingleObjectImport(ABC):
         :return: Query
         """
 
+    @staticmethod
+    def prepare_partitioned_query(
+        connector: Connector, schema: Schema, checkpoint: Optional[Checkpoint], partitions: int
+    ) -> Sequence[Query]:
+        """An optional alternative to "prepare_query" which splits the extraction into queries run concurrently.
+
+        Implement this hook to return up to "partitions" queries, each selecting a disjoint range of the rows (eg: of
+        the primary key, or of the checkpoint) selected by "prepare_query", which together select all of them. See
+        etl.helpers.partitioning for building the ranges and the queries. When it is implemented and more than one
+        partition is requested, it is preferred over "prepare_query".
+
+        The checkpoint of a partitioned sync is the highest checkpoint of all the partitions, once every partition has
+        completed (see etl.helpers.partitioning.combine_checkpoints).
+
+        :param connector: This indicates what type of connector is configured, which may change the returned Queries.
+        :param schema: The schema generated in the "get_schema" hook for this object.
+        :param checkpoint: If included, this is an incremental sync, see "prepare_query".
+        :param partitions: The maximum number of queries which can be extracted concurrently.
+        :return: Queries
+        """
+        raise NotImplementedError()
+
     @staticmethod
     @abstractmethod
     def process_records(schema: Schema, records: list[Record]) -> list[Record]:
@@ -59,7 +83,45 @@ class SingleObjectImport(ABC):
         the sync will fail. As such, this hook has the opportunity to massage any raw query results that may not be
         directly compatible.
 
+        Records which cannot be massaged into a valid shape can be dropped with "drop_invalid_records", which does not
+        raise and reports the dropped rows, while "try_construct" builds new Records without raising on invalid data.
+        Records which do not conform to the schema (eg: a missing required field) can be dropped with a
+        "ConformanceChecker" the same way.
+
         :param schema: The schema generated in the "get_schema" hook for this object.
         :param records: The batch of records to be updated
         :return: Records
         """
+
+    @staticmethod
+    def process_record_batch(schema: Schema, batch: RecordBatch) -> RecordBatch:
+        """An optional, columnar alternative to "process_records".
+
+        Implement this hook instead of (or as well as) "process_records" to transform a batch one column at a time
+        (eg: with vectorized operations) rather than one Record at a time. When it is implemented, it is preferred over
+        "process_records", and the batch it returns is converted back into Records and validated as usual. See
+        RecordBatch for the layout, including the checkpoints and the drop mask.
+
+        :param schema: The schema generated in the "get_schema" hook for this object.
+        :param batch: The batch of records to be updated, with one column per SchemaField.
+        :return: RecordBatch
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def process_record_stream(schema: Schema, records: Iterator[Record]) -> Iterator[Record]:
+        """An optional, streaming alternative to "process_records".
+
+        Implement this hook as a generator to process Records one at a time as they are extracted, rather than a whole
+        batch at a time, so that memory stays constant however large the table is and processed Records can be loaded
+        while the query is still running. When it is implemented, it is preferred over "process_record_batch" and
+        "process_records".
+
+        Consume the records lazily (eg: "for record in records: ... yield record") rather than collecting them in a
+        list. As with "process_records", every Record must be yielded, setting drop on those that should be skipped.
+
+        :param schema: The schema generated in the "get_schema" hook for this object.
+        :param records: The records extracted by the query from "prepare_query", in order.
+        :return: Records
+        """
+        raise NotImplementedError()
@@ -1,9 +1,12 @@
+import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date, datetime, time
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Optional, Union
 
-from flux_sdk.flux_core.validation import check_field
+from flux_sdk.flux_core.validation import FieldRule, Validated, validated
 
 
 class Connector(Enum):
@@ -16,8 +19,101 @@ SQLQueryArg = Union[str, bool, int, float, datetime, date, time]
 """This is the reduced list of acceptable types that can be used as SQL arguments."""
 
 
+SQL_TEMPLATE_CACHE_SIZE = 1024
+"""The number of distinct query texts for which the parsed SQLTemplate is kept."""
+
+# string literals, quoted identifiers, comments and @@system variables are matched so that they are skipped
+_SQL_TOKENS = re.compile(r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|--[^\n]*|/\*.*?\*/|@@\w+|@(\w+)""", re.DOTALL)
+
+_PARAM_STYLES = {
+    "qmark": lambda name: "?",
+    "format": lambda name: "%s",
+    "named": lambda name: f":{name}",
+    "pyformat": lambda name: f"%({name})s",
+}
+"""The supported PEP 249 parameter styles, and how each renders a placeholder."""
+
+
+class SQLTemplate:
+    """
+    The "@var" placeholders of a SQL query text, found once per distinct text (see sql_template) so that binding args
+    for a database driver does not scan the text again.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        segments = []
+        names = []
+        start = 0
+        for match in _SQL_TOKENS.finditer(text):
+            if match.group(1) is not None:
+                segments.append(text[start:match.start()])
+                names.append(match.group(1))
+                start = match.end()
+        segments.append(text[start:])
+
+        self.names: tuple[str, ...] = tuple(names)
+        """The name of each placeholder, in order, including repeated ones."""
+
+        self.variables: frozenset[str] = frozenset(names)
+        self._segments = tuple(segments)
+        self._rendered: dict[str, str] = {}
+
+    def check_args(self, args: Mapping[str, Any]):
+        """Raise a ValueError unless args has exactly one value per variable of the text."""
+        if self.variables != args.keys():
+            problems = []
+            missing = self.variables - args.keys()
+            if missing:
+                problems.append(f"missing: {', '.join(sorted(missing))}")
+            unused = args.keys() - self.variables
+            if unused:
+                problems.append(f"unused: {', '.join(sorted(unused))}")
+            raise ValueError(f"args should match the @variables of the text ({'; '.join(problems)})")
+
+    def render(self, style: str) -> str:
+        """The text with its placeholders in the parameter style of a driver (one of qmark, format, named, pyformat)."""
+        rendered = self._rendered.get(style)
+        if rendered is None:
+            placeholder = _PARAM_STYLES.get(style)
+            if placeholder is None:
+                raise ValueError(f"style should be one of {', '.join(_PARAM_STYLES)}")
+
+            segments = self._segments
+            if style in ("format", "pyformat"):
+                segments = tuple(segment.replace("%", "%%") for segment in segments)
+            parts = [segments[0]]
+            for name, segment in zip(self.names, segments[1:]):
+                parts.append(placeholder(name))
+                parts.append(segment)
+            rendered = self._rendered[style] = "".join(parts)
+        return rendered
+
+    def bind(self, args: Optional[Mapping[str, Any]], style: str) -> tuple[str, Union[list[Any], dict[str, Any]]]:
+        """
+        The text and parameters to pass to the execute method of a driver with this parameter style: a list of values
+        (one per placeholder, in order) for the positional styles, or a dict for the named styles.
+        """
+        args = args or {}
+        self.check_args(args)
+        text = self.render(style)
+        if style in ("named", "pyformat"):
+            return text, dict(args)
+        return text, [args[name] for name in self.names]
+
+
+@lru_cache(maxsize=SQL_TEMPLATE_CACHE_SIZE)
+def sql_template(text: str) -> SQLTemplate:
+    """The parsed SQLTemplate of text, cached by text (least recently used texts are evicted)."""
+    return SQLTemplate(text)
+
+
 @dataclass(kw_only=True)
-class SQLQuery:
+@validated(
+    FieldRule("text", str, required=True),
+    FieldRule("args", dict[str, SQLQueryArg]),
+)
+class SQLQuery(Validated):
     """This is returned by the "prepare_query" hook for SQL connectors."""
 
     text: str
@@ -29,17 +125,31 @@ class SQLQuery:
     hook. In the sql_query, each "@var" will be replaced with the corresponding "var" from this dict. The query text
     must use only alphanumeric characters and underscores in variable names in order to be properly detected.
 
-    This is where a variable like "checkpoint" could be added to have it interpolated safely and cleanly.
+    This is where a variable like "checkpoint" could be added to have it interpolated safely and cleanly. When args are
+    provided, each "@var" of the text must have a value and each value must be used, see bind for executing the query.
     """
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "text", str, required=True)
-        check_field(self, "args", dict[str, SQLQueryArg])
+        if self.args is not None:
+            sql_template(self.text).check_args(self.args)
+
+    def bind(self, style: str) -> tuple[str, Union[list[Any], dict[str, Any]]]:
+        """
+        The text and parameters to execute this query with a database driver using this PEP 249 parameter style (eg:
+        "format" for %s, "qmark" for ?, "named" for :name). See SQLTemplate.bind.
+        """
+        return sql_template(self.text).bind(self.args, style)
 
 
 @dataclass(kw_only=True)
-class MongoQuery:
+@validated(
+    FieldRule("collection", str, required=True),
+    FieldRule("filter", dict[str, Any]),
+    FieldRule("projection", dict[str, Any]),
+    FieldRule("aggregate", list[dict[str, Any]]),
+)
+class MongoQuery(Validated):
     """
     This is returned by the "prepare_query" hook for MongoDB connectors. The inclusion of filter, projection and
     aggregate support a variety of query patterns:
@@ -72,13 +182,6 @@ class MongoQuery:
     embed) to the database through this instead of using the basic filter.
     """
 
-    def __post_init__(self):
-        """Perform validation."""
-        check_field(self, "collection", str, required=True)
-        check_field(self, "filter", dict[str, Any])
-        check_field(self, "projection", dict[str, Any])
-        check_field(self, "aggregate", list[dict[str, Any]])
-
 
 Query = Union[SQLQuery, MongoQuery]
 """This is the list of types that can be used to represent a query."""
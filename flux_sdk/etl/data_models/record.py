@@ -1,8 +1,18 @@
+from collections.abc import Iterable, Iterator, MutableMapping
 from dataclasses import dataclass
 from datetime import date, datetime, time
-from typing import Optional, Union
+from typing import Any, Optional, Union, get_args
 
-from flux_sdk.flux_core.validation import check_field
+from flux_sdk.flux_core.validation import (
+    FieldRule,
+    IssueCode,
+    Validated,
+    ValidationIssue,
+    ValidationReport,
+    compile_checker,
+    validate_batch,
+    validated,
+)
 
 Field = Union[str, int, float, bool, date, time, datetime, None]
 """
@@ -19,7 +29,14 @@ for the next sync.
 
 
 @dataclass(kw_only=True)
-class Record:
+@validated(
+    FieldRule("primary_key", str, required=True),
+    FieldRule("fields", dict[str, Field], required=True),
+    FieldRule("references", dict[str, str]),
+    FieldRule("checkpoint", Checkpoint),
+    FieldRule("drop", bool),
+)
+class Record(Validated):
     """This corresponds to a row in the source database."""
 
     primary_key: str
@@ -63,10 +80,276 @@ class Record:
     If a Record is not found after this hook, that will be regarded as an error, so this flag should be used instead.
     """
 
+
+def checkpoint_greater(checkpoint: Checkpoint, than: Checkpoint) -> bool:
+    """Whether checkpoint is greater than another checkpoint of the same type, checkpoints of different types raise."""
+    if isinstance(checkpoint, datetime) and isinstance(than, datetime):
+        return checkpoint > than
+    if isinstance(checkpoint, int) and isinstance(than, int):
+        return checkpoint > than
+    if isinstance(checkpoint, str) and isinstance(than, str):
+        return checkpoint > than
+    raise TypeError(f"cannot compare a checkpoint of type {type(checkpoint).__name__} with a {type(than).__name__}")
+
+
+class CheckpointTracker:
+    """
+    Computes the high-water mark of the checkpoints of a sync (see Record.checkpoint) as batches are processed, without
+    keeping them. Checkpoints of different types (or datetimes with and without a time zone) cannot be compared, so the
+    first checkpoint of a different type raises a TypeError rather than failing the sync at the end.
+
+    Trackers of the shards of a sync (eg: processed by separate workers) can be combined with merge.
+    """
+
+    def __init__(self):
+        self.highest: Optional[Checkpoint] = None
+        """The highest checkpoint so far, or None when no Record had a checkpoint."""
+
+        self.count = 0
+        """The number of checkpoints folded in so far."""
+
+        self._kind: Optional[tuple[type, bool]] = None
+
+    def __repr__(self) -> str:
+        return f"CheckpointTracker(highest={self.highest!r}, count={self.count})"
+
+    @staticmethod
+    def _kind_of(checkpoint: Checkpoint) -> tuple[type, bool]:
+        if isinstance(checkpoint, datetime):
+            return datetime, checkpoint.tzinfo is not None
+        if isinstance(checkpoint, (int, str)) and not isinstance(checkpoint, bool):
+            return type(checkpoint), False
+        raise TypeError(f"checkpoint should be a {Checkpoint}")
+
+    def _check_kind(self, kind: tuple[type, bool]):
+        if self._kind is None:
+            self._kind = kind
+        elif kind != self._kind:
+            raise TypeError(
+                f"checkpoint should be a {_describe(self._kind)} like the previous ones, not a {_describe(kind)}"
+            )
+
+    def add(self, checkpoint: Optional[Checkpoint]):
+        """Fold in one checkpoint, None is ignored."""
+        if checkpoint is None:
+            return
+        self._check_kind(self._kind_of(checkpoint))
+        self.count += 1
+        if self.highest is None or checkpoint_greater(checkpoint, self.highest):
+            self.highest = checkpoint
+
+    def update(self, records: Iterable[Record]):
+        """Fold in the checkpoints of a batch of Records (including the dropped ones)."""
+        for record in records:
+            if record.checkpoint is not None:
+                self.add(record.checkpoint)
+
+    def merge(self, other: "CheckpointTracker") -> "CheckpointTracker":
+        """Fold in the checkpoints of another tracker, eg: one per partition or worker. Returns this tracker."""
+        if other._kind is not None:
+            self._check_kind(other._kind)
+            self.count += other.count
+            if self.highest is None or (other.highest is not None and checkpoint_greater(other.highest, self.highest)):
+                self.highest = other.highest
+        return self
+
+
+def _describe(kind: tuple[type, bool]) -> str:
+    if kind[0] is datetime:
+        return "datetime with a time zone" if kind[1] else "datetime without a time zone"
+    return kind[0].__name__
+
+
+def drop_invalid_records(records: list[Record]) -> ValidationReport:
+    """
+    Set drop on every Record that no longer passes validation, eg: after "process_records" has modified its fields, so
+    that a few bad rows are skipped instead of failing the whole sync. This does not raise, the returned report lists
+    the dropped rows and why.
+    """
+    report = validate_batch(Record, records)
+    for i in report.invalid_rows:
+        records[i].drop = True
+    return report
+
+
+class FieldLayout:
+    """
+    The field names shared by the CompactRecords of a batch, so that each row only stores its values.
+    """
+
+    __slots__ = ("names", "index")
+
+    def __init__(self, names: Iterable[str]):
+        self.names: tuple[str, ...] = tuple(names)
+        for name in self.names:
+            if not isinstance(name, str):
+                raise ValidationIssue(IssueCode.DICT_KEYS, "fields", str).error()
+
+        self.index: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        if len(self.index) != len(self.names):
+            raise ValueError("fields should not have duplicate names")
+
+    def __repr__(self) -> str:
+        return f"FieldLayout({self.names!r})"
+
+
+_FIELD_TYPES = get_args(Field)
+_check_fields_dict = compile_checker(dict[str, Field])
+
+
+class RecordFields(MutableMapping):
+    """
+    The fields of a CompactRecord: a mapping over a list of values, in the order of the names of a shared FieldLayout.
+    Reading and updating existing fields happens in place. Adding or removing a field copies the values into a private
+    dict first (copy-on-write), so the shared layout is never modified.
+    """
+
+    __slots__ = ("_layout", "_values", "_fields")
+
+    def __init__(self, layout: FieldLayout, values: Iterable[Field]):
+        values = list(values)
+        if len(values) != len(layout.names):
+            raise ValueError(f"expected {len(layout.names)} values for {layout!r}, got {len(values)}")
+        self._layout = layout
+        self._values: list[Field] = values
+        self._fields: Optional[dict[str, Field]] = None
+        """The private copy of the fields, once a field has been added or removed."""
+
+    @classmethod
+    def from_dict(cls, fields: dict[str, Field], layout: Optional[FieldLayout] = None) -> "RecordFields":
+        """Share layout if it has the same names as fields (in the same order), otherwise create one."""
+        if layout is None or layout.names != tuple(fields):
+            layout = FieldLayout(fields)
+        return cls(layout, fields.values())
+
+    @property
+    def layout(self) -> Optional[FieldLayout]:
+        """The shared layout, or None once a field has been added or removed."""
+        return self._layout if self._fields is None else None
+
+    def _detach(self) -> dict[str, Field]:
+        if self._fields is None:
+            self._fields = dict(zip(self._layout.names, self._values))
+            self._values = []
+        return self._fields
+
+    def __getitem__(self, key: str) -> Field:
+        if self._fields is not None:
+            return self._fields[key]
+        return self._values[self._layout.index[key]]
+
+    def __setitem__(self, key: str, value: Field):
+        if self._fields is None:
+            i = self._layout.index.get(key)
+            if i is not None:
+                self._values[i] = value
+                return
+        self._detach()[key] = value
+
+    def __delitem__(self, key: str):
+        del self._detach()[key]
+
+    def __contains__(self, key: Any) -> bool:
+        if self._fields is not None:
+            return key in self._fields
+        return key in self._layout.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout.names if self._fields is None else self._fields)
+
+    def __len__(self) -> int:
+        return len(self._values if self._fields is None else self._fields)
+
+    def __repr__(self) -> str:
+        return f"RecordFields({dict(self)!r})"
+
+    def to_dict(self) -> dict[str, Field]:
+        if self._fields is not None:
+            return dict(self._fields)
+        return dict(zip(self._layout.names, self._values))
+
+    def check(self) -> Optional[ValidationIssue]:
+        """The equivalent of the dict[str, Field] rule of Record.fields, without raising."""
+        if self._fields is not None:
+            failure = _check_fields_dict(self._fields)
+            return None if failure is None else ValidationIssue(failure[0], "fields", failure[1])
+
+        for value in self._values:
+            if not isinstance(value, _FIELD_TYPES):
+                return ValidationIssue(IssueCode.DICT_VALUES, "fields", Field)
+        return None
+
+
+@dataclass(kw_only=True, slots=True)
+@validated(
+    FieldRule("primary_key", str, required=True),
+    FieldRule("fields", RecordFields, required=True),
+    FieldRule("references", dict[str, str]),
+    FieldRule("checkpoint", Checkpoint),
+    FieldRule("drop", bool),
+)
+class CompactRecord(Validated):
+    """
+    A low-memory companion of Record for holding large batches between "prepare_query" and "process_records". It has no
+    per-instance __dict__, and its fields are a RecordFields mapping over values stored against a FieldLayout shared by
+    the batch, rather than a dict repeating every key. Since fields is still a mapping, code reading or updating
+    record.fields works unchanged. See compact_records and to_records to convert a batch.
+    """
+
+    primary_key: str
+    """See Record.primary_key."""
+
+    fields: RecordFields
+    """See Record.fields."""
+
+    references: Optional[dict[str, str]] = None
+    """See Record.references."""
+
+    checkpoint: Optional[Checkpoint] = None
+    """See Record.checkpoint."""
+
+    drop: Optional[bool] = None
+    """See Record.drop."""
+
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "primary_key", str, required=True)
-        check_field(self, "fields", dict[str, Field], required=True)
-        check_field(self, "references", dict[str, str])
-        check_field(self, "checkpoint", Checkpoint)
-        check_field(self, "drop", bool)
+        issue = self.fields.check()
+        if issue is not None:
+            raise issue.error()
+
+    @classmethod
+    def from_record(cls, record: Record, layout: Optional[FieldLayout] = None) -> "CompactRecord":
+        """Convert a Record, sharing layout when it matches."""
+        return cls(
+            primary_key=record.primary_key,
+            fields=RecordFields.from_dict(record.fields, layout),
+            references=record.references,
+            checkpoint=record.checkpoint,
+            drop=record.drop,
+        )
+
+    def to_record(self) -> Record:
+        return Record(
+            primary_key=self.primary_key,
+            fields=self.fields.to_dict(),
+            references=self.references,
+            checkpoint=self.checkpoint,
+            drop=self.drop,
+        )
+
+
+def compact_records(records: Iterable[Record]) -> list[CompactRecord]:
+    """Convert a batch of Records, sharing one FieldLayout between all the records with the same field names."""
+    layouts: dict[tuple[str, ...], FieldLayout] = {}
+    compacted = []
+    for record in records:
+        names = tuple(record.fields)
+        layout = layouts.get(names)
+        if layout is None:
+            layout = layouts[names] = FieldLayout(names)
+        compacted.append(CompactRecord.from_record(record, layout))
+    return compacted
+
+
+def to_records(records: Iterable[CompactRecord]) -> list[Record]:
+    return [record.to_record() for record in records]
@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Mapping, Optional, Sequence
+
+from flux_sdk.etl.data_models.record import Checkpoint, Field, Record
+from flux_sdk.etl.data_models.schema import Schema
+from flux_sdk.flux_core.validation import FieldRule, Validated, trusted_construction, validated
+
+
+@dataclass(kw_only=True)
+@validated(
+    FieldRule("primary_keys", list[str]),
+    FieldRule("columns", dict[str, list]),
+    FieldRule("references", dict[str, list]),
+    FieldRule("checkpoints", list),
+    FieldRule("drop", list),
+    FieldRule("missing", dict[str, list]),
+)
+class RecordBatch(Validated):
+    """
+    A columnar equivalent of a batch of Records, with one list of values per field rather than one dict per row, so that
+    transforms can work a column at a time (eg: in the "process_record_batch" hook). Every list has one value per row,
+    in the same order as primary_keys.
+    """
+
+    primary_keys: list[str]
+    """See Record.primary_key, one per row."""
+
+    columns: dict[str, list[Field]]
+    """
+    The values of each field (see Record.fields), keyed by field name. A field which is missing from the fields of a
+    Record is None in its column, see missing.
+    """
+
+    references: Optional[dict[str, list[Optional[str]]]] = None
+    """See Record.references, one column per reference field. None means the Record has no link for that field."""
+
+    checkpoints: Optional[list[Optional[Checkpoint]]] = None
+    """See Record.checkpoint, one per row."""
+
+    drop: Optional[list[Optional[bool]]] = None
+    """The drop mask, see Record.drop."""
+
+    missing: Optional[dict[str, list[bool]]] = None
+    """
+    For the columns of fields which are missing from the fields of some Records, whether each row is missing the field.
+    A missing field stays missing in to_records unless a value other than None was set in its column, so that a field
+    which was absent is not sent as an explicit None.
+    """
+
+    def __post_init__(self):
+        """Perform validation."""
+        rows = len(self.primary_keys)
+        columns = dict(self.columns)
+        columns.update(self.references or {})
+        columns.update({f"missing.{name}": mask for name, mask in (self.missing or {}).items()})
+        columns.update(checkpoints=self.checkpoints or [None] * rows, drop=self.drop or [None] * rows)
+        for name, column in columns.items():
+            if len(column) != rows:
+                raise ValueError(f"{name} has {len(column)} values, expected {rows}")
+
+    def __len__(self) -> int:
+        return len(self.primary_keys)
+
+    @classmethod
+    def from_records(cls, records: Sequence[Record], schema: Optional[Schema] = None) -> "RecordBatch":
+        """
+        Transpose records into columns. With a schema, there is one column per SchemaField (in the order of the schema)
+        followed by any other field found in the records, otherwise the columns are in the order they are first found.
+        """
+        names = dict.fromkeys(field.name for field in schema.fields) if schema is not None else {}
+        reference_names = {}
+        for record in records:
+            names.update(dict.fromkeys(record.fields))
+            if record.references:
+                reference_names.update(dict.fromkeys(record.references))
+
+        columns, missing = _transpose([record.fields for record in records], list(names))
+        references = None
+        if reference_names:
+            references, _ = _transpose([record.references or {} for record in records], list(reference_names))
+
+        checkpoints = [record.checkpoint for record in records]
+        drop = [record.drop for record in records]
+        return cls.from_trusted(
+            primary_keys=[record.primary_key for record in records],
+            columns=columns,
+            references=references,
+            checkpoints=checkpoints if any(c is not None for c in checkpoints) else None,
+            drop=drop if any(d is not None for d in drop) else None,
+            missing=missing or None,
+        )
+
+    def to_records(self, trusted: bool = False) -> list[Record]:
+        """
+        Transpose the columns back into Records, which are validated unless trusted is set (eg: when this batch was
+        built by from_records and only modified with values of the right types).
+        """
+        rows = len(self.primary_keys)
+        names = list(self.columns)
+        if names:
+            fields = [dict(zip(names, values)) for values in zip(*self.columns.values())]
+        else:
+            fields = [{} for _ in range(rows)]
+        for name, mask in (self.missing or {}).items():
+            for row_fields, absent in zip(fields, mask):
+                if absent and row_fields.get(name) is None:
+                    row_fields.pop(name, None)
+        references = self._reference_rows(rows)
+        checkpoints = self.checkpoints or [None] * rows
+        drop = self.drop or [None] * rows
+
+        def build():
+            return [
+                Record(
+                    primary_key=primary_key,
+                    fields=row_fields,
+                    references=row_references,
+                    checkpoint=checkpoint,
+                    drop=row_drop,
+                )
+                for primary_key, row_fields, row_references, checkpoint, row_drop in zip(
+                    self.primary_keys, fields, references, checkpoints, drop
+                )
+            ]
+
+        if trusted:
+            with trusted_construction():
+                return build()
+        return build()
+
+    def _reference_rows(self, rows: int) -> list[Optional[dict[str, str]]]:
+        if not self.references:
+            return [None] * rows
+
+        names = list(self.references)
+        result = []
+        for values in zip(*self.references.values()):
+            links = {name: value for name, value in zip(names, values) if value is not None}
+            result.append(links or None)
+        return result
+
+
+def _transpose(rows: Sequence[Mapping[str, Any]], names: list[str]) -> tuple[dict[str, list], dict[str, list[bool]]]:
+    """The column of each name, and the mask of the rows missing it for the names which are missing from some rows."""
+    if not names:
+        return {}, {}
+
+    try:
+        # the common case, where every row has every field, transposes without a lookup per value
+        getter = itemgetter(*names)
+        values = [getter(row) for row in rows]
+        if len(names) == 1:
+            return {names[0]: values}, {}
+        columns = list(zip(*values)) if values else [()] * len(names)
+        return {name: list(column) for name, column in zip(names, columns)}, {}
+    except KeyError:
+        missing = {}
+        for name in names:
+            mask = [name not in row for row in rows]
+            if any(mask):
+                missing[name] = mask
+        return {name: [row.get(name) for row in rows] for name in names}, missing
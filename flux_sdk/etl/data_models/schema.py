@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Union
 
-from flux_sdk.flux_core.validation import check_field
+from flux_sdk.flux_core.validation import FieldRule, Validated, validated
 
 
 class SchemaDataType(Enum):
@@ -24,7 +24,16 @@ class SchemaDataType(Enum):
 
 
 @dataclass(kw_only=True)
-class SchemaField:
+@validated(
+    FieldRule("name", str, required=True),
+    FieldRule("data_type", SchemaDataType, required=True),
+    FieldRule("description", str),
+    FieldRule("enum_values", list),
+    FieldRule("is_required", bool),
+    FieldRule("is_unique", bool),
+    FieldRule("enum_restricted", bool),
+)
+class SchemaField(Validated):
     """A field usually corresponds to a column in a database, it is one datum within a Record."""
 
     name: str
@@ -53,21 +62,18 @@ class SchemaField:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "name", str, required=True)
-        check_field(self, "data_type", SchemaDataType, required=True)
-        check_field(self, "description", str)
-        check_field(self, "enum_values", list)
-        check_field(self, "is_required", bool)
-        check_field(self, "is_unique", bool)
-        check_field(self, "enum_restricted", bool)
-
         if self.data_type in [SchemaDataType.Enum, SchemaDataType.MultiEnum]:
             if len(self.enum_values) == 0:
                 raise ValueError("enum_values must have at least 1 value")
 
 
 @dataclass(kw_only=True)
-class CustomObjectReference:
+@validated(
+    FieldRule("object", str, required=True),
+    FieldRule("lookup", str, required=True),
+    FieldRule("description", str),
+)
+class CustomObjectReference(Validated):
     """This allows creating a reference to an existing Custom Object."""
 
     object: str
@@ -79,12 +85,6 @@ class CustomObjectReference:
     description: Optional[str] = None
     """An optional explanation for this reference to be shown in the Rippling Custom Object UI."""
 
-    def __post_init__(self):
-        """Perform validation."""
-        check_field(self, "object", str, required=True)
-        check_field(self, "lookup", str, required=True)
-        check_field(self, "description", str)
-
 
 class EmployeeLookup(Enum):
     """These are the available lookup-fields for a Rippling Employee."""
@@ -100,7 +100,11 @@ class EmployeeLookup(Enum):
 
 
 @dataclass(kw_only=True)
-class EmployeeReference:
+@validated(
+    FieldRule("lookup", EmployeeLookup, required=True),
+    FieldRule("description", str),
+)
+class EmployeeReference(Validated):
     """This allows creating a reference to a Rippling employee."""
 
     lookup: EmployeeLookup
@@ -109,18 +113,26 @@ class EmployeeReference:
     description: Optional[str] = None
     """An optional explanation for this reference to be shown in the Rippling Custom Object UI."""
 
-    def __post_init__(self):
-        """Perform validation."""
-        check_field(self, "lookup", EmployeeLookup, required=True)
-        check_field(self, "description", str)
-
 
 Reference = Union[CustomObjectReference, EmployeeReference]
 """This lists the available types that can be used for schema references."""
 
 
 @dataclass(kw_only=True)
-class Schema:
+@validated(
+    FieldRule("name", str, required=True),
+    FieldRule("category_name", str, required=True),
+    FieldRule("category_description", str, required=True),
+    FieldRule("primary_key_field", str, required=True),
+    FieldRule("name_field", str, required=True),
+    FieldRule("fields", list[SchemaField]),
+    FieldRule("description", str),
+    FieldRule("created_date_field", str),
+    FieldRule("last_modified_date_field", str),
+    FieldRule("references", dict[str, Reference]),
+    FieldRule("owner", tuple[str, EmployeeReference]),
+)
+class Schema(Validated):
     """A schema describes the shape of an object being imported and is used by Rippling to define the Custom Object."""
 
     name: str
@@ -170,17 +182,3 @@ class Schema:
 
     owner: Optional[tuple[str, EmployeeReference]] = None
     """This establishes the built-in link to Employee, if applicable."""
-
-    def __post_init__(self):
-        """Perform validation."""
-        check_field(self, "name", str, required=True)
-        check_field(self, "category_name", str, required=True)
-        check_field(self, "category_description", str, required=True)
-        check_field(self, "primary_key_field", str, required=True)
-        check_field(self, "name_field", str, required=True)
-        check_field(self, "fields", list[SchemaField])
-        check_field(self, "description", str)
-        check_field(self, "created_date_field", str)
-        check_field(self, "last_modified_date_field", str)
-        check_field(self, "references", dict[str, Reference])
-        check_field(self, "owner", tuple[str, EmployeeReference])
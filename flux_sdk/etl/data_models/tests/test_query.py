@@ -1,7 +1,8 @@
+import sqlite3
 import unittest
 from datetime import datetime
 
-from flux_sdk.etl.data_models.query import MongoQuery, SQLQuery
+from flux_sdk.etl.data_models.query import MongoQuery, SQLQuery, SQLTemplate, sql_template
 
 
 class TestSQLQuery(unittest.TestCase):
@@ -33,6 +34,62 @@ class TestSQLQuery(unittest.TestCase):
             args={"id": "record_1"},
         )
 
+    def test_validate_args_match_text(self):
+        for text, args in [
+            ("select column from table where id = @id", {}),
+            ("select column from table where id = @id", {"id": "record_1", "other": 1}),
+            ("select column from table", {"id": "record_1"}),
+            ("select column from table where id = '@id'", {"id": "record_1"}),
+        ]:
+            with self.subTest(text=text, args=args), self.assertRaises(ValueError):
+                SQLQuery(text=text, args=args)
+
+        # the text is not checked without args
+        SQLQuery(text="select column from table where id = @id")
+
+
+class TestSQLTemplate(unittest.TestCase):
+    def test_parse(self):
+        template = SQLTemplate(
+            "SELECT '@skipped', \"@skipped\", @@version -- @skipped\n"
+            "FROM t /* @skipped */ WHERE a > @low AND b < @high AND c = @low"
+        )
+        self.assertEqual(template.names, ("low", "high", "low"))
+        self.assertEqual(template.variables, {"low", "high"})
+
+    def test_render(self):
+        template = SQLTemplate("SELECT * FROM t WHERE name LIKE 'a%' AND a > @low AND b < @high AND c = @low")
+        self.assertEqual(template.render("qmark"), "SELECT * FROM t WHERE name LIKE 'a%' AND a > ? AND b < ? AND c = ?")
+        self.assertEqual(
+            template.render("format"), "SELECT * FROM t WHERE name LIKE 'a%%' AND a > %s AND b < %s AND c = %s"
+        )
+        self.assertEqual(
+            template.render("named"), "SELECT * FROM t WHERE name LIKE 'a%' AND a > :low AND b < :high AND c = :low"
+        )
+        self.assertEqual(
+            template.render("pyformat"),
+            "SELECT * FROM t WHERE name LIKE 'a%%' AND a > %(low)s AND b < %(high)s AND c = %(low)s",
+        )
+        with self.assertRaises(ValueError):
+            template.render("numeric")
+
+    def test_bind(self):
+        query = SQLQuery(text="SELECT @a, @b, @a", args={"a": 1, "b": "two"})
+        self.assertEqual(query.bind("qmark"), ("SELECT ?, ?, ?", [1, "two", 1]))
+        self.assertEqual(query.bind("named"), ("SELECT :a, :b, :a", {"a": 1, "b": "two"}))
+        self.assertEqual(SQLQuery(text="SELECT 1").bind("format"), ("SELECT 1", []))
+
+        connection = sqlite3.connect(":memory:")
+        for style in ("qmark", "named"):
+            self.assertEqual(connection.execute(*query.bind(style)).fetchall(), [(1, "two", 1)])
+
+        with self.assertRaises(ValueError):
+            sql_template("SELECT @a").bind({}, "qmark")
+
+    def test_cache(self):
+        self.assertIs(sql_template("SELECT @cached"), sql_template("SELECT @cached"))
+        self.assertIsNot(sql_template("SELECT @cached"), sql_template("SELECT @cached "))
+
 
 class TestMongoQuery(unittest.TestCase):
     def test_validate_empty(self):
@@ -1,7 +1,17 @@
 import unittest
-from datetime import datetime
+from datetime import datetime, timezone
 
-from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.data_models.record import (
+    CheckpointTracker,
+    CompactRecord,
+    FieldLayout,
+    Record,
+    RecordFields,
+    checkpoint_greater,
+    compact_records,
+    drop_invalid_records,
+    to_records,
+)
 
 
 class TestRecord(unittest.TestCase):
@@ -55,6 +65,128 @@ class TestRecord(unittest.TestCase):
             drop=False,
         )
 
+    def test_from_trusted_skips_validation(self):
+        record = Record.from_trusted(primary_key="record_1", fields={"foo": ("bar",)})
+        self.assertEqual(record.fields, {"foo": ("bar",)})
+
+        with self.assertRaises(TypeError):
+            record.validate()
+
+    def test_drop_invalid_records(self):
+        records = [Record(primary_key=f"record_{i}", fields={"i": i}) for i in range(4)]
+        records[1].fields["i"] = ("not", "a", "field")
+        records[3].primary_key = None
+
+        report = drop_invalid_records(records)
+        self.assertEqual(report.invalid_rows, [1, 3])
+        self.assertEqual([r.drop for r in records], [None, True, None, True])
+
+
+class TestCompactRecord(unittest.TestCase):
+    def test_round_trip(self):
+        records = [
+            Record(primary_key=f"record_{i}", fields={"a": i, "b": str(i)}, checkpoint=i, drop=False) for i in range(3)
+        ]
+        records.append(Record(primary_key="other", fields={"c": None}))
+
+        compacted = compact_records(records)
+        self.assertFalse(hasattr(compacted[0], "__dict__"))
+        self.assertIs(compacted[0].fields.layout, compacted[2].fields.layout)
+        self.assertIsNot(compacted[0].fields.layout, compacted[3].fields.layout)
+        self.assertEqual(to_records(compacted), records)
+
+    def test_fields_mapping(self):
+        layout = FieldLayout(["a", "b"])
+        fields = RecordFields(layout, [1, "two"])
+
+        self.assertEqual(fields, {"a": 1, "b": "two"})
+        self.assertEqual(list(fields.items()), [("a", 1), ("b", "two")])
+        self.assertIn("a", fields)
+        self.assertNotIn("c", fields)
+        self.assertEqual(fields.get("c", 3), 3)
+
+        fields["a"] = 10
+        self.assertIs(fields.layout, layout)
+        self.assertEqual(fields["a"], 10)
+
+        fields["c"] = 3
+        self.assertIsNone(fields.layout)
+        self.assertEqual(layout.names, ("a", "b"))
+        del fields["b"]
+        self.assertEqual(fields.to_dict(), {"a": 10, "c": 3})
+
+    def test_validate(self):
+        layout = FieldLayout(["a"])
+        CompactRecord(primary_key="record_1", fields=RecordFields(layout, [1]))
+
+        with self.assertRaises(ValueError):
+            CompactRecord(primary_key="record_1", fields=RecordFields(FieldLayout([]), []))
+        with self.assertRaises(TypeError):
+            CompactRecord(primary_key="record_1", fields={"a": 1})
+        with self.assertRaises(TypeError):
+            CompactRecord(primary_key="record_1", fields=RecordFields(layout, [("not", "a", "field")]))
+        with self.assertRaises(TypeError):
+            FieldLayout([1])
+        with self.assertRaises(ValueError):
+            FieldLayout(["a", "a"])
+        with self.assertRaises(ValueError):
+            RecordFields(layout, [1, 2])
+
+        record = CompactRecord(primary_key="record_1", fields=RecordFields(layout, [1]))
+        record.fields["b"] = ("not", "a", "field")
+        with self.assertRaises(TypeError):
+            record.validate()
+
+
+class TestCheckpointTracker(unittest.TestCase):
+    def test_update(self):
+        tracker = CheckpointTracker()
+        self.assertIsNone(tracker.highest)
+
+        tracker.update([Record(primary_key=str(i), fields={"i": i}, checkpoint=i % 7) for i in range(1, 20)])
+        tracker.update([Record(primary_key="none", fields={"x": 1})])
+        tracker.add(None)
+        self.assertEqual(tracker.highest, 6)
+        self.assertEqual(tracker.count, 19)
+
+    def test_mixed_types(self):
+        for first, second in [
+            (1, "2"),
+            ("a", datetime.now()),
+            (datetime.now(), datetime.now(timezone.utc)),
+        ]:
+            tracker = CheckpointTracker()
+            tracker.add(first)
+            with self.subTest(first=first, second=second), self.assertRaises(TypeError):
+                tracker.add(second)
+
+        with self.assertRaises(TypeError):
+            CheckpointTracker().add(True)
+
+    def test_merge(self):
+        shards = [CheckpointTracker() for _ in range(3)]
+        shards[0].add("2024-01-03")
+        shards[2].add("2024-01-05")
+        shards[2].add("2024-01-04")
+
+        merged = CheckpointTracker()
+        for shard in shards:
+            merged.merge(shard)
+        self.assertEqual(merged.highest, "2024-01-05")
+        self.assertEqual(merged.count, 3)
+
+        other = CheckpointTracker()
+        other.add(5)
+        with self.assertRaises(TypeError):
+            merged.merge(other)
+
+    def test_checkpoint_greater(self):
+        self.assertTrue(checkpoint_greater(2, 1))
+        self.assertFalse(checkpoint_greater("2024-01-01", "2024-01-02"))
+        self.assertTrue(checkpoint_greater(datetime(2024, 1, 2), datetime(2024, 1, 1)))
+        with self.assertRaises(TypeError):
+            checkpoint_greater(2, "1")
+
 
 if __name__ == '__main__':
     unittest.main()
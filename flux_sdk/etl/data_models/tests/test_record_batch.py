@@ -0,0 +1,97 @@
+import unittest
+from datetime import datetime
+
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.data_models.record_batch import RecordBatch
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType, SchemaField
+
+
+class TestRecordBatch(unittest.TestCase):
+    def test_validate_lengths(self):
+        RecordBatch(primary_keys=["a", "b"], columns={"x": [1, 2]}, checkpoints=[1, 2], drop=[False, True])
+
+        with self.assertRaises(ValueError):
+            RecordBatch(primary_keys=["a", "b"], columns={"x": [1]})
+        with self.assertRaises(ValueError):
+            RecordBatch(primary_keys=["a"], columns={"x": [1]}, references={"y": []})
+        with self.assertRaises(ValueError):
+            RecordBatch(primary_keys=["a"], columns={"x": [1]}, drop=[True, False])
+        with self.assertRaises(TypeError):
+            RecordBatch(primary_keys=[1], columns={"x": [1]})
+
+    def test_round_trip(self):
+        records = [
+            Record(
+                primary_key=f"record_{i}",
+                fields={"id": f"record_{i}", "amount": i * 1.5, "created": datetime(2024, 1, i + 1)},
+                references={"customer_id": f"customer_{i}"} if i % 2 else None,
+                checkpoint=i,
+                drop=i == 2 or None,
+            )
+            for i in range(4)
+        ]
+
+        batch = RecordBatch.from_records(records)
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(batch.columns["amount"], [0.0, 1.5, 3.0, 4.5])
+        self.assertEqual(batch.references, {"customer_id": [None, "customer_1", None, "customer_3"]})
+        self.assertEqual(batch.checkpoints, [0, 1, 2, 3])
+        self.assertEqual(batch.drop, [None, None, True, None])
+        self.assertEqual(batch.to_records(), records)
+        self.assertEqual(batch.to_records(trusted=True), records)
+
+    def test_schema_columns(self):
+        schema = Schema(
+            name="invoice",
+            category_name="Billing",
+            category_description="Billing",
+            primary_key_field="id",
+            name_field="name",
+            fields=[
+                SchemaField(name="id", data_type=SchemaDataType.String),
+                SchemaField(name="name", data_type=SchemaDataType.String),
+                SchemaField(name="total", data_type=SchemaDataType.Integer),
+            ],
+        )
+        records = [
+            Record(primary_key="1", fields={"id": "1", "name": "first"}),
+            Record(primary_key="2", fields={"id": "2", "name": "second", "total": 3, "extra": True}),
+        ]
+
+        batch = RecordBatch.from_records(records, schema)
+        self.assertEqual(list(batch.columns), ["id", "name", "total", "extra"])
+        self.assertEqual(batch.columns["total"], [None, 3])
+        self.assertEqual(batch.columns["extra"], [None, True])
+        self.assertIsNone(batch.checkpoints)
+        self.assertIsNone(batch.drop)
+
+        self.assertEqual(batch.missing, {"total": [True, False], "extra": [True, False]})
+
+        # missing fields stay missing, unless a value was set
+        self.assertEqual(batch.to_records(), records)
+        batch.columns["total"][0] = 5
+        self.assertEqual(batch.to_records()[0].fields, {"id": "1", "name": "first", "total": 5})
+
+    def test_missing_and_none_fields(self):
+        records = [Record(primary_key="1", fields={"a": None}), Record(primary_key="2", fields={"b": 1})]
+        batch = RecordBatch.from_records(records)
+        self.assertEqual(batch.columns, {"a": [None, None], "b": [None, 1]})
+        self.assertEqual(batch.to_records(), records)
+
+        with self.assertRaises(ValueError):
+            RecordBatch(primary_keys=["1"], columns={"a": [None]}, missing={"a": [True, False]})
+
+    def test_invalid_values_fail_conversion(self):
+        batch = RecordBatch.from_records([Record(primary_key="1", fields={"x": 1})])
+        batch.columns["x"][0] = ("not", "a", "field")
+        with self.assertRaises(TypeError):
+            batch.to_records()
+
+    def test_empty(self):
+        batch = RecordBatch.from_records([])
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.to_records(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
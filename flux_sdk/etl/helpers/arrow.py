@@ -0,0 +1,290 @@
+import os
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, time
+from typing import Optional
+
+from flux_sdk.etl.data_models.record import Field, Record
+from flux_sdk.etl.data_models.record_batch import RecordBatch
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+PRIMARY_KEY_COLUMN = "flux.primary_key"
+CHECKPOINT_COLUMN = "flux.checkpoint"
+DROP_COLUMN = "flux.drop"
+REFERENCE_PREFIX = "flux.references."
+MISSING_PREFIX = "flux.missing."
+"""
+The Arrow columns for the attributes of a Record other than its fields, which are one column per field name. The
+references have their own columns since their names are usually field names too (eg: "customer_id"), and so do the
+masks of the fields missing from some Records (see RecordBatch.missing).
+"""
+
+DATA_TYPE_METADATA = b"flux.data_type"
+"""The key of the Arrow field metadata holding the SchemaDataType of a column."""
+
+MIXED_METADATA = b"flux.mixed"
+"""
+The key of the Arrow field metadata marking a column whose values have several types (eg: 1 and "a", or naive and aware
+datetimes), which is stored as a struct with one child per type, of which each row sets at most one.
+"""
+
+_MIXED_TYPES = (
+    ("bool", bool),
+    ("int", int),
+    ("float", float),
+    ("str", str),
+    ("datetime", datetime),
+    ("date", date),
+    ("time", time),
+)
+
+_DECIMAL_TYPES = frozenset(
+    data_type.value.encode() for data_type in (SchemaDataType.Currency, SchemaDataType.Decimal, SchemaDataType.Percent)
+)
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for the Arrow and Parquet converters (pip install 'rippling-flux-sdk[arrow]')"
+        )
+
+
+def arrow_type(data_type: SchemaDataType) -> "pa.DataType":
+    """
+    The Arrow type for the values of a SchemaDataType. Currency, Decimal and Percent values are stored as their exact
+    string representation (see coercion), and DateTime values as UTC timestamps, naive ones being assumed to be UTC.
+    """
+    _require_pyarrow()
+    if data_type == SchemaDataType.Bool:
+        return pa.bool_()
+    if data_type == SchemaDataType.Integer:
+        return pa.int64()
+    if data_type == SchemaDataType.Date:
+        return pa.date32()
+    if data_type == SchemaDataType.DateTime:
+        return pa.timestamp("us", tz="UTC")
+    if data_type == SchemaDataType.Time:
+        return pa.time64("us")
+    return pa.string()
+
+
+def arrow_schema(schema: Schema) -> "pa.Schema":
+    """
+    The Arrow schema of the fields of schema, with one nullable column per SchemaField. The SchemaDataType of each
+    column is kept in its metadata, since several of them share an Arrow type.
+    """
+    _require_pyarrow()
+    return pa.schema(
+        pa.field(field.name, arrow_type(field.data_type), metadata={DATA_TYPE_METADATA: field.data_type.value})
+        for field in schema.fields
+    )
+
+
+def _decimal_text(value: Field) -> Optional[str]:
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def _mixed_type(value: Field) -> str:
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        # stored in UTC, like the values of DateTime fields
+        return "aware_datetime"
+    for name, cls in _MIXED_TYPES:
+        if isinstance(value, cls):
+            return name
+    raise TypeError(f"{type(value).__name__} values can not be converted to Arrow")
+
+
+def _mixed_child(name: str) -> "pa.DataType":
+    return {
+        "bool": pa.bool_(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "str": pa.string(),
+        "datetime": pa.timestamp("us"),
+        "aware_datetime": pa.timestamp("us", tz="UTC"),
+        "date": pa.date32(),
+        "time": pa.time64("us"),
+    }[name]
+
+
+def _inferred(name: str, values: list) -> tuple["pa.Field", "pa.Array"]:
+    types = {type(value) for value in values if value is not None}
+    if len(types) == 1 and datetime in types:
+        mixed = len({value.tzinfo is None for value in values if isinstance(value, datetime)}) > 1
+    else:
+        # Arrow would refuse most mixes, but silently convert some of them (eg: 1 to 1.0 with 2.5)
+        mixed = len(types) > 1
+    if not mixed:
+        array = pa.array(values)
+        return pa.field(name, array.type), array
+
+    rows = [None if value is None else {_mixed_type(value): value} for value in values]
+    children = dict.fromkeys(child for row in rows if row is not None for child in row)
+    array = pa.array(rows, type=pa.struct([pa.field(child, _mixed_child(child)) for child in children]))
+    return pa.field(name, array.type, metadata={MIXED_METADATA: b"true"}), array
+
+
+def _unmixed(rows: list) -> list:
+    return [None if row is None else next((value for value in row.values() if value is not None), None) for row in rows]
+
+
+def _column(name: str, values: list, field: Optional["pa.Field"]) -> tuple["pa.Field", "pa.Array"]:
+    if field is None:
+        # a field which is not in the schema, its type is inferred from the values
+        return _inferred(name, values)
+    if field.metadata and field.metadata.get(DATA_TYPE_METADATA) in _DECIMAL_TYPES:
+        return field, pa.array([_decimal_text(value) for value in values], type=field.type)
+    return field, pa.array(values, type=field.type)
+
+
+def to_arrow(records: Sequence[Record], schema: Optional[Schema] = None) -> "pa.Table":
+    """
+    Convert records into an Arrow table, which can cross process boundaries without copying or be spooled to disk (see
+    ParquetSpool). With a schema, the columns of its SchemaFields have the types of arrow_schema, and the types of the
+    other fields are inferred from their values, which should conform to the schema (see ConformanceChecker). Columns
+    (and checkpoints) whose values have several types are stored as a struct, see MIXED_METADATA.
+
+    The columns of a schema have one Arrow type each, so a few values are converted and come back from from_arrow
+    with another type:
+
+    - the int and float values of Currency, Decimal and Percent fields are stored as their str (eg: 10.5 is "10.5");
+    - naive datetime values of DateTime fields are assumed to be UTC, and come back as aware UTC datetimes.
+
+    Aware datetimes are stored in UTC, and come back in UTC. The fields missing from some Records are stored as masks,
+    so they are still missing from the Records of from_arrow rather than None.
+    """
+    _require_pyarrow()
+    batch = RecordBatch.from_records(records, schema)
+    if any(name.startswith("flux.") for name in batch.columns):
+        raise ValueError("field names starting with 'flux.' are reserved")
+
+    typed = {field.name: field for field in arrow_schema(schema)} if schema is not None else {}
+    fields = [pa.field(PRIMARY_KEY_COLUMN, pa.string(), nullable=False)]
+    arrays = [pa.array(batch.primary_keys, type=pa.string())]
+
+    for name, values in batch.columns.items():
+        field, array = _column(name, values, typed.get(name))
+        fields.append(field)
+        arrays.append(array)
+
+    for name, ids in (batch.references or {}).items():
+        fields.append(pa.field(REFERENCE_PREFIX + name, pa.string()))
+        arrays.append(pa.array(ids, type=pa.string()))
+
+    for name, mask in (batch.missing or {}).items():
+        fields.append(pa.field(MISSING_PREFIX + name, pa.bool_(), nullable=False))
+        arrays.append(pa.array(mask, type=pa.bool_()))
+
+    if batch.checkpoints is not None:
+        field, array = _inferred(CHECKPOINT_COLUMN, batch.checkpoints)
+        fields.append(field)
+        arrays.append(array)
+    if batch.drop is not None:
+        fields.append(pa.field(DROP_COLUMN, pa.bool_()))
+        arrays.append(pa.array(batch.drop, type=pa.bool_()))
+
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def from_arrow(table: "pa.Table", trusted: bool = False) -> list[Record]:
+    """
+    Convert an Arrow table built by to_arrow back into Records, which are validated unless trusted is set. The values
+    have the types of their Arrow columns, so the values converted by to_arrow are not restored: numbers of Currency,
+    Decimal and Percent fields are str, and datetime values of DateTime fields are aware UTC datetimes.
+    """
+    _require_pyarrow()
+    columns = {}
+    references = {}
+    missing = {}
+    checkpoints = drop = None
+    for field in table.schema:
+        name = field.name
+        if name == PRIMARY_KEY_COLUMN:
+            continue
+        values = table.column(name).to_pylist()
+        if field.metadata and MIXED_METADATA in field.metadata:
+            values = _unmixed(values)
+
+        if name == CHECKPOINT_COLUMN:
+            checkpoints = values
+        elif name == DROP_COLUMN:
+            drop = values
+        elif name.startswith(REFERENCE_PREFIX):
+            references[name[len(REFERENCE_PREFIX) :]] = values
+        elif name.startswith(MISSING_PREFIX):
+            missing[name[len(MISSING_PREFIX) :]] = values
+        else:
+            columns[name] = values
+
+    batch = RecordBatch(
+        primary_keys=table.column(PRIMARY_KEY_COLUMN).to_pylist(),
+        columns=columns,
+        references=references or None,
+        checkpoints=checkpoints,
+        drop=drop,
+        missing=missing or None,
+    )
+    return batch.to_records(trusted=trusted)
+
+
+def write_parquet(records: Sequence[Record], path: str, schema: Optional[Schema] = None):
+    """Write records to a Parquet file, see to_arrow."""
+    _require_pyarrow()
+    pq.write_table(to_arrow(records, schema), path)
+
+
+def read_parquet(path: str, trusted: bool = False) -> list[Record]:
+    """Read the Records of a Parquet file written by write_parquet, see from_arrow."""
+    _require_pyarrow()
+    return from_arrow(pq.read_table(path), trusted=trusted)
+
+
+class ParquetSpool:
+    """
+    Spools batches of Records to Parquet files in a local directory, eg: to checkpoint the extracted batches of a long
+    sync so that they can be processed or loaded again without extracting them again. Each batch is its own file, so
+    batches can have different fields, and they are read back in the order they were written.
+    """
+
+    def __init__(self, directory: str, schema: Optional[Schema] = None):
+        """
+        :param directory: The directory of the files, which is created if it does not exist. Batches which are already
+        in it (eg: spooled before a crash) are kept, and new batches are written after them.
+        :param schema: The schema of the Records, for the types of the columns (see to_arrow).
+        """
+        _require_pyarrow()
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.schema = schema
+
+    @property
+    def paths(self) -> list[str]:
+        """The files of the spooled batches, in order."""
+        names = os.listdir(self.directory)
+        return [
+            os.path.join(self.directory, name)
+            for name in sorted(names)
+            if name.startswith("batch-") and name.endswith(".parquet")
+        ]
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def write(self, records: Sequence[Record]) -> str:
+        """Spool a batch of Records, returning the path of its file."""
+        path = os.path.join(self.directory, f"batch-{len(self):08d}.parquet")
+        # written under a temporary name, so that a partial file is never read back as a batch
+        write_parquet(records, path + ".tmp", self.schema)
+        os.replace(path + ".tmp", path)
+        return path
+
+    def read(self, trusted: bool = False) -> Iterator[list[Record]]:
+        """Read the spooled batches back, one at a time."""
+        for path in self.paths:
+            yield read_parquet(path, trusted=trusted)
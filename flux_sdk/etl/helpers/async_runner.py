@@ -0,0 +1,75 @@
+import asyncio
+import inspect
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from typing import Any, Optional, Type, Union
+
+from flux_sdk.etl.capabilities.single_object_import.async_interface import AsyncSingleObjectImport
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.data_models.schema import Schema
+from flux_sdk.etl.helpers.streaming import StreamStats
+
+MAX_IN_FLIGHT = 4
+"""The default number of batches being processed at the same time."""
+
+
+async def run_async(
+    capability: Type[AsyncSingleObjectImport],
+    schema: Schema,
+    batches: Union[AsyncIterable[list[Record]], Iterable[list[Record]]],
+    load: Callable[[list[Record]], Union[Awaitable[Any], Any]],
+    max_in_flight: int = MAX_IN_FLIGHT,
+) -> StreamStats:
+    """
+    A reference runner for AsyncSingleObjectImport. Batches of extracted Records are processed concurrently, while the
+    next batch is being extracted, with at most max_in_flight batches processing at once: extraction waits for the
+    oldest batch to complete once the cap is reached. Processed batches are loaded in their original order.
+
+    batches can be an async iterable (eg: an async database cursor), or a blocking iterable, which is then read on a
+    worker thread so that it does not block the event loop. load can be a function or a coroutine function.
+
+    An error raised by extraction, processing or loading cancels the batches still in flight and is raised from here.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    stats = StreamStats()
+    in_flight: deque[asyncio.Task] = deque()
+
+    async def load_oldest():
+        records = await in_flight.popleft()
+        result = load(records)
+        if inspect.isawaitable(result):
+            await result
+        stats.add(records)
+
+    try:
+        async for batch in _aiter(batches):
+            stats.extracted += len(batch)
+            if len(in_flight) >= max_in_flight:
+                await load_oldest()
+            in_flight.append(asyncio.create_task(capability.process_records(schema, batch)))
+
+        while in_flight:
+            await load_oldest()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+    return stats
+
+
+async def _aiter(batches: Union[AsyncIterable[list[Record]], Iterable[list[Record]]]) -> AsyncIterator[list[Record]]:
+    if isinstance(batches, AsyncIterable):
+        async for batch in batches:
+            yield batch
+        return
+
+    iterator = iter(batches)
+    while (next_batch := await asyncio.to_thread(_next_batch, iterator)) is not None:
+        yield next_batch
+
+
+def _next_batch(iterator: Iterator[list[Record]]) -> Optional[list[Record]]:
+    return next(iterator, None)
@@ -0,0 +1,145 @@
+import hashlib
+import sqlite3
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, time, timezone
+from typing import Optional
+
+from flux_sdk.etl.data_models.record import Field, Record
+
+DIGEST_SIZE = 16
+"""The size in bytes of a Record digest (BLAKE2b)."""
+
+LOOKUP_CHUNK_SIZE = 500
+"""The number of primary keys per lookup query, below the SQLite limit on the number of parameters."""
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS flux_digests (primary_key TEXT PRIMARY KEY, digest BLOB NOT NULL) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS flux_pending (primary_key TEXT PRIMARY KEY, digest BLOB NOT NULL) WITHOUT ROWID",
+)
+
+
+def _encode(value: Field) -> str:
+    # every value is tagged with its type, so that eg: 1, 1.0, True and "1" have different digests
+    if value is None:
+        return "n"
+    if isinstance(value, bool):
+        return "b1" if value else "b0"
+    if isinstance(value, int):
+        return f"i{value}"
+    if isinstance(value, float):
+        return f"f{value!r}"
+    if isinstance(value, str):
+        return f"s{len(value)}:{value}"
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            # the same instant in another time zone is not a change
+            return f"z{value.astimezone(timezone.utc).isoformat()}"
+        return f"d{value.isoformat()}"
+    if isinstance(value, date):
+        return f"a{value.isoformat()}"
+    if isinstance(value, time):
+        return f"t{value.isoformat()}"
+    raise TypeError(f"field should be a {Field}, not {type(value).__name__}")
+
+
+def _encode_mapping(values: Optional[Mapping[str, Field]]) -> str:
+    if not values:
+        return "0"
+    return f"{len(values)}" + "".join(f"{len(name)}:{name}{_encode(values[name])}" for name in sorted(values))
+
+
+def record_digest(record: Record) -> bytes:
+    """
+    The digest of the content of a Record: its primary key, fields and references. It does not depend on the order of
+    the fields (or on the time zone of aware datetimes), and is stable across processes and Python versions, so it can
+    be compared with the digest stored by a previous sync. The checkpoint and drop flag are not part of the content.
+    """
+    content = "|".join(
+        (_encode(record.primary_key), _encode_mapping(record.fields), _encode_mapping(record.references))
+    )
+    return hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=DIGEST_SIZE).digest()
+
+
+class ChangeDetector:
+    """
+    Turns a full sync into an incremental one, for sources without a reliable last modified column to use as the
+    checkpoint: the Records whose content (see record_digest) is the same as in the previous sync are dropped, so only
+    new and changed Records are imported.
+
+    The digests are kept in a SQLite database at path, which must be kept between syncs. The digests of a sync are only
+    saved by commit, which should be called once every batch has been loaded, so that the Records of a sync which
+    fails are imported again by the next one:
+
+    ```python
+    with ChangeDetector("digests.sqlite") as detector:
+        for batch in batches:
+            detector.drop_unchanged(batch)
+            load(batch)
+        detector.commit()
+    ```
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: The SQLite database of the digests, which is created if it does not exist.
+        """
+        self.connection = sqlite3.connect(path)
+        for statement in _SCHEMA:
+            self.connection.execute(statement)
+        # the digests staged by a sync which did not commit are discarded
+        self.connection.execute("DELETE FROM flux_pending")
+        self.connection.commit()
+
+    def __enter__(self) -> "ChangeDetector":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def _previous(self, primary_keys: list[str]) -> dict[str, bytes]:
+        previous: dict[str, bytes] = {}
+        for start in range(0, len(primary_keys), LOOKUP_CHUNK_SIZE):
+            chunk = primary_keys[start : start + LOOKUP_CHUNK_SIZE]
+            cursor = self.connection.execute(
+                f"SELECT primary_key, digest FROM flux_digests WHERE primary_key IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            previous.update(cursor)
+        return previous
+
+    def drop_unchanged(self, records: Iterable[Record]) -> int:
+        """
+        Set drop on the Records which are unchanged since the previous sync, and stage the digests of the others for
+        commit. Records which are already dropped are left as they are, and keep their previous digest.
+
+        :return: The number of Records which were dropped.
+        """
+        digests = [(record, record_digest(record)) for record in records if not record.drop]
+        previous = self._previous(list({record.primary_key: None for record, _ in digests}))
+
+        dropped = 0
+        changed = []
+        for record, digest in digests:
+            if previous.get(record.primary_key) == digest:
+                record.drop = True
+                dropped += 1
+            else:
+                changed.append((record.primary_key, digest))
+
+        self.connection.executemany("INSERT OR REPLACE INTO flux_pending VALUES (?, ?)", changed)
+        return dropped
+
+    def commit(self):
+        """Save the digests of the new and changed Records of this sync, for the next one."""
+        self.connection.execute("INSERT OR REPLACE INTO flux_digests SELECT primary_key, digest FROM flux_pending")
+        self.connection.execute("DELETE FROM flux_pending")
+        self.connection.commit()
+
+    def rollback(self):
+        """Discard the digests staged since the last commit, so that their Records are imported again."""
+        self.connection.rollback()
+        self.connection.execute("DELETE FROM flux_pending")
+        self.connection.commit()
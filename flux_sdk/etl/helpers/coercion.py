@@ -0,0 +1,243 @@
+import uuid
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from decimal import Decimal
+from typing import Any, Optional
+
+from flux_sdk.etl.data_models.record import Checkpoint, Field, Record
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType
+from flux_sdk.flux_core.validation import trusted_construction
+
+Converter = Callable[[Any], Field]
+
+_TRUE = frozenset(["true", "t", "yes", "y", "1"])
+_FALSE = frozenset(["false", "f", "no", "n", "0"])
+
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else _str(value)
+
+
+def _str(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).decode("utf-8")
+    if isinstance(value, (list, tuple)):
+        return ",".join(map(str, value))
+    return str(value)
+
+
+def _bool(value: Any) -> Optional[bool]:
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (int, Decimal)):
+        return bool(value)
+    text = _str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError(f"{value!r} is not a boolean")
+
+
+def _integer(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = _str(value)
+    number = Decimal(value) if isinstance(value, str) else value
+    if number != int(number):
+        raise ValueError(f"{value!r} is not an integer")
+    return int(number)
+
+
+def _decimal(value: Any) -> Field:
+    # Decimal has no exact equivalent in Field, so it is kept as its exact string representation
+    if value is None or type(value) in (int, float, str):
+        return value
+    if isinstance(value, Decimal):
+        return str(value)
+    return _text(value)
+
+
+def _date(value: Any) -> Optional[date]:
+    if value is None or type(value) is date:
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(_str(value))
+
+
+def _time(value: Any) -> Optional[time]:
+    if value is None or type(value) is time:
+        return value
+    if isinstance(value, timedelta):
+        # eg: MySQL TIME columns
+        return (datetime.min + value).time()
+    if isinstance(value, datetime):
+        return value.timetz()
+    return time.fromisoformat(_str(value))
+
+
+def _datetime(naive_timezone: tzinfo) -> Callable[[Any], Optional[datetime]]:
+    def convert(value: Any) -> Optional[datetime]:
+        if value is None:
+            return None
+        if not isinstance(value, datetime):
+            if isinstance(value, date):
+                value = datetime(value.year, value.month, value.day)
+            else:
+                value = datetime.fromisoformat(_str(value))
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=naive_timezone)
+        return value
+
+    return convert
+
+
+def _generic(naive_timezone: tzinfo) -> Converter:
+    to_datetime = _datetime(naive_timezone)
+
+    def convert(value: Any) -> Field:
+        if value is None or type(value) in (str, int, float, bool, date, time):
+            return value
+        if isinstance(value, datetime):
+            return to_datetime(value)
+        if isinstance(value, (Decimal, uuid.UUID)):
+            return str(value)
+        return _text(value)
+
+    return convert
+
+
+def compile_converter(data_type: Optional[SchemaDataType], naive_timezone: tzinfo = timezone.utc) -> Converter:
+    """
+    The function converting a driver value (eg: Decimal, UUID, bytes, naive datetime) into the Field for data_type, or
+    into the closest Field for any other column when data_type is None. None is always kept as None.
+    """
+    if data_type in (SchemaDataType.Currency, SchemaDataType.Decimal, SchemaDataType.Percent):
+        return _decimal
+    if data_type == SchemaDataType.Integer:
+        return _integer
+    if data_type == SchemaDataType.Bool:
+        return _bool
+    if data_type == SchemaDataType.Date:
+        return _date
+    if data_type == SchemaDataType.DateTime:
+        return _datetime(naive_timezone)
+    if data_type == SchemaDataType.Time:
+        return _time
+    if data_type is None:
+        return _generic(naive_timezone)
+    return _text
+
+
+class RowCoercer:
+    """
+    Converts the row tuples of a database driver into Records, for a Schema and the columns selected by the query:
+
+    ```python
+    coercer = RowCoercer(schema, [column[0] for column in cursor.description])
+    records = coercer.records(cursor.fetchall())
+    ```
+
+    Everything that does not depend on the values is done once, up front: there is one converter per column (see
+    compile_converter, based on the data_type of the SchemaField with that name), and the positions of the primary key,
+    the references and the checkpoint are resolved from the schema.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        columns: Sequence[str],
+        checkpoint_field: Optional[str] = None,
+        naive_timezone: tzinfo = timezone.utc,
+        trusted: bool = False,
+    ):
+        """
+        :param schema: The schema generated in the "get_schema" hook.
+        :param columns: The names of the columns of each row, in order.
+        :param checkpoint_field: The column used for Record.checkpoint. Defaults to Schema.last_modified_date_field when
+        that column is selected.
+        :param naive_timezone: The time zone assumed for datetimes without one.
+        :param trusted: Construct the Records without validation, see Record.from_trusted.
+        """
+        self.columns = tuple(columns)
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError("columns should not have duplicate names")
+
+        data_types = {field.name: field.data_type for field in schema.fields}
+        self.converters: tuple[Converter, ...] = tuple(
+            compile_converter(data_types.get(column), naive_timezone) for column in self.columns
+        )
+
+        index = {column: i for i, column in enumerate(self.columns)}
+        if schema.primary_key_field not in index:
+            raise ValueError(f"the primary key field {schema.primary_key_field} is not one of the columns")
+        self._primary_key = index[schema.primary_key_field]
+
+        self._references = tuple((name, index[name]) for name in (schema.references or {}) if name in index)
+
+        if checkpoint_field is None and schema.last_modified_date_field in index:
+            checkpoint_field = schema.last_modified_date_field
+        if checkpoint_field is not None and checkpoint_field not in index:
+            raise ValueError(f"the checkpoint field {checkpoint_field} is not one of the columns")
+        self._checkpoint = index[checkpoint_field] if checkpoint_field is not None else None
+        self._to_checkpoint = _checkpoint(naive_timezone)
+        self.trusted = trusted
+
+    def __call__(self, row: Sequence[Any]) -> Record:
+        return self.records([row])[0]
+
+    def records(self, rows: Iterable[Sequence[Any]]) -> list[Record]:
+        if self.trusted:
+            with trusted_construction():
+                return self._records(rows)
+        return self._records(rows)
+
+    def _records(self, rows: Iterable[Sequence[Any]]) -> list[Record]:
+        columns = self.columns
+        converters = self.converters
+        primary_key = self._primary_key
+        references = self._references
+        checkpoint = self._checkpoint
+        to_checkpoint = self._to_checkpoint
+
+        records = []
+        for row in rows:
+            if len(row) != len(columns):
+                raise ValueError(f"expected {len(columns)} values per row, got {len(row)}")
+            values = [convert(value) for convert, value in zip(converters, row)]
+            key = values[primary_key]
+            if key is None:
+                raise ValueError(f"primary_key is required, got None for {columns[primary_key]}")
+            links = None
+            if references:
+                links = {name: _str(values[i]) for name, i in references if values[i] is not None} or None
+            records.append(
+                Record(
+                    primary_key=_str(key),
+                    fields=dict(zip(columns, values)),
+                    references=links,
+                    checkpoint=to_checkpoint(values[checkpoint]) if checkpoint is not None else None,
+                )
+            )
+        return records
+
+
+def _checkpoint(naive_timezone: tzinfo) -> Callable[[Field], Optional[Checkpoint]]:
+    to_datetime = _datetime(naive_timezone)
+
+    def convert(value: Field) -> Optional[Checkpoint]:
+        if value is None or isinstance(value, (str, datetime)):
+            return value
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, date):
+            return to_datetime(value)
+        return _integer(value)
+
+    return convert
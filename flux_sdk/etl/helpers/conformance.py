@@ -0,0 +1,167 @@
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from typing import Optional
+
+from flux_sdk.etl.data_models.record import Field, Record
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType, SchemaField
+from flux_sdk.flux_core.validation import FieldError, IssueCode, ValidationReport
+
+Failure = tuple[IssueCode, str]
+"""The kind of failure of a value, and why."""
+
+FieldChecker = Callable[[Field], Optional[Failure]]
+"""Checks one value of a field, returning the failure or None when it conforms."""
+
+
+def _is_number(value: Field) -> bool:
+    if isinstance(value, (int, float)):
+        return not isinstance(value, bool)
+    if isinstance(value, str):
+        # exact numbers are kept as strings, see coercion
+        try:
+            return Decimal(value).is_finite()
+        except InvalidOperation:
+            return False
+    return False
+
+
+_TYPE_CHECKS: dict[SchemaDataType, tuple[str, Callable[[Field], bool]]] = {
+    SchemaDataType.Bool: ("bool", lambda value: isinstance(value, bool)),
+    SchemaDataType.Currency: ("number", _is_number),
+    SchemaDataType.Date: ("date", lambda value: isinstance(value, date) and not isinstance(value, datetime)),
+    SchemaDataType.DateTime: ("datetime", lambda value: isinstance(value, datetime)),
+    SchemaDataType.Decimal: ("number", _is_number),
+    SchemaDataType.Integer: ("int", lambda value: isinstance(value, int) and not isinstance(value, bool)),
+    SchemaDataType.Percent: ("number", _is_number),
+    SchemaDataType.Time: ("time", lambda value: isinstance(value, time)),
+}
+_STRING_CHECK = ("str", lambda value: isinstance(value, str))
+
+
+def compile_field_checker(field: SchemaField) -> FieldChecker:
+    """
+    The function checking a value (which is not None) against the data_type of field, and against its enum_values
+    when it is enum_restricted. The values of a MultiEnum are separated by commas.
+    """
+    type_name, is_type = _TYPE_CHECKS.get(field.data_type, _STRING_CHECK)
+    type_failure = (IssueCode.TYPE, type_name)
+
+    if not field.enum_restricted or field.data_type not in (SchemaDataType.Enum, SchemaDataType.MultiEnum):
+        return lambda value: None if is_type(value) else type_failure
+
+    allowed = frozenset(field.enum_values or ())
+    enum_failure = (IssueCode.INVALID, "one of the enum_values")
+
+    if field.data_type == SchemaDataType.MultiEnum:
+
+        def check(value: Field) -> Optional[Failure]:
+            if not isinstance(value, str):
+                return type_failure
+            if any(item.strip() not in allowed for item in value.split(",")):
+                return enum_failure
+            return None
+
+    else:
+
+        def check(value: Field) -> Optional[Failure]:
+            if not is_type(value):
+                return type_failure
+            return None if value in allowed else enum_failure
+
+    return check
+
+
+_MESSAGES = {
+    IssueCode.REQUIRED: lambda attr, detail: f"{attr} is required",
+    IssueCode.TYPE: lambda attr, detail: f"{attr} should be a {detail}",
+    IssueCode.INVALID: lambda attr, detail: f"{attr} should be {detail}",
+}
+
+
+class ConformanceChecker:
+    """
+    Checks Records against the SchemaFields of a Schema, as Rippling does when they are imported, so that the Records
+    which would fail the sync can be found (and dropped) in "process_records" instead:
+
+    - the type of each value, from the data_type of its SchemaField;
+    - a value for each SchemaField which is_required (None and "" are not values);
+    - the enum_values of each Enum and MultiEnum SchemaField which is enum_restricted;
+    - distinct values for each SchemaField which is_unique.
+
+    The checker of each field is compiled once, up front, and each batch is checked in a single pass over its Records.
+    Uniqueness holds across every batch checked by the same ConformanceChecker, so one should be used per sync. Fields
+    which are not in the Schema are not checked.
+    """
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self._fields = tuple(
+            (field.name, f"fields.{field.name}", field.is_required, field.is_unique, compile_field_checker(field))
+            for field in schema.fields
+        )
+        # the primary key of the Record holding each value of the is_unique fields
+        self._seen: dict[str, dict[Field, str]] = {field.name: {} for field in schema.fields if field.is_unique}
+
+    def check(self, records: Sequence[Record]) -> ValidationReport:
+        """
+        Check a batch of Records without raising, see drop_nonconforming. Records which are already dropped are not
+        checked. The values of is_unique fields of the Records which conform are remembered for the next batches, where
+        they can only be used again by a Record with the same primary_key (eg: a Record extracted again).
+        """
+        fields = self._fields
+        seen = self._seen
+        errors: dict[tuple[str, IssueCode, str], list[int]] = {}
+
+        for row, record in enumerate(records):
+            if record.drop:
+                continue
+            values = record.fields
+            failures: list[tuple[str, IssueCode, str]] = []
+            unique = []
+            for name, attr, is_required, is_unique, check in fields:
+                value = values.get(name)
+                if value is None or value == "":
+                    if is_required:
+                        failures.append((attr, IssueCode.REQUIRED, ""))
+                    continue
+                failure = check(value)
+                if failure is not None:
+                    failures.append((attr, *failure))
+                elif is_unique:
+                    unique.append((name, attr, value))
+
+            for name, attr, value in unique:
+                if seen[name].get(value, record.primary_key) != record.primary_key:
+                    failures.append((attr, IssueCode.INVALID, "unique"))
+
+            if failures:
+                for key in failures:
+                    errors.setdefault(key, []).append(row)
+            else:
+                # only the values of conforming Records are imported, so only they can conflict with later ones
+                for name, _, value in unique:
+                    seen[name][value] = record.primary_key
+
+        return ValidationReport(
+            total=len(records),
+            errors=[
+                FieldError(attr=attr, message=_MESSAGES[code](attr, detail), code=code, rows=rows)
+                for (attr, code, detail), rows in errors.items()
+            ],
+        )
+
+    def drop_nonconforming(self, records: Sequence[Record]) -> ValidationReport:
+        """
+        Set drop on every Record which does not conform to the Schema, so that a few bad rows are skipped instead of
+        failing the whole sync. This does not raise, the returned report lists the dropped rows and why.
+        """
+        report = self.check(records)
+        for i in report.invalid_rows:
+            records[i].drop = True
+        return report
+
+
+def check_conformance(schema: Schema, records: Sequence[Record]) -> ValidationReport:
+    """Check a single batch of Records against schema, see ConformanceChecker."""
+    return ConformanceChecker(schema).check(records)
@@ -0,0 +1,216 @@
+import hashlib
+import math
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Optional
+
+from flux_sdk.etl.data_models.record import Checkpoint, Record, checkpoint_greater
+from flux_sdk.etl.helpers.change_detection import LOOKUP_CHUNK_SIZE
+
+MAX_KEYS = 1_000_000
+"""The number of primary keys kept in memory by a Deduplicator before they are spilled to disk."""
+
+
+class BloomFilter:
+    """
+    A set of strings in a fixed amount of memory, which can have false positives (at the given rate, up to capacity
+    strings) but no false negatives: when a string is not in the filter, it was never added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be at least 1 and error_rate between 0 and 1")
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str) -> Iterable[int]:
+        # double hashing, from the two halves of a single digest
+        digest = hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, value: str):
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+def _newer(checkpoint: Optional[Checkpoint], than: Optional[Checkpoint]) -> bool:
+    # Records without a checkpoint are older than any Record with one
+    return checkpoint is not None and (than is None or checkpoint_greater(checkpoint, than))
+
+
+def _encode_checkpoint(checkpoint: Optional[Checkpoint]) -> tuple[Optional[str], Optional[str]]:
+    # tagged with its type rather than pickled, so that reading the spilled keys back never runs arbitrary code
+    if checkpoint is None:
+        return None, None
+    if isinstance(checkpoint, datetime):
+        return "datetime", checkpoint.isoformat()
+    if isinstance(checkpoint, int):
+        return "int", str(int(checkpoint))
+    if isinstance(checkpoint, str):
+        return "str", checkpoint
+    raise TypeError(f"checkpoint should be a {Checkpoint}")
+
+
+def _decode_checkpoint(kind: Optional[str], value: Optional[str]) -> Optional[Checkpoint]:
+    if kind is None or value is None:
+        return None
+    if kind == "datetime":
+        return datetime.fromisoformat(value)
+    if kind == "int":
+        return int(value)
+    if kind == "str":
+        return value
+    raise ValueError(f"unknown checkpoint type {kind!r} in the spilled keys")
+
+
+class Deduplicator:
+    """
+    Collapses the Records of a sync which have the same primary key (eg: when an incremental query uses >= on the
+    checkpoint, or when a join repeats rows), keeping the one with the highest checkpoint. The others are dropped
+    (see Record.drop) rather than removed, since Records missing after "process_records" fail the sync.
+
+    The primary keys seen so far are kept in memory up to max_keys, then spilled to a SQLite database on disk, with a
+    Bloom filter to skip the lookup of the keys which were never spilled (most of them, for a sync without many
+    duplicates). A Record is compared with the ones of earlier batches, which have already been loaded: it is dropped
+    unless its checkpoint is higher, in which case it replaces the loaded one.
+    """
+
+    def __init__(self, max_keys: int = MAX_KEYS, spill_path: str = "", error_rate: float = 0.01):
+        """
+        :param max_keys: The number of primary keys kept in memory, the others are spilled to disk.
+        :param spill_path: The SQLite database for the spilled keys, by default a temporary file which is deleted on
+        close. The keys spilled to it by an earlier Deduplicator are discarded.
+        :param error_rate: The false positive rate of the Bloom filter of the spilled keys.
+        """
+        if max_keys < 1:
+            raise ValueError("max_keys must be at least 1")
+        self.max_keys = max_keys
+        self.duplicates = 0
+        """The number of Records which were dropped as duplicates so far."""
+
+        self._error_rate = error_rate
+        self._keys: dict[str, Optional[Checkpoint]] = {}
+        self._bloom: Optional[BloomFilter] = None
+        self._spilled_keys = 0
+        """An upper bound of the number of spilled keys, since a key can be spilled again with a newer checkpoint."""
+        self._spill_path = spill_path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> "Deduplicator":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @property
+    def spilled(self) -> bool:
+        """Whether keys were spilled to disk."""
+        return self._bloom is not None
+
+    def _spill(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._spill_path)
+            self._connection.execute("DROP TABLE IF EXISTS flux_keys")
+            self._connection.execute(
+                "CREATE TABLE flux_keys (primary_key TEXT PRIMARY KEY, kind TEXT, checkpoint TEXT) WITHOUT ROWID"
+            )
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO flux_keys VALUES (?, ?, ?)",
+            ((primary_key, *_encode_checkpoint(checkpoint)) for primary_key, checkpoint in self._keys.items()),
+        )
+        self._connection.commit()
+        self._spilled_keys += len(self._keys)
+
+        if self._bloom is None or self._spilled_keys > self._bloom.capacity:
+            # a single filter keeps the false positive rate, so it is rebuilt twice as large once it is full, which
+            # reads every spilled key again but only as often as the number of spilled keys doubles
+            self._bloom = BloomFilter(2 * self._spilled_keys, self._error_rate)
+            cursor = self._connection.execute("SELECT primary_key FROM flux_keys")
+            primary_keys: Iterable[str] = (primary_key for primary_key, in cursor)
+        else:
+            primary_keys = self._keys
+        for primary_key in primary_keys:
+            self._bloom.add(primary_key)
+        self._keys.clear()
+
+    def _spilled(self, primary_keys: Iterable[str]) -> dict[str, Optional[Checkpoint]]:
+        spilled: dict[str, Optional[Checkpoint]] = {}
+        bloom = self._bloom
+        if self._connection is None or bloom is None:
+            return spilled
+
+        candidates = [key for key in primary_keys if key in bloom]
+        for start in range(0, len(candidates), LOOKUP_CHUNK_SIZE):
+            chunk = candidates[start : start + LOOKUP_CHUNK_SIZE]
+            cursor = self._connection.execute(
+                "SELECT primary_key, kind, checkpoint FROM flux_keys "
+                f"WHERE primary_key IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            spilled.update((key, _decode_checkpoint(kind, checkpoint)) for key, kind, checkpoint in cursor)
+        return spilled
+
+    def drop_duplicates(self, records: Iterable[Record]) -> int:
+        """
+        Set drop on the Records of a batch which duplicate another Record of the batch or of an earlier batch with the
+        same or a higher checkpoint. Of the Records of a primary key with the highest checkpoint, the first one is kept.
+        Records which are already dropped are ignored.
+
+        :return: The number of Records which were dropped.
+        """
+        best: dict[str, Record] = {}
+        duplicates = []
+        for record in records:
+            if record.drop:
+                continue
+            current = best.get(record.primary_key)
+            if current is None:
+                best[record.primary_key] = record
+            elif _newer(record.checkpoint, current.checkpoint):
+                best[record.primary_key] = record
+                duplicates.append(current)
+            else:
+                duplicates.append(record)
+
+        unseen = [key for key in best if key not in self._keys]
+        previous = self._spilled(unseen) if self._bloom is not None else {}
+        for primary_key, record in best.items():
+            if primary_key in self._keys:
+                known, seen = True, self._keys[primary_key]
+            else:
+                known, seen = primary_key in previous, previous.get(primary_key)
+            if not known or _newer(record.checkpoint, seen):
+                self._keys[primary_key] = record.checkpoint
+            else:
+                duplicates.append(record)
+
+        for record in duplicates:
+            record.drop = True
+        self.duplicates += len(duplicates)
+
+        if len(self._keys) > self.max_keys:
+            self._spill()
+        return len(duplicates)
+
+
+def drop_duplicates(records: Iterable[Record]) -> int:
+    """
+    Set drop on the Records of a single batch which duplicate another one, see Deduplicator.drop_duplicates.
+
+    :return: The number of Records which were dropped.
+    """
+    with Deduplicator() as deduplicator:
+        return deduplicator.drop_duplicates(records)
@@ -0,0 +1,115 @@
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from flux_sdk.etl.data_models.query import SQLQuery, SQLQueryArg
+from flux_sdk.etl.data_models.record import Checkpoint, Record
+
+Position = tuple[SQLQueryArg, SQLQueryArg]
+"""The (checkpoint, primary key) of the last row of a page, which the next page starts after."""
+
+AFTER_CHECKPOINT_ARG = "flux_after_checkpoint"
+AFTER_KEY_ARG = "flux_after_key"
+CHECKPOINT_ARG = "flux_since_checkpoint"
+
+
+class KeysetPaginator:
+    """
+    Builds the queries for reading the rows of a query one page at a time, ordered by (checkpoint, primary key). Each
+    page starts after the position of the last row of the previous page, which the database finds through an index on
+    (checkpoint, primary key), so every page costs the same however deep into the table it is (unlike OFFSET).
+
+    Both columns should be NOT NULL (eg: use COALESCE in the query), since rows with NULL are not ordered.
+    """
+
+    def __init__(self, query: SQLQuery, checkpoint_column: str, primary_key_column: str, page_size: int = 10_000):
+        """
+        :param query: The query to paginate, which should select both columns. It is wrapped in a sub-query.
+        :param checkpoint_column: The column used for Record.checkpoint.
+        :param primary_key_column: The column used for Record.primary_key, which makes the order unique.
+        :param page_size: The maximum number of rows per page.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        reserved = {AFTER_CHECKPOINT_ARG, AFTER_KEY_ARG, CHECKPOINT_ARG} & set(query.args or {})
+        if reserved:
+            raise ValueError(f"the query args should not use {', '.join(sorted(reserved))}")
+
+        self.query = query
+        self.page_size = page_size
+        self._select = f"SELECT * FROM ({query.text.strip().rstrip(';')}) AS flux_page"
+        self._order = f" ORDER BY flux_page.{checkpoint_column}, flux_page.{primary_key_column} LIMIT {int(page_size)}"
+        self._since = f"flux_page.{checkpoint_column} >= @{CHECKPOINT_ARG}"
+        self._after = (
+            f"(flux_page.{checkpoint_column} > @{AFTER_CHECKPOINT_ARG} OR "
+            f"(flux_page.{checkpoint_column} = @{AFTER_CHECKPOINT_ARG} AND "
+            f"flux_page.{primary_key_column} > @{AFTER_KEY_ARG}))"
+        )
+
+    def page(self, after: Optional[Position] = None, checkpoint: Optional[Checkpoint] = None) -> SQLQuery:
+        """
+        The query for the page following the after position, or for the first page when it is None.
+
+        :param after: The position of the last row of the previous page.
+        :param checkpoint: The checkpoint of the previous sync, for an incremental sync. Rows with this checkpoint are
+        read again, since rows with the same checkpoint may have been written after the previous sync.
+        """
+        args = dict(self.query.args or {})
+        conditions = []
+        if checkpoint is not None:
+            conditions.append(self._since)
+            args[CHECKPOINT_ARG] = checkpoint
+        if after is not None:
+            conditions.append(self._after)
+            args[AFTER_CHECKPOINT_ARG], args[AFTER_KEY_ARG] = after
+
+        text = self._select
+        if conditions:
+            text += " WHERE " + " AND ".join(conditions)
+        return SQLQuery(text=text + self._order, args=args or None)
+
+
+@dataclass(kw_only=True)
+class Page:
+    """A page of rows read by walk_pages."""
+
+    rows: Sequence[Any]
+    """The rows of the page, in (checkpoint, primary key) order."""
+
+    after: Optional[Position]
+    """
+    The position of the last row, which the next page starts after. Persist it once the page has been loaded, then pass
+    it to walk_pages to resume the sync from the next page (eg: after a crash).
+    """
+
+
+def record_position(record: Record) -> Position:
+    """The position of a Record, when Record.checkpoint and Record.primary_key hold the raw column values."""
+    if record.checkpoint is None:
+        raise ValueError(f"the Record {record.primary_key} has no checkpoint, so it has no position")
+    return record.checkpoint, record.primary_key
+
+
+def walk_pages(
+    paginator: KeysetPaginator,
+    fetch: Callable[[SQLQuery], Sequence[Any]],
+    position: Callable[[Any], Position] = record_position,
+    after: Optional[Position] = None,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Iterator[Page]:
+    """
+    Read every page of paginator, from the start or after a position saved from a previous Page. The walk stops after
+    the first page with fewer rows than the page size.
+
+    :param fetch: Runs a query and returns its rows (eg: Records, or raw tuples).
+    :param position: The (checkpoint, primary key) of a row, as they are stored in the database.
+    :param after: The position to resume after.
+    :param checkpoint: The checkpoint of the previous sync, for an incremental sync.
+    """
+    while True:
+        rows = fetch(paginator.page(after, checkpoint))
+        if rows:
+            after = position(rows[-1])
+        yield Page(rows=rows, after=after)
+        if len(rows) < paginator.page_size:
+            return
@@ -0,0 +1,179 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, Optional, Type, TypeVar
+
+from flux_sdk.etl.capabilities.single_object_import.interface import SingleObjectImport
+from flux_sdk.etl.data_models.query import Connector, MongoQuery, Query, SQLQuery
+from flux_sdk.etl.data_models.record import Checkpoint, CheckpointTracker
+from flux_sdk.etl.data_models.schema import Schema
+from flux_sdk.etl.helpers.processing import implements_hook
+
+Bound = TypeVar("Bound", int, float, str, datetime, date)
+"""The types of the values of a partitioning column. The bounds of a set of partitions are all of the same type."""
+
+RangeBound = TypeVar("RangeBound", int, float, datetime, date)
+"""The types of bounds which split_range can interpolate between."""
+
+LOWER_ARG = "partition_lower"
+UPPER_ARG = "partition_upper"
+
+
+@dataclass(kw_only=True)
+class Partition(Generic[Bound]):
+    """
+    A range of values of the partitioning column (eg: the primary key, or the checkpoint): lower <= value < upper. The
+    partition without a lower bound also has the rows without a value (NULL), eg: for a nullable checkpoint column.
+    """
+
+    lower: Optional[Bound] = None
+    """The inclusive lower bound, None for the first partition so that it has no lower bound."""
+
+    upper: Optional[Bound] = None
+    """The exclusive upper bound, None for the last partition so that it has no upper bound."""
+
+    def __contains__(self, value: Optional[Bound]) -> bool:
+        if value is None:
+            return self.lower is None
+        return (self.lower is None or value >= self.lower) and (self.upper is None or value < self.upper)
+
+
+def partitions_from_boundaries(boundaries: Iterable[Bound]) -> list[Partition[Bound]]:
+    """
+    The partitions split at each boundary. The first and last partitions are unbounded, so the partitions are disjoint
+    and together cover every value, even outside of the boundaries (eg: rows inserted since the boundaries were
+    computed).
+    """
+    partitions: list[Partition[Bound]] = []
+    lower: Optional[Bound] = None
+    for boundary in sorted(set(boundaries)):
+        partitions.append(Partition(lower=lower, upper=boundary))
+        lower = boundary
+    partitions.append(Partition(lower=lower))
+    return partitions
+
+
+def split_range(lower: RangeBound, upper: RangeBound, partitions: int) -> list[Partition[RangeBound]]:
+    """
+    Split the range between lower and upper (eg: the MIN and MAX of an integer key, or of a timestamp) into at most the
+    given number of partitions of equal width. Integer ranges narrower than the number of partitions produce fewer
+    partitions.
+    """
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1")
+    if upper < lower:
+        raise ValueError("upper must not be lower than lower")
+
+    boundaries: list[RangeBound]
+    if isinstance(lower, int) and isinstance(upper, int):
+        boundaries = [lower + (i * (upper - lower + 1)) // partitions for i in range(1, partitions)]
+    else:
+        width = (upper - lower) / partitions
+        boundaries = [lower + width * i for i in range(1, partitions)]
+    return partitions_from_boundaries(b for b in boundaries if b > lower)
+
+
+def split_sample(sample: Iterable[Bound], partitions: int) -> list[Partition[Bound]]:
+    """
+    Split at the quantiles of a sample of the values of the partitioning column, eg: for string keys, or for skewed
+    numeric keys which split_range would split into partitions of very different sizes.
+    """
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1")
+
+    values = sorted(sample)
+    boundaries = [values[(i * len(values)) // partitions] for i in range(1, partitions)] if values else []
+    return partitions_from_boundaries(b for b in boundaries if b > values[0])
+
+
+def partition_sql(query: SQLQuery, column: str, partitions: Sequence[Partition]) -> list[SQLQuery]:
+    """
+    One SQLQuery per partition, each selecting the rows of query with a value of column within the partition, and
+    the rows where column is NULL for the partition without a lower bound. The query is wrapped in a sub-query, so it
+    can be any SELECT (including joins and aggregates) as long as column is one of its output columns. The bounds are
+    passed as the "partition_lower"/"partition_upper" args.
+    """
+    args = query.args or {}
+    if LOWER_ARG in args or UPPER_ARG in args:
+        raise ValueError(f"the query args should not use {LOWER_ARG} or {UPPER_ARG}")
+
+    text = query.text.strip().rstrip(";")
+    queries = []
+    for partition in partitions:
+        conditions = []
+        partition_args = dict(args)
+        if partition.lower is not None:
+            conditions.append(f"flux_partition.{column} >= @{LOWER_ARG}")
+            partition_args[LOWER_ARG] = partition.lower
+        if partition.upper is not None:
+            conditions.append(f"flux_partition.{column} < @{UPPER_ARG}")
+            partition_args[UPPER_ARG] = partition.upper
+
+        partition_text = f"SELECT * FROM ({text}) AS flux_partition"
+        if conditions:
+            condition = " AND ".join(conditions)
+            if partition.lower is None:
+                condition = f"({condition} OR flux_partition.{column} IS NULL)"
+            partition_text += " WHERE " + condition
+        queries.append(SQLQuery(text=partition_text, args=partition_args or None))
+    return queries
+
+
+def partition_mongo(query: MongoQuery, field: str, partitions: Sequence[Partition]) -> list[MongoQuery]:
+    """
+    One MongoQuery per partition, each selecting the documents of query with a value of field within the partition,
+    and the documents where field is null or missing for the partition without a lower bound: the range is added to
+    the filter, or as a $match stage at the start of the aggregate pipeline.
+    """
+    queries = []
+    for partition in partitions:
+        condition: dict[str, Any] = {}
+        if partition.lower is not None:
+            condition["$gte"] = partition.lower
+        if partition.upper is not None:
+            condition["$lt"] = partition.upper
+        match: dict[str, Any] = {field: condition} if condition else {}
+        if condition and partition.lower is None:
+            match = {"$or": [match, {field: None}]}
+
+        query_filter = query.filter
+        aggregate = query.aggregate
+        if match and aggregate is not None:
+            aggregate = [{"$match": match}, *aggregate]
+        elif match:
+            query_filter = {"$and": [query.filter, match]} if query.filter else match
+
+        queries.append(
+            MongoQuery(
+                collection=query.collection, filter=query_filter, projection=query.projection, aggregate=aggregate
+            )
+        )
+    return queries
+
+
+def prepare_queries(
+    capability: Type[SingleObjectImport],
+    connector: Connector,
+    schema: Schema,
+    checkpoint: Optional[Checkpoint],
+    partitions: int,
+) -> list[Query]:
+    """
+    The queries to extract concurrently, from the "prepare_partitioned_query" hook when it is implemented, otherwise
+    the single query from "prepare_query".
+    """
+    if partitions > 1 and implements_hook(capability, "prepare_partitioned_query"):
+        return list(capability.prepare_partitioned_query(connector, schema, checkpoint, partitions))
+    return [capability.prepare_query(connector, schema, checkpoint)]
+
+
+def combine_checkpoints(trackers: Iterable[CheckpointTracker]) -> Optional[Checkpoint]:
+    """
+    The checkpoint of a partitioned sync, from the tracker of each partition: the highest checkpoint of any partition.
+    This is only valid once every partition has completed, since the records of a partition which has not completed
+    could have lower checkpoints, which the next incremental sync would then skip.
+    """
+    combined = CheckpointTracker()
+    for tracker in trackers:
+        combined.merge(tracker)
+    return combined.highest
@@ -0,0 +1,22 @@
+from typing import Type
+
+from flux_sdk.etl.capabilities.single_object_import.interface import SingleObjectImport
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.data_models.record_batch import RecordBatch
+from flux_sdk.etl.data_models.schema import Schema
+
+
+def implements_hook(capability: Type[SingleObjectImport], name: str) -> bool:
+    """Whether capability overrides the optional hook with this name, rather than inheriting the default."""
+    return getattr(capability, name) is not getattr(SingleObjectImport, name)
+
+
+def process(capability: Type[SingleObjectImport], schema: Schema, records: list[Record]) -> list[Record]:
+    """
+    Run the processing hook of capability over a batch of records, preferring "process_record_batch" when it is
+    implemented, as the runtime does.
+    """
+    if implements_hook(capability, "process_record_batch"):
+        batch = capability.process_record_batch(schema, RecordBatch.from_records(records, schema))
+        return batch.to_records()
+    return capability.process_records(schema, records)
@@ -0,0 +1,71 @@
+import re
+from collections.abc import Callable
+from typing import Any, Optional
+
+from flux_sdk.etl.data_models.query import MongoQuery, SQLQuery
+from flux_sdk.etl.data_models.schema import Schema
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_SELECT_STAR = re.compile(r"^\s*SELECT\s+\*\s+FROM\b", re.IGNORECASE)
+
+
+def schema_columns(schema: Schema) -> list[str]:
+    """
+    The minimal set of columns (or document fields) needed to build the Records of schema, in order and without
+    duplicates: the primary key and name fields, every SchemaField, the reference and owner fields, then the created and
+    last modified date fields.
+    """
+    names = [schema.primary_key_field, schema.name_field]
+    names.extend(field.name for field in schema.fields)
+    names.extend(schema.references or {})
+    if schema.owner is not None:
+        names.append(schema.owner[0])
+    names.extend(name for name in (schema.created_date_field, schema.last_modified_date_field) if name is not None)
+    return list(dict.fromkeys(names))
+
+
+def _plain_identifier(name: str) -> str:
+    if not _IDENTIFIER.fullmatch(name):
+        raise ValueError(f"{name!r} is not a plain identifier, pass a quote function for the database")
+    return name
+
+
+def project_sql(query: SQLQuery, schema: Schema, quote: Optional[Callable[[str], str]] = None) -> SQLQuery:
+    """
+    Restrict query to the columns of schema (see schema_columns). A "SELECT * FROM ..." query has its * replaced by the
+    columns, any other query is wrapped in a sub-query selecting them, which databases push down into the query.
+
+    :param quote: Quotes a column name for the database (eg: '"name"' or '`name`'). By default, only names which do not
+    need to be quoted are accepted.
+    """
+    quote = quote or _plain_identifier
+    columns = ", ".join(map(quote, schema_columns(schema)))
+    text = query.text.strip().rstrip(";")
+
+    if _SELECT_STAR.match(text):
+        text = _SELECT_STAR.sub(lambda match: f"SELECT {columns} FROM", text, count=1)
+    else:
+        text = f"SELECT {columns} FROM ({text}) AS flux_projection"
+    return SQLQuery(text=text, args=query.args)
+
+
+def project_mongo(query: MongoQuery, schema: Schema) -> MongoQuery:
+    """
+    Restrict query to the fields of schema (see schema_columns), through the projection of a find, or a final $project
+    stage for an aggregate. Entries of an existing projection for these fields (eg: computed fields) are kept, and _id
+    is excluded unless it is one of them.
+    """
+    projection: dict[str, Any] = {}
+    for name in schema_columns(schema):
+        projection[name] = (query.projection or {}).get(name, 1)
+    if "_id" not in projection:
+        projection["_id"] = 0
+
+    if query.aggregate is not None:
+        return MongoQuery(
+            collection=query.collection,
+            filter=query.filter,
+            projection=query.projection,
+            aggregate=[*query.aggregate, {"$project": projection}],
+        )
+    return MongoQuery(collection=query.collection, filter=query.filter, projection=projection)
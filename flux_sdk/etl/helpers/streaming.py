@@ -0,0 +1,141 @@
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import Any, Type
+
+from flux_sdk.etl.capabilities.single_object_import.interface import SingleObjectImport
+from flux_sdk.etl.data_models.record import CheckpointTracker, Record
+from flux_sdk.etl.data_models.schema import Schema
+from flux_sdk.etl.helpers.processing import implements_hook, process
+
+BUFFER_SIZE = 10_000
+"""The number of extracted Records which can wait for processing before extraction is paused."""
+
+BATCH_SIZE = 1_000
+"""The number of Records per call to process_records (when it is not streamed) and per call to load."""
+
+_DONE = object()
+
+
+@dataclass(kw_only=True)
+class StreamStats:
+    """The counts of a run_stream call."""
+
+    extracted: int = 0
+    """The number of Records read from the query output."""
+
+    loaded: int = 0
+    """The number of Records passed to load, including the dropped ones."""
+
+    dropped: int = 0
+    """The number of loaded Records with drop set."""
+
+    batches: int = 0
+    """The number of calls to load."""
+
+    checkpoints: CheckpointTracker = field(default_factory=CheckpointTracker)
+    """The checkpoints of the loaded Records, see CheckpointTracker.highest for the next incremental sync."""
+
+    def add(self, batch: list[Record]):
+        """Count a batch which was passed to load."""
+        self.batches += 1
+        self.loaded += len(batch)
+        self.dropped += sum(1 for record in batch if record.drop)
+        self.checkpoints.update(batch)
+
+
+class _ExtractionError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def process_stream(
+    capability: Type[SingleObjectImport], schema: Schema, records: Iterable[Record], batch_size: int = BATCH_SIZE
+) -> Iterator[Record]:
+    """
+    Lazily run the processing hook of capability over records. The "process_record_stream" hook is used when it is
+    implemented, otherwise records are processed batch_size at a time (see processing.process).
+    """
+    if implements_hook(capability, "process_record_stream"):
+        yield from capability.process_record_stream(schema, iter(records))
+        return
+
+    for batch in _batches(records, batch_size):
+        yield from process(capability, schema, batch)
+
+
+def run_stream(
+    capability: Type[SingleObjectImport],
+    schema: Schema,
+    records: Iterable[Record],
+    load: Callable[[list[Record]], Any],
+    buffer_size: int = BUFFER_SIZE,
+    batch_size: int = BATCH_SIZE,
+) -> StreamStats:
+    """
+    A reference driver which chains the query output (records) through processing (see process_stream) into load, in
+    constant memory. Records are extracted on a separate thread into a buffer of at most buffer_size Records: when
+    processing or loading falls behind, the buffer fills up and extraction waits (backpressure) rather than holding the
+    whole table in memory. Processed Records are passed to load batch_size at a time.
+
+    An error raised while extracting is raised from here, and an error raised while processing or loading stops the
+    extraction.
+    """
+    if buffer_size < 1 or batch_size < 1:
+        raise ValueError("buffer_size and batch_size must be at least 1")
+
+    stats = StreamStats()
+    buffer: Queue = Queue(maxsize=buffer_size)
+    stop = Event()
+    extractor = Thread(target=_extract, args=(records, buffer, stop), name="flux-extract", daemon=True)
+    extractor.start()
+
+    try:
+        processed = process_stream(capability, schema, _drain(buffer, stats), batch_size)
+        for batch in _batches(processed, batch_size):
+            load(batch)
+            stats.add(batch)
+    finally:
+        stop.set()
+        extractor.join()
+
+    return stats
+
+
+def _extract(records: Iterable[Record], buffer: Queue, stop: Event):
+    try:
+        for record in records:
+            if not _put(buffer, stop, record):
+                return
+        _put(buffer, stop, _DONE)
+    except BaseException as e:
+        _put(buffer, stop, _ExtractionError(e))
+
+
+def _put(buffer: Queue, stop: Event, item: Any) -> bool:
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.05)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _drain(buffer: Queue, stats: StreamStats) -> Iterator[Record]:
+    while True:
+        item = buffer.get()
+        if item is _DONE:
+            return
+        if isinstance(item, _ExtractionError):
+            raise item.error
+        stats.extracted += 1
+        yield item
+
+
+def _batches(records: Iterable[Record], size: int) -> Iterator[list[Record]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
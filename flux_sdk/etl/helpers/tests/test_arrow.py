@@ -0,0 +1,160 @@
+import pickle
+import tempfile
+import unittest
+from datetime import date, datetime, time, timezone
+
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType, SchemaField
+from flux_sdk.etl.helpers.arrow import (
+    CHECKPOINT_COLUMN,
+    DROP_COLUMN,
+    MISSING_PREFIX,
+    MIXED_METADATA,
+    PRIMARY_KEY_COLUMN,
+    REFERENCE_PREFIX,
+    ParquetSpool,
+    arrow_schema,
+    from_arrow,
+    pa,
+    read_parquet,
+    to_arrow,
+    write_parquet,
+)
+
+SCHEMA = Schema(
+    name="invoice",
+    category_name="Invoices",
+    category_description="Invoices",
+    primary_key_field="id",
+    name_field="number",
+    fields=[
+        SchemaField(name="number", data_type=SchemaDataType.String),
+        SchemaField(name="count", data_type=SchemaDataType.Integer),
+        SchemaField(name="total", data_type=SchemaDataType.Currency),
+        SchemaField(name="paid", data_type=SchemaDataType.Bool),
+        SchemaField(name="due", data_type=SchemaDataType.Date),
+        SchemaField(name="at", data_type=SchemaDataType.Time),
+        SchemaField(name="updated", data_type=SchemaDataType.DateTime),
+        SchemaField(name="customer_id", data_type=SchemaDataType.String),
+    ],
+)
+
+
+def invoices(count: int) -> list[Record]:
+    return [
+        Record(
+            primary_key=f"inv_{i}",
+            fields={
+                "number": f"INV-{i}",
+                "count": i,
+                "total": "10.50",
+                "paid": i % 2 == 0,
+                "due": date(2024, 1, 1 + i % 28),
+                "at": time(9, i % 60),
+                "updated": datetime(2024, 1, 2, 3, 4, i % 60, tzinfo=timezone.utc),
+                "customer_id": f"c{i % 3}",
+                "note": None if i % 2 else "rush",
+            },
+            references={"customer_id": f"c{i % 3}"} if i % 4 else None,
+            checkpoint=1_000 + i,
+            drop=True if i == 3 else None,
+        )
+        for i in range(count)
+    ]
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestArrow(unittest.TestCase):
+    def test_arrow_schema(self):
+        schema = arrow_schema(SCHEMA)
+        self.assertEqual(schema.field("count").type, pa.int64())
+        self.assertEqual(schema.field("total").type, pa.string())
+        self.assertEqual(schema.field("updated").type, pa.timestamp("us", tz="UTC"))
+        self.assertEqual(schema.field("total").metadata, {b"flux.data_type": b"currency"})
+
+    def test_round_trip(self):
+        records = invoices(10)
+        table = to_arrow(records, SCHEMA)
+        self.assertEqual(table.num_rows, 10)
+        self.assertEqual(table.column_names[0], PRIMARY_KEY_COLUMN)
+        self.assertIn(REFERENCE_PREFIX + "customer_id", table.column_names)
+        self.assertIn(CHECKPOINT_COLUMN, table.column_names)
+        self.assertIn(DROP_COLUMN, table.column_names)
+        self.assertEqual(table.schema.field("note").type, pa.string())
+
+        self.assertEqual(from_arrow(table), records)
+        self.assertEqual(from_arrow(pickle.loads(pickle.dumps(table)), trusted=True), records)
+
+    def test_without_schema(self):
+        records = [Record(primary_key="1", fields={"a": 1}), Record(primary_key="2", fields={"b": "x"})]
+        table = to_arrow(records)
+        self.assertEqual(
+            table.column_names, [PRIMARY_KEY_COLUMN, "a", "b", MISSING_PREFIX + "a", MISSING_PREFIX + "b"]
+        )
+        # the fields missing from a Record are still missing, rather than None
+        self.assertEqual(from_arrow(table), records)
+
+    def test_mixed_types(self):
+        naive = datetime(2024, 1, 2, 3, 4, 5)
+        aware = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        records = [
+            Record(primary_key="1", fields={"value": 1, "when": naive, "ratio": 1}, checkpoint=naive),
+            Record(primary_key="2", fields={"value": "a", "when": aware, "ratio": 2.5}, checkpoint=7),
+            Record(primary_key="3", fields={"value": None, "when": None, "ratio": None}, checkpoint="token"),
+            Record(primary_key="4", fields={"value": False, "when": date(2024, 1, 2)}, checkpoint=aware),
+        ]
+        table = to_arrow(records)
+        for name in ("value", "when", "ratio", CHECKPOINT_COLUMN):
+            self.assertEqual(table.schema.field(name).metadata, {MIXED_METADATA: b"true"})
+
+        restored = from_arrow(table)
+        self.assertEqual(restored, records)
+        # the values keep their types (eg: 1 is not converted to 1.0, nor False to 0)
+        self.assertEqual(
+            [[type(value) for value in r.fields.values()] for r in restored],
+            [[int, datetime, int], [str, datetime, float], [type(None)] * 3, [bool, date]],
+        )
+        self.assertIsNone(restored[0].fields["when"].tzinfo)
+
+        with tempfile.TemporaryDirectory() as directory:
+            write_parquet(records, f"{directory}/mixed.parquet")
+            self.assertEqual(read_parquet(f"{directory}/mixed.parquet"), records)
+
+    def test_conversions(self):
+        # the conversions documented on to_arrow
+        naive = datetime(2024, 1, 2, 3, 4, 5)
+        records = [
+            Record(primary_key="1", fields={"total": 10.5, "updated": naive}),
+            Record(primary_key="2", fields={"total": 3, "number": "INV-2"}),
+        ]
+        first, second = from_arrow(to_arrow(records, SCHEMA))
+        self.assertEqual(first.fields["total"], "10.5")
+        self.assertEqual(first.fields["updated"], naive.replace(tzinfo=timezone.utc))
+        self.assertEqual(second.fields["total"], "3")
+        # the SchemaFields missing from a Record are still missing
+        self.assertNotIn("number", first.fields)
+        self.assertNotIn("updated", second.fields)
+
+    def test_reserved(self):
+        with self.assertRaises(ValueError):
+            to_arrow([Record(primary_key="1", fields={"flux.drop": True})])
+
+    def test_parquet(self):
+        records = invoices(20)
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/invoices.parquet"
+            write_parquet(records, path, SCHEMA)
+            self.assertEqual(read_parquet(path), records)
+
+    def test_spool(self):
+        batches = [invoices(5), invoices(3), [Record(primary_key="x", fields={"other": 1.5})]]
+        with tempfile.TemporaryDirectory() as directory:
+            spool = ParquetSpool(directory, SCHEMA)
+            for batch in batches[:2]:
+                spool.write(batch)
+
+            # a new spool over the same directory continues after the existing batches
+            spool = ParquetSpool(directory, SCHEMA)
+            spool.write(batches[2])
+            self.assertEqual(len(spool), 3)
+            self.assertEqual(list(spool.read()), batches)
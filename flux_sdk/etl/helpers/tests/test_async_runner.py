@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+from typing import Optional
+
+from flux_sdk.etl.capabilities.single_object_import.async_interface import AsyncSingleObjectImport
+from flux_sdk.etl.data_models.query import Connector, Query, SQLQuery
+from flux_sdk.etl.data_models.record import Checkpoint, Record
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType, SchemaField
+from flux_sdk.etl.helpers.async_runner import run_async
+
+SCHEMA = Schema(
+    name="item",
+    category_name="Items",
+    category_description="Items",
+    primary_key_field="id",
+    name_field="id",
+    fields=[SchemaField(name="id", data_type=SchemaDataType.Integer)],
+)
+
+
+def _id(record: Record) -> int:
+    value = record.fields["id"]
+    assert isinstance(value, int)
+    return value
+
+
+class EnrichingImport(AsyncSingleObjectImport):
+    running = 0
+    max_running = 0
+
+    @staticmethod
+    def get_schema() -> Schema:
+        return SCHEMA
+
+    @staticmethod
+    async def prepare_query(connector: Connector, schema: Schema, checkpoint: Optional[Checkpoint]) -> Query:
+        return SQLQuery(text="SELECT id FROM items")
+
+    @staticmethod
+    async def process_records(schema: Schema, records: list[Record]) -> list[Record]:
+        EnrichingImport.running += 1
+        EnrichingImport.max_running = max(EnrichingImport.max_running, EnrichingImport.running)
+        try:
+            # later batches finish first, to check that loading keeps the original order
+            await asyncio.sleep(0.01 / (1 + abs(_id(records[0]))))
+            if _id(records[0]) < 0:
+                raise RuntimeError("lookup failed")
+            for record in records:
+                record.drop = _id(record) % 2 == 1
+            return records
+        finally:
+            EnrichingImport.running -= 1
+
+
+def _batches(count: int, size: int = 3) -> list[list[Record]]:
+    return [[Record(primary_key=f"{b}_{i}", fields={"id": b}) for i in range(size)] for b in range(count)]
+
+
+async def _async_batches(count: int):
+    for batch in _batches(count):
+        await asyncio.sleep(0)
+        yield batch
+
+
+class TestRunAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        EnrichingImport.running = EnrichingImport.max_running = 0
+
+    async def test_async_batches(self):
+        loaded = []
+        stats = await run_async(EnrichingImport, SCHEMA, _async_batches(10), loaded.append, max_in_flight=3)
+
+        self.assertEqual([batch[0].fields["id"] for batch in loaded], list(range(10)))
+        self.assertEqual((stats.extracted, stats.loaded, stats.dropped, stats.batches), (30, 30, 15, 10))
+        self.assertEqual(EnrichingImport.max_running, 3)
+
+    async def test_blocking_batches_and_async_load(self):
+        loaded = []
+
+        async def load(batch):
+            await asyncio.sleep(0)
+            loaded.append(batch)
+
+        stats = await run_async(EnrichingImport, SCHEMA, iter(_batches(5)), load, max_in_flight=1)
+        self.assertEqual(stats.batches, 5)
+        self.assertEqual([batch[0].fields["id"] for batch in loaded], list(range(5)))
+        self.assertEqual(EnrichingImport.max_running, 1)
+
+    async def test_error_cancels_in_flight(self):
+        batches = _batches(6)
+        batches[1][0].fields["id"] = -1
+
+        with self.assertRaisesRegex(RuntimeError, "lookup failed"):
+            await run_async(EnrichingImport, SCHEMA, batches, lambda batch: None, max_in_flight=4)
+        self.assertEqual(EnrichingImport.running, 0)
+
+    async def test_invalid_max_in_flight(self):
+        with self.assertRaises(ValueError):
+            await run_async(EnrichingImport, SCHEMA, [], lambda batch: None, max_in_flight=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
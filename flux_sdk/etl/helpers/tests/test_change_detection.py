@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, time, timedelta, timezone
+
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.helpers.change_detection import LOOKUP_CHUNK_SIZE, ChangeDetector, record_digest
+
+FIELDS = {
+    "name": "one",
+    "total": 1.5,
+    "count": 2,
+    "paid": True,
+    "due": date(2024, 1, 2),
+    "at": time(9, 30),
+    "updated": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "notes": None,
+}
+
+
+def records(count: int, version: int = 0) -> list[Record]:
+    return [
+        Record(primary_key=f"item_{i}", fields={"id": i, "version": version if i % 2 else 0}) for i in range(count)
+    ]
+
+
+class TestRecordDigest(unittest.TestCase):
+    def test_stable(self):
+        record = Record(primary_key="1", fields=FIELDS, references={"customer_id": "c1"})
+        # digests are persisted between syncs, so they must never change
+        self.assertEqual(record_digest(record).hex(), "5b63f5d1b2771c7eae313277aa491616")
+
+        reordered = Record(primary_key="1", fields=dict(reversed(FIELDS.items())), references={"customer_id": "c1"})
+        self.assertEqual(record_digest(reordered), record_digest(record))
+
+        other_zone = dict(FIELDS, updated=FIELDS["updated"].astimezone(timezone(timedelta(hours=2))))
+        self.assertEqual(
+            record_digest(Record(primary_key="1", fields=other_zone, references={"customer_id": "c1"})),
+            record_digest(record),
+        )
+
+        # the checkpoint and drop flag are not part of the content
+        unchanged = Record(primary_key="1", fields=FIELDS, references={"customer_id": "c1"}, checkpoint=5, drop=False)
+        self.assertEqual(record_digest(unchanged), record_digest(record))
+
+    def test_changes(self):
+        base = Record(primary_key="1", fields={"a": "x", "b": 1}, references={"r": "1"})
+        changes = [
+            Record(primary_key="2", fields={"a": "x", "b": 1}, references={"r": "1"}),
+            Record(primary_key="1", fields={"a": "x", "b": 2}, references={"r": "1"}),
+            Record(primary_key="1", fields={"a": "x", "b": 1.0}, references={"r": "1"}),
+            Record(primary_key="1", fields={"a": "x", "b": True}, references={"r": "1"}),
+            Record(primary_key="1", fields={"a": "x", "b": "1"}, references={"r": "1"}),
+            Record(primary_key="1", fields={"a": "x", "b": None}, references={"r": "1"}),
+            Record(primary_key="1", fields={"a": "x"}, references={"r": "1"}),
+            Record(primary_key="1", fields={"a": "x", "c": 1}, references={"r": "1"}),
+            Record(primary_key="1", fields={"a": "x", "b": 1}, references={"r": "2"}),
+            Record(primary_key="1", fields={"a": "x", "b": 1}),
+            # the boundaries between names and values are part of the content
+            Record(primary_key="1", fields={"a": "x1:b", "b": 1}, references={"r": "1"}),
+        ]
+        digests = {record_digest(record) for record in changes}
+        self.assertEqual(len(digests), len(changes))
+        self.assertNotIn(record_digest(base), digests)
+
+        self.assertNotEqual(
+            record_digest(Record(primary_key="1", fields={"a": date(2024, 1, 2)})),
+            record_digest(Record(primary_key="1", fields={"a": datetime(2024, 1, 2)})),
+        )
+
+
+class TestChangeDetector(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "digests.sqlite")
+
+    def sync(self, batches: list[list[Record]], commit: bool = True) -> int:
+        with ChangeDetector(self.path) as detector:
+            dropped = sum(detector.drop_unchanged(batch) for batch in batches)
+            if commit:
+                detector.commit()
+        return dropped
+
+    def test_drop_unchanged(self):
+        self.assertEqual(self.sync([records(10)]), 0)
+
+        batch = records(12, version=1)
+        self.assertEqual(self.sync([batch[:4], batch[4:]]), 5)
+        self.assertEqual(
+            [record.primary_key for record in batch if not record.drop],
+            ["item_1", "item_3", "item_5", "item_7", "item_9", "item_10", "item_11"],
+        )
+
+        batch = records(12, version=1)
+        self.assertEqual(self.sync([batch]), 12)
+        self.assertTrue(all(record.drop for record in batch))
+
+    def test_uncommitted(self):
+        self.sync([records(10)], commit=False)
+        self.assertEqual(self.sync([records(10)]), 0)
+        self.assertEqual(self.sync([records(10)]), 10)
+
+        with ChangeDetector(self.path) as detector:
+            batch = records(10, version=1)
+            self.assertEqual(detector.drop_unchanged(batch), 5)
+            detector.rollback()
+            detector.commit()
+        self.assertEqual(self.sync([records(10, version=1)]), 5)
+
+    def test_dropped_records(self):
+        self.sync([records(4)])
+
+        batch = records(4, version=1)
+        batch[1].drop = True
+        self.assertEqual(self.sync([batch]), 2)
+        self.assertEqual([record.drop for record in batch], [True, True, True, None])
+
+        # the digest of the dropped Record was not replaced
+        self.assertEqual(self.sync([records(4)]), 3)
+
+    def test_many_keys(self):
+        count = LOOKUP_CHUNK_SIZE * 2 + 7
+        self.sync([records(count)])
+        self.assertEqual(self.sync([records(count, version=1)]), count - count // 2)
+
+    def test_memory(self):
+        with ChangeDetector(":memory:") as detector:
+            self.assertEqual(detector.drop_unchanged(records(3)), 0)
+            detector.commit()
+            self.assertEqual(detector.drop_unchanged(records(3)), 3)
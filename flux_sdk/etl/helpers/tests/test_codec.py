@@ -0,0 +1,142 @@
+import io
+import math
+import random
+import unittest
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from flux_sdk.etl.data_models.record import Field, Record
+from flux_sdk.etl.helpers.codec import MAGIC, RecordDecoder, RecordEncoder, decode_records, encode_records
+
+NAMES = ["id", "name", "total", "paid", "due", "at", "updated", "nom_français", "😀", ""]
+
+
+def random_text(rng: random.Random) -> str:
+    alphabet = "abc xyz,:|\"'\\\n\t\x00éß漢字😀\ud800"
+    return "".join(rng.choice(alphabet) for _ in range(rng.randrange(0, 20)))
+
+
+def random_field(rng: random.Random) -> Field:
+    kind = rng.randrange(12)
+    if kind == 0:
+        return None
+    if kind == 1:
+        return rng.random() < 0.5
+    if kind == 2:
+        return rng.randrange(0, 200)
+    if kind == 3:
+        return rng.choice([-1, -(2**63), 2**63 - 1, 2**63, -(2**63) - 1, 10**40, -(10**40), rng.getrandbits(64)])
+    if kind == 4:
+        return rng.choice([0.0, -0.0, 1.5, -1e300, 5e-324, math.inf, -math.inf, rng.uniform(-1e9, 1e9)])
+    if kind == 5:
+        return random_text(rng)
+    if kind == 6:
+        return date.fromordinal(rng.randrange(1, date.max.toordinal() + 1))
+    if kind == 7:
+        return time(rng.randrange(24), rng.randrange(60), rng.randrange(60), rng.randrange(1_000_000))
+    if kind == 8:
+        offset = timedelta(minutes=rng.randrange(-23 * 60, 23 * 60))
+        return time(rng.randrange(24), rng.randrange(60), tzinfo=timezone(offset))
+    span = (datetime.max - datetime.min) // timedelta(microseconds=1)
+    moment = datetime.min + timedelta(microseconds=rng.randrange(0, span))
+    if kind == 9:
+        return moment
+    if kind == 10:
+        return moment.replace(year=min(max(moment.year, 2), 9998), tzinfo=timezone.utc)
+    return moment.replace(year=rng.randrange(1970, 2100), tzinfo=ZoneInfo("America/New_York"))
+
+
+def random_record(rng: random.Random, i: int) -> Record:
+    names = rng.sample(NAMES, rng.randrange(1, len(NAMES)))
+    references = None
+    if rng.random() < 0.5:
+        references = {name: random_text(rng) for name in rng.sample(NAMES, rng.randrange(0, 3))}
+    return Record(
+        primary_key=f"{i}:{random_text(rng)}",
+        fields={name: random_field(rng) for name in names},
+        references=references,
+        checkpoint=rng.choice([None, i, str(i), datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i)]),
+        drop=rng.choice([None, False, True]),
+    )
+
+
+def same(first: Record, second: Record) -> bool:
+    # Records compare their fields with ==, which also holds between 0.0 and -0.0 (or 0.0 and 0), so the float types
+    # and signs are compared too
+    if first != second:
+        return False
+    for name, value in first.fields.items():
+        other = second.fields[name]
+        if not isinstance(value, float):
+            continue
+        if not isinstance(other, float) or math.copysign(1, value) != math.copysign(1, other):
+            return False
+    return True
+
+
+class TestCodec(unittest.TestCase):
+    def test_round_trip(self):
+        for seed in range(50):
+            rng = random.Random(seed)
+            records = [random_record(rng, i) for i in range(rng.randrange(0, 30))]
+            with self.subTest(seed=seed):
+                decoded = decode_records(encode_records(records))
+                self.assertEqual(len(decoded), len(records))
+                for record, result in zip(records, decoded):
+                    self.assertTrue(same(record, result), (record, result))
+
+    def test_aware_values(self):
+        moment = datetime(2024, 3, 10, 12, 30, tzinfo=ZoneInfo("America/New_York"))
+        at = time(9, 30, tzinfo=timezone(timedelta(hours=-5)))
+        (record,) = decode_records(encode_records([Record(primary_key="1", fields={"moment": moment, "at": at})]))
+        self.assertEqual(record.fields["moment"], moment)
+        self.assertEqual(record.fields["moment"].utcoffset(), timedelta(hours=-4))
+        self.assertEqual(record.fields["at"], at)
+        self.assertEqual(record.fields["at"].tzinfo, timezone(timedelta(hours=-5)))
+
+    def test_stream(self):
+        rng = random.Random(1)
+        batches = [[random_record(rng, i) for i in range(size)] for size in (5, 0, 12)]
+
+        stream = io.BytesIO()
+        encoder = RecordEncoder(stream)
+        written = sum(encoder.write(batch) for batch in batches)
+        self.assertEqual(len(stream.getvalue()), len(MAGIC) + written)
+
+        stream.seek(0)
+        self.assertEqual(list(RecordDecoder(stream, trusted=True)), batches)
+
+    def test_header(self):
+        records = [Record(primary_key=str(i), fields={"a_long_field_name": i}) for i in range(100)]
+        data = encode_records(records)
+        self.assertEqual(data.count(b"a_long_field_name"), 1)
+        # the magic and frame, the header, then the columns: a tag per row for the primary keys, and a byte per row for
+        # their lengths, their text, and a byte per small int, while the other columns have a single tag
+        self.assertLess(len(data), 100 + 100 * 4)
+
+    def test_validation(self):
+        invalid = [
+            (Record.from_trusted(primary_key="", fields={"a": 1}), ValueError),
+            (Record.from_trusted(primary_key="1", fields={}), ValueError),
+            (Record.from_trusted(primary_key="1", fields={"a": 1}, references={"a": 1}), TypeError),
+            (Record.from_trusted(primary_key="1", fields={"a": 1}, checkpoint=1.5), TypeError),
+            (Record.from_trusted(primary_key="1", fields={"a": 1}, drop=1), TypeError),
+        ]
+        valid = Record(primary_key="2", fields={"a": "x"}, checkpoint=1)
+        for record, error in invalid:
+            data = encode_records([valid, record])
+            with self.subTest(record=record):
+                # the Records the checks of the decoder reject are validated
+                with self.assertRaises(error):
+                    decode_records(data)
+                self.assertEqual(decode_records(data, trusted=True), [valid, record])
+
+    def test_invalid(self):
+        data = encode_records([Record(primary_key="1", fields={"a": "text"})])
+        unknown_tag = data[:-2] + b"\x7f" + data[-1:]
+        for invalid in [b"", b"JSON", data[:-1], data[:-3], data + b"\x00", unknown_tag]:
+            with self.subTest(data=invalid), self.assertRaises(ValueError):
+                decode_records(invalid)
+
+        with self.assertRaises(TypeError):
+            encode_records([Record.from_trusted(primary_key="1", fields={"a": [1]})])
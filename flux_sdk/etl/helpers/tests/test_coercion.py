@@ -0,0 +1,128 @@
+import unittest
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.data_models.schema import CustomObjectReference, Schema, SchemaDataType, SchemaField
+from flux_sdk.etl.helpers.coercion import RowCoercer, compile_converter
+
+SCHEMA = Schema(
+    name="invoice",
+    category_name="Billing",
+    category_description="Billing",
+    primary_key_field="id",
+    name_field="number",
+    last_modified_date_field="updated_at",
+    fields=[
+        SchemaField(name="id", data_type=SchemaDataType.String),
+        SchemaField(name="number", data_type=SchemaDataType.Integer),
+        SchemaField(name="total", data_type=SchemaDataType.Currency),
+        SchemaField(name="paid", data_type=SchemaDataType.Bool),
+        SchemaField(name="due", data_type=SchemaDataType.Date),
+        SchemaField(name="cutoff", data_type=SchemaDataType.Time),
+        SchemaField(name="updated_at", data_type=SchemaDataType.DateTime),
+        SchemaField(name="customer_id", data_type=SchemaDataType.String),
+    ],
+    references={"customer_id": CustomObjectReference(object="customer", lookup="id")},
+)
+
+COLUMNS = ["id", "number", "total", "paid", "due", "cutoff", "updated_at", "customer_id", "notes"]
+
+ID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+
+class TestCompileConverter(unittest.TestCase):
+    def test_converters(self):
+        cases = [
+            (SchemaDataType.String, b"caf\xc3\xa9", "café"),
+            (SchemaDataType.String, ID, str(ID)),
+            (SchemaDataType.MultiEnum, ["a", "b"], "a,b"),
+            (SchemaDataType.Integer, Decimal("42"), 42),
+            (SchemaDataType.Integer, "7", 7),
+            (SchemaDataType.Decimal, Decimal("1.2300"), "1.2300"),
+            (SchemaDataType.Percent, 0.5, 0.5),
+            (SchemaDataType.Bool, 1, True),
+            (SchemaDataType.Bool, "No", False),
+            (SchemaDataType.Date, datetime(2024, 1, 2, 3, 4), date(2024, 1, 2)),
+            (SchemaDataType.Date, "2024-01-02", date(2024, 1, 2)),
+            (SchemaDataType.Time, timedelta(hours=13, minutes=30), time(13, 30)),
+            (SchemaDataType.DateTime, datetime(2024, 1, 2), datetime(2024, 1, 2, tzinfo=timezone.utc)),
+            (SchemaDataType.DateTime, date(2024, 1, 2), datetime(2024, 1, 2, tzinfo=timezone.utc)),
+            (None, Decimal("1.5"), "1.5"),
+            (None, bytearray(b"raw"), "raw"),
+            (None, 3, 3),
+        ]
+        for data_type, value, expected in cases:
+            with self.subTest(data_type=data_type, value=value):
+                self.assertEqual(compile_converter(data_type)(value), expected)
+                self.assertIsNone(compile_converter(data_type)(None))
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            compile_converter(SchemaDataType.Integer)(Decimal("1.5"))
+        with self.assertRaises(ValueError):
+            compile_converter(SchemaDataType.Bool)("maybe")
+
+    def test_naive_timezone(self):
+        tz = timezone(timedelta(hours=-5))
+        self.assertEqual(compile_converter(SchemaDataType.DateTime, tz)(datetime(2024, 1, 2)).tzinfo, tz)
+
+
+class TestRowCoercer(unittest.TestCase):
+    def test_records(self):
+        coercer = RowCoercer(SCHEMA, COLUMNS)
+        rows = [
+            (ID, 1, Decimal("10.50"), 1, date(2024, 1, 31), time(17), datetime(2024, 1, 1), "customer_1", b"note"),
+            ("2", Decimal(2), None, 0, None, None, datetime(2024, 1, 2, tzinfo=timezone.utc), None, None),
+        ]
+
+        first, second = coercer.records(rows)
+        self.assertEqual(
+            first,
+            Record(
+                primary_key=str(ID),
+                fields={
+                    "id": str(ID),
+                    "number": 1,
+                    "total": "10.50",
+                    "paid": True,
+                    "due": date(2024, 1, 31),
+                    "cutoff": time(17),
+                    "updated_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    "customer_id": "customer_1",
+                    "notes": "note",
+                },
+                references={"customer_id": "customer_1"},
+                checkpoint=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            ),
+        )
+        self.assertIsNone(second.references)
+        self.assertEqual(second.fields["number"], 2)
+        self.assertEqual(coercer(rows[1]), second)
+
+    def test_checkpoint_field(self):
+        coercer = RowCoercer(SCHEMA, ["id", "number"], checkpoint_field="number")
+        self.assertEqual(coercer(("1", Decimal(5))).checkpoint, 5)
+        self.assertIsNone(RowCoercer(SCHEMA, ["id"]).records([("1",)])[0].checkpoint)
+
+    def test_trusted(self):
+        record = RowCoercer(SCHEMA, ["id", "extra"], trusted=True)(("1", ["not", "a", "field"]))
+        self.assertEqual(record.fields, {"id": "1", "extra": "not,a,field"})
+
+        with self.assertRaises(ValueError):
+            RowCoercer(SCHEMA, ["id", "extra"]).records([(None, 1)])
+
+    def test_invalid_columns(self):
+        with self.assertRaises(ValueError):
+            RowCoercer(SCHEMA, ["number"])
+        with self.assertRaises(ValueError):
+            RowCoercer(SCHEMA, ["id", "id"])
+        with self.assertRaises(ValueError):
+            RowCoercer(SCHEMA, ["id", "number"], checkpoint_field="updated_at")
+        with self.assertRaises(ValueError):
+            RowCoercer(SCHEMA, ["id", "number"]).records([("1",)])
+
+
+if __name__ == '__main__':
+    unittest.main()
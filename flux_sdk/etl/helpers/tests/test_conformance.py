@@ -0,0 +1,122 @@
+import unittest
+from datetime import date, datetime, time, timezone
+
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType, SchemaField
+from flux_sdk.etl.helpers.conformance import ConformanceChecker, check_conformance, compile_field_checker
+from flux_sdk.flux_core.validation import IssueCode
+
+SCHEMA = Schema(
+    name="invoice",
+    category_name="Invoices",
+    category_description="Invoices",
+    primary_key_field="id",
+    name_field="number",
+    fields=[
+        SchemaField(name="number", data_type=SchemaDataType.String, is_required=True, is_unique=True),
+        SchemaField(name="total", data_type=SchemaDataType.Currency),
+        SchemaField(
+            name="status",
+            data_type=SchemaDataType.Enum,
+            enum_values=["open", "paid"],
+            enum_restricted=True,
+        ),
+        SchemaField(name="tags", data_type=SchemaDataType.MultiEnum, enum_values=["a", "b"], enum_restricted=True),
+        SchemaField(name="due", data_type=SchemaDataType.Date),
+    ],
+)
+
+
+def invoice(i: int, **fields) -> Record:
+    return Record(
+        primary_key=str(i),
+        fields={"number": f"INV-{i}", "total": 10.5, "status": "open", "tags": "a", "due": date(2024, 1, 1), **fields},
+    )
+
+
+class TestCompileFieldChecker(unittest.TestCase):
+    def test_types(self):
+        cases = {
+            SchemaDataType.Bool: ([True], [1, "true"]),
+            SchemaDataType.Currency: ([1, 1.5, "12.30", "-1e3"], [True, "abc", "NaN", date(2024, 1, 1)]),
+            SchemaDataType.Date: ([date(2024, 1, 1)], [datetime(2024, 1, 1), "2024-01-01"]),
+            SchemaDataType.DateTime: ([datetime(2024, 1, 1, tzinfo=timezone.utc)], [date(2024, 1, 1)]),
+            SchemaDataType.Integer: ([1, -5], [True, 1.0, "1"]),
+            SchemaDataType.Time: ([time(9, 30)], ["09:30"]),
+            SchemaDataType.Email: (["a@b.com"], [1]),
+            SchemaDataType.Enum: (["anything"], [1]),
+        }
+        for data_type, (valid, invalid) in cases.items():
+            enum_values = ["x"] if data_type == SchemaDataType.Enum else None
+            check = compile_field_checker(SchemaField(name="f", data_type=data_type, enum_values=enum_values))
+            for value in valid:
+                with self.subTest(data_type=data_type, value=value):
+                    self.assertIsNone(check(value))
+            for value in invalid:
+                with self.subTest(data_type=data_type, value=value):
+                    self.assertEqual(check(value)[0], IssueCode.TYPE)
+
+    def test_enum_restricted(self):
+        check = compile_field_checker(SCHEMA.fields[2])
+        self.assertIsNone(check("paid"))
+        self.assertEqual(check("closed"), (IssueCode.INVALID, "one of the enum_values"))
+
+        check = compile_field_checker(SCHEMA.fields[3])
+        self.assertIsNone(check("a, b"))
+        self.assertEqual(check("a,c")[0], IssueCode.INVALID)
+
+
+class TestConformanceChecker(unittest.TestCase):
+    def test_conforming(self):
+        records = [invoice(i) for i in range(5)]
+        records.append(Record(primary_key="5", fields={"number": "INV-5", "extra": "x"}))
+        self.assertTrue(check_conformance(SCHEMA, records).ok)
+
+    def test_check(self):
+        records = [
+            invoice(0),
+            invoice(1, number=None),
+            invoice(2, total="lots", status="closed"),
+            invoice(3, number="INV-0"),
+            invoice(4, due="2024-01-01", total="abc"),
+            invoice(5, number=""),
+            invoice(6),
+        ]
+        del records[6].fields["number"]
+
+        report = check_conformance(SCHEMA, records)
+        self.assertEqual(report.total, 7)
+        self.assertEqual(report.invalid_rows, [1, 2, 3, 4, 5, 6])
+        errors = {(error.message, error.code): error.rows for error in report.errors}
+        self.assertEqual(
+            errors,
+            {
+                ("fields.number is required", IssueCode.REQUIRED): [1, 5, 6],
+                ("fields.total should be a number", IssueCode.TYPE): [2, 4],
+                ("fields.status should be one of the enum_values", IssueCode.INVALID): [2],
+                ("fields.number should be unique", IssueCode.INVALID): [3],
+                ("fields.due should be a date", IssueCode.TYPE): [4],
+            },
+        )
+
+    def test_unique_across_batches(self):
+        checker = ConformanceChecker(SCHEMA)
+        # the value of a Record which does not conform is not imported, so it can be used by a later one
+        first = [invoice(0), invoice(1, status="closed")]
+        self.assertEqual(checker.drop_nonconforming(first).invalid_rows, [1])
+
+        second = [invoice(2, number="INV-0"), invoice(3, number="INV-1"), invoice(4, number="INV-1")]
+        report = checker.drop_nonconforming(second)
+        self.assertEqual(report.invalid_rows, [0, 2])
+        self.assertEqual([record.drop for record in second], [True, None, True])
+
+        # a Record extracted again keeps its value
+        third = [invoice(0), invoice(3, number="INV-1"), invoice(5, number="INV-0")]
+        self.assertEqual(checker.drop_nonconforming(third).invalid_rows, [2])
+
+    def test_dropped_records(self):
+        records = [invoice(0, total="abc"), invoice(1, number="INV-0")]
+        records[0].drop = True
+        report = check_conformance(SCHEMA, records)
+        self.assertTrue(report.ok)
+        self.assertEqual(report.total, 2)
@@ -0,0 +1,152 @@
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from flux_sdk.etl.data_models.record import Checkpoint, Record
+from flux_sdk.etl.helpers.deduplication import BloomFilter, Deduplicator, drop_duplicates
+
+
+def record(primary_key: str, checkpoint: Optional[Checkpoint] = None, version: int = 0) -> Record:
+    return Record(primary_key=primary_key, fields={"version": version}, checkpoint=checkpoint)
+
+
+def kept(records: list[Record]) -> list[tuple]:
+    return [(r.primary_key, r.checkpoint, r.fields["version"]) for r in records if not r.drop]
+
+
+class TestBloomFilter(unittest.TestCase):
+    def test_membership(self):
+        bloom = BloomFilter(1_000, error_rate=0.01)
+        added = [f"key_{i}" for i in range(1_000)]
+        for key in added:
+            bloom.add(key)
+
+        self.assertTrue(all(key in bloom for key in added))
+        false_positives = sum(f"other_{i}" in bloom for i in range(10_000))
+        self.assertLess(false_positives, 300)
+
+    def test_invalid(self):
+        for capacity, error_rate in [(0, 0.01), (10, 0), (10, 1)]:
+            with self.subTest(capacity=capacity, error_rate=error_rate), self.assertRaises(ValueError):
+                BloomFilter(capacity, error_rate)
+
+
+class TestDeduplicator(unittest.TestCase):
+    def test_batch(self):
+        records = [
+            record("a", 1, version=1),
+            record("b", 5, version=1),
+            record("a", 3, version=2),
+            record("c", version=1),
+            record("a", 2, version=3),
+            record("b", 5, version=2),
+            record("c", version=2),
+            record("d", version=1),
+            record("d", 1, version=2),
+        ]
+        self.assertEqual(drop_duplicates(records), 5)
+        self.assertEqual(kept(records), [("b", 5, 1), ("a", 3, 2), ("c", None, 1), ("d", 1, 2)])
+
+    def test_already_dropped(self):
+        records = [record("a", 2, version=1), record("a", 1, version=2)]
+        records[0].drop = True
+        self.assertEqual(drop_duplicates(records), 0)
+        self.assertEqual(kept(records), [("a", 1, 2)])
+
+    def test_across_batches(self):
+        with Deduplicator() as deduplicator:
+            first = [record("a", 2), record("b", 2)]
+            self.assertEqual(deduplicator.drop_duplicates(first), 0)
+
+            second = [record("a", 2, version=1), record("b", 3, version=1), record("b", 1, version=2), record("c", 1)]
+            self.assertEqual(deduplicator.drop_duplicates(second), 2)
+            self.assertEqual(kept(second), [("b", 3, 1), ("c", 1, 0)])
+
+            third = [record("b", 3, version=2), record("a", 3, version=2)]
+            self.assertEqual(deduplicator.drop_duplicates(third), 1)
+            self.assertEqual(kept(third), [("a", 3, 2)])
+
+            self.assertEqual(deduplicator.duplicates, 3)
+            self.assertFalse(deduplicator.spilled)
+
+    def test_spill(self):
+        rng = random.Random(7)
+        batches = [
+            [record(f"key_{rng.randrange(3_000)}", rng.randrange(10), version=i) for i in range(500)] for _ in range(20)
+        ]
+
+        expected = {}
+        for batch in batches:
+            for r in batch:
+                if r.primary_key not in expected or r.checkpoint > expected[r.primary_key][0]:
+                    expected[r.primary_key] = (r.checkpoint, r)
+
+        with Deduplicator(max_keys=200) as deduplicator:
+            dropped = sum(deduplicator.drop_duplicates(batch) for batch in batches)
+            self.assertTrue(deduplicator.spilled)
+
+        loaded = {}
+        for batch in batches:
+            for r in batch:
+                if not r.drop:
+                    # a later Record only replaces a loaded one when its checkpoint is higher
+                    self.assertTrue(r.primary_key not in loaded or r.checkpoint > loaded[r.primary_key].checkpoint)
+                    loaded[r.primary_key] = r
+
+        self.assertEqual({key: r.checkpoint for key, r in loaded.items()}, {k: v[0] for k, v in expected.items()})
+        self.assertEqual(dropped, 10_000 - sum(not r.drop for batch in batches for r in batch))
+        for key, r in loaded.items():
+            self.assertIs(r, expected[key][1])
+
+    def test_filter_grows_with_spilled_keys(self):
+        with Deduplicator(max_keys=100) as deduplicator:
+            for start in range(0, 5_000, 101):
+                deduplicator.drop_duplicates([record(f"key_{i}", 1, version=1) for i in range(start, start + 101)])
+
+            # a single filter for every spilled key, so the false positive rate does not grow with the spills
+            bloom = deduplicator._bloom
+            assert bloom is not None
+            self.assertGreaterEqual(bloom.capacity, 5_000)
+            self.assertTrue(all(f"key_{i}" in bloom for i in range(5_000)))
+            self.assertLess(sum(f"other_{i}" in bloom for i in range(10_000)), 300)
+
+    def test_spilled_checkpoints(self):
+        checkpoints = {
+            "naive": datetime(2024, 1, 2, 3, 4, 5, 6),
+            "aware": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=-5))),
+            "int": 2**70,
+            "str": "0005|x",
+            "none": None,
+        }
+        with Deduplicator(max_keys=1) as deduplicator:
+            deduplicator.drop_duplicates([record(key, checkpoint) for key, checkpoint in checkpoints.items()])
+            self.assertTrue(deduplicator.spilled)
+
+            # the spilled checkpoints are read back with their types, so equal ones are duplicates
+            same = [record(key, checkpoint, version=1) for key, checkpoint in checkpoints.items()]
+            self.assertEqual(deduplicator.drop_duplicates(same), 5)
+
+            newer = [
+                record("naive", datetime(2024, 1, 2, 3, 4, 5, 7), version=2),
+                record("aware", datetime(2024, 1, 2, 8, 4, 6, tzinfo=timezone.utc), version=2),
+                record("int", 2**70 + 1, version=2),
+                record("str", "0005|y", version=2),
+            ]
+            self.assertEqual(deduplicator.drop_duplicates(newer), 0)
+
+    def test_spill_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/keys.db"
+            with Deduplicator(max_keys=1, spill_path=path) as deduplicator:
+                deduplicator.drop_duplicates([record("a", 5), record("b", 5)])
+                self.assertTrue(deduplicator.spilled)
+
+            # the keys spilled by an earlier Deduplicator are not duplicates
+            with Deduplicator(max_keys=1, spill_path=path) as deduplicator:
+                self.assertEqual(deduplicator.drop_duplicates([record("c", 1), record("a", 1), record("b", 1)]), 0)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Deduplicator(max_keys=0)
@@ -0,0 +1,83 @@
+import sqlite3
+import unittest
+
+from flux_sdk.etl.data_models.query import SQLQuery
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.etl.helpers.pagination import KeysetPaginator, record_position, walk_pages
+
+
+class TestKeysetPagination(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE items (id TEXT PRIMARY KEY, updated_at INTEGER NOT NULL, name TEXT)")
+        self.connection.execute("CREATE INDEX items_keyset ON items (updated_at, id)")
+        # many rows share a checkpoint, so pages have to break ties on the primary key
+        self.connection.executemany(
+            "INSERT INTO items VALUES (?, ?, ?)", [(f"item_{i:03d}", i % 10, f"name_{i}") for i in range(95)]
+        )
+        self.expected = self.connection.execute("SELECT id, updated_at FROM items ORDER BY updated_at, id").fetchall()
+        self.paginator = KeysetPaginator(
+            SQLQuery(text="SELECT id, updated_at FROM items WHERE name != @excluded;", args={"excluded": "name_4"}),
+            checkpoint_column="updated_at",
+            primary_key_column="id",
+            page_size=7,
+        )
+        self.expected.remove(("item_004", 4))
+
+    def run_query(self, query: SQLQuery) -> list[tuple]:
+        return self.connection.execute(*query.bind("named")).fetchall()
+
+    def fetch(self, query: SQLQuery) -> list[Record]:
+        return [Record(primary_key=key, fields={"id": key}, checkpoint=ck) for key, ck in self.run_query(query)]
+
+    def test_walk(self):
+        pages = list(walk_pages(self.paginator, self.fetch))
+
+        self.assertEqual([len(page.rows) for page in pages], [7] * 13 + [3])
+        rows = [(record.primary_key, record.checkpoint) for page in pages for record in page.rows]
+        self.assertEqual(rows, self.expected)
+        self.assertEqual(pages[-1].after, (9, "item_089"))
+
+    def test_resume(self):
+        # as if the sync crashed after loading five pages
+        loaded = list(walk_pages(self.paginator, self.fetch))[:5]
+        read = [record.primary_key for page in loaded for record in page.rows]
+
+        resumed = walk_pages(self.paginator, self.fetch, after=loaded[-1].after)
+        read.extend(record.primary_key for page in resumed for record in page.rows)
+        self.assertEqual(read, [key for key, _ in self.expected])
+
+    def test_raw_rows_and_checkpoint(self):
+        pages = list(walk_pages(self.paginator, self.run_query, position=lambda row: (row[1], row[0]), checkpoint=8))
+        self.assertEqual([row for page in pages for row in page.rows], [row for row in self.expected if row[1] >= 8])
+
+    def test_empty(self):
+        self.connection.execute("DELETE FROM items")
+        pages = list(walk_pages(self.paginator, self.fetch, after=(3, "x")))
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(pages[0].after, (3, "x"))
+
+    def test_query_checkpoint_arg(self):
+        # the name SQLQuery.args suggests for a checkpoint does not collide with the args of the pages
+        query = SQLQuery(text="SELECT id, updated_at FROM items WHERE updated_at < @checkpoint", args={"checkpoint": 9})
+        paginator = KeysetPaginator(query, checkpoint_column="updated_at", primary_key_column="id", page_size=7)
+        pages = list(walk_pages(paginator, self.fetch, checkpoint=7))
+        self.assertEqual({record.checkpoint for page in pages for record in page.rows}, {7, 8})
+
+    def test_uses_index(self):
+        query = self.paginator.page(after=(5, "item_015"))
+        text, args = query.bind("named")
+        plan = self.connection.execute("EXPLAIN QUERY PLAN " + text, args)
+        self.assertIn("USING INDEX items_keyset", str(plan.fetchall()))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            KeysetPaginator(SQLQuery(text="SELECT 1"), "a", "b", page_size=0)
+        with self.assertRaises(ValueError):
+            KeysetPaginator(SQLQuery(text="SELECT 1", args={"flux_after_key": "x"}), "a", "b")
+        with self.assertRaises(ValueError):
+            record_position(Record(primary_key="item_001", fields={"id": "item_001"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+import sqlite3
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+from flux_sdk.etl.capabilities.single_object_import.interface import SingleObjectImport
+from flux_sdk.etl.data_models.query import Connector, MongoQuery, Query, SQLQuery
+from flux_sdk.etl.data_models.record import Checkpoint, CheckpointTracker, Record
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType, SchemaField
+from flux_sdk.etl.helpers.partitioning import (
+    Partition,
+    combine_checkpoints,
+    partition_mongo,
+    partition_sql,
+    partitions_from_boundaries,
+    prepare_queries,
+    split_range,
+    split_sample,
+)
+
+SCHEMA = Schema(
+    name="item",
+    category_name="Items",
+    category_description="Items",
+    primary_key_field="id",
+    name_field="name",
+    fields=[
+        SchemaField(name="id", data_type=SchemaDataType.Integer),
+        SchemaField(name="name", data_type=SchemaDataType.String),
+    ],
+)
+
+START = datetime(2024, 1, 1)
+
+
+class SQLiteHarness:
+    """
+    An in-memory table of items, with gaps in the ids and without an updated_at for one in ten, for running the SQLQuery
+    of each partition.
+    """
+
+    def __init__(self, count: int = 1000):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, updated_at TEXT)")
+        self.connection.executemany(
+            "INSERT INTO items VALUES (?, ?, ?)",
+            [
+                (
+                    i * 7 + i % 5,
+                    f"item_{i:04d}",
+                    (START + timedelta(minutes=i * 13 % 997)).isoformat() if i % 10 else None,
+                )
+                for i in range(count)
+            ],
+        )
+
+    def run(self, query: SQLQuery) -> list[tuple]:
+        return self.connection.execute(*query.bind("named")).fetchall()
+
+
+class TestPartitions(unittest.TestCase):
+    def assertDisjointAndComplete(self, partitions: list[Partition], values: list):
+        for value in values:
+            self.assertEqual(sum(value in partition for partition in partitions), 1, value)
+
+    def test_split_range(self):
+        partitions = split_range(0, 99, 4)
+        self.assertEqual([(p.lower, p.upper) for p in partitions], [(None, 25), (25, 50), (50, 75), (75, None)])
+        self.assertDisjointAndComplete(partitions, list(range(-10, 110)))
+
+        self.assertEqual(len(split_range(0, 2, 10)), 3)
+        self.assertEqual(len(split_range(5, 5, 3)), 1)
+
+        dates = split_range(START, START + timedelta(days=4), 4)
+        self.assertEqual(dates[1].lower, START + timedelta(days=1))
+
+        with self.assertRaises(ValueError):
+            split_range(0, 10, 0)
+        with self.assertRaises(ValueError):
+            split_range(10, 0, 2)
+
+    def test_split_sample(self):
+        sample = [f"key_{i:03d}" for i in range(100)]
+        partitions = split_sample(reversed(sample), 4)
+        self.assertEqual([p.lower for p in partitions], [None, "key_025", "key_050", "key_075"])
+        self.assertDisjointAndComplete(partitions, sample + ["a", "z"])
+
+        self.assertEqual(len(split_sample([], 4)), 1)
+        self.assertEqual(len(split_sample(["a"] * 10, 4)), 1)
+
+    def test_partitions_from_boundaries(self):
+        self.assertEqual(partitions_from_boundaries([]), [Partition()])
+
+    def test_null(self):
+        self.assertDisjointAndComplete(split_range(0, 99, 4), [None])
+
+
+class TestPartitionSQL(unittest.TestCase):
+    def setUp(self):
+        self.harness = SQLiteHarness()
+        self.query = SQLQuery(
+            text="SELECT id, name, updated_at FROM items WHERE name != @excluded;", args={"excluded": "item_0003"}
+        )
+        self.expected = Counter(self.harness.run(self.query))
+
+    def assertPartitionsMatch(self, queries: list[SQLQuery]):
+        rows = [row for query in queries for row in self.harness.run(query)]
+        # complete: every row is extracted, and disjoint: no row is extracted twice
+        self.assertEqual(Counter(rows), self.expected)
+        self.assertEqual(len(rows), sum(self.expected.values()))
+
+    def test_keyspace(self):
+        low, high = self.harness.connection.execute("SELECT MIN(id), MAX(id) FROM items").fetchone()
+        # the bounds are deliberately narrower than the table, the outer partitions are unbounded
+        queries = partition_sql(self.query, "id", split_range(low + 100, high - 100, 8))
+        self.assertEqual(len(queries), 8)
+        self.assertPartitionsMatch(queries)
+        self.assertTrue(all(self.harness.run(query) for query in queries))
+
+    def test_checkpoint_range(self):
+        rows = self.harness.connection.execute("SELECT updated_at FROM items WHERE updated_at IS NOT NULL LIMIT 50")
+        sample = [row[0] for row in rows]
+        self.assertIn((None,), self.harness.connection.execute("SELECT updated_at FROM items").fetchall())
+        self.assertPartitionsMatch(partition_sql(self.query, "updated_at", split_sample(sample, 5)))
+
+    def test_single_partition(self):
+        queries = partition_sql(self.query, "id", split_range(0, 0, 1))
+        self.assertEqual(queries[0].args, {"excluded": "item_0003"})
+        self.assertPartitionsMatch(queries)
+
+    def test_reserved_args(self):
+        with self.assertRaises(ValueError):
+            partition_sql(SQLQuery(text="SELECT 1", args={"partition_lower": 1}), "id", [Partition()])
+
+
+class TestPartitionMongo(unittest.TestCase):
+    def test_filter(self):
+        query = MongoQuery(collection="items", filter={"active": True}, projection={"name": 1})
+        first, second = partition_mongo(query, "_id", partitions_from_boundaries(["m"]))
+
+        self.assertEqual(first.filter, {"$and": [{"active": True}, {"$or": [{"_id": {"$lt": "m"}}, {"_id": None}]}]})
+        self.assertEqual(second.filter, {"$and": [{"active": True}, {"_id": {"$gte": "m"}}]})
+        self.assertEqual(second.projection, {"name": 1})
+
+        only, = partition_mongo(MongoQuery(collection="items"), "_id", [Partition()])
+        self.assertIsNone(only.filter)
+
+    def test_aggregate(self):
+        query = MongoQuery(collection="items", aggregate=[{"$project": {"name": 1}}])
+        first, _ = partition_mongo(query, "n", partitions_from_boundaries([10]))
+
+        self.assertIsNone(first.filter)
+        self.assertEqual(
+            first.aggregate, [{"$match": {"$or": [{"n": {"$lt": 10}}, {"n": None}]}}, {"$project": {"name": 1}}]
+        )
+
+
+class ItemImport(SingleObjectImport):
+    @staticmethod
+    def get_schema() -> Schema:
+        return SCHEMA
+
+    @staticmethod
+    def prepare_query(connector: Connector, schema: Schema, checkpoint: Optional[Checkpoint]) -> Query:
+        return SQLQuery(text="SELECT id, name FROM items")
+
+    @staticmethod
+    def process_records(schema: Schema, records: list[Record]) -> list[Record]:
+        return records
+
+
+class PartitionedItemImport(ItemImport):
+    @staticmethod
+    def prepare_partitioned_query(
+        connector: Connector, schema: Schema, checkpoint: Optional[Checkpoint], partitions: int
+    ) -> Sequence[Query]:
+        query = ItemImport.prepare_query(connector, schema, checkpoint)
+        assert isinstance(query, SQLQuery)
+        return partition_sql(query, "id", split_range(0, 10_000, partitions))
+
+
+class TestPrepareQueries(unittest.TestCase):
+    def test_prepare_queries(self):
+        self.assertEqual(len(prepare_queries(ItemImport, Connector.SQL, SCHEMA, None, 4)), 1)
+        self.assertEqual(len(prepare_queries(PartitionedItemImport, Connector.SQL, SCHEMA, None, 4)), 4)
+        self.assertEqual(len(prepare_queries(PartitionedItemImport, Connector.SQL, SCHEMA, None, 1)), 1)
+
+    def test_combine_checkpoints(self):
+        trackers = [CheckpointTracker() for _ in range(3)]
+        trackers[0].add(START)
+        trackers[1].add(START + timedelta(days=2))
+
+        self.assertEqual(combine_checkpoints(trackers), START + timedelta(days=2))
+        self.assertIsNone(combine_checkpoints([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from typing import Optional
+
+from flux_sdk.etl.capabilities.single_object_import.interface import SingleObjectImport
+from flux_sdk.etl.data_models.query import Connector, Query, SQLQuery
+from flux_sdk.etl.data_models.record import Checkpoint, Record
+from flux_sdk.etl.data_models.record_batch import RecordBatch
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType, SchemaField
+from flux_sdk.etl.helpers.processing import implements_hook, process
+
+SCHEMA = Schema(
+    name="item",
+    category_name="Items",
+    category_description="Items",
+    primary_key_field="id",
+    name_field="name",
+    fields=[
+        SchemaField(name="id", data_type=SchemaDataType.String),
+        SchemaField(name="name", data_type=SchemaDataType.String),
+    ],
+)
+
+
+class RowImport(SingleObjectImport):
+    @staticmethod
+    def get_schema() -> Schema:
+        return SCHEMA
+
+    @staticmethod
+    def prepare_query(connector: Connector, schema: Schema, checkpoint: Optional[Checkpoint]) -> Query:
+        return SQLQuery(text="SELECT id, name FROM items")
+
+    @staticmethod
+    def process_records(schema: Schema, records: list[Record]) -> list[Record]:
+        for record in records:
+            record.fields["name"] = str(record.fields["name"]).title()
+        return records
+
+
+class BatchImport(RowImport):
+    @staticmethod
+    def process_record_batch(schema: Schema, batch: RecordBatch) -> RecordBatch:
+        batch.columns["name"] = [str(name).upper() for name in batch.columns["name"]]
+        batch.drop = [not name for name in batch.columns["name"]]
+        return batch
+
+
+class TestProcess(unittest.TestCase):
+    def records(self) -> list[Record]:
+        return [Record(primary_key=str(i), fields={"id": str(i), "name": name}) for i, name in enumerate(["ab", ""])]
+
+    def test_implements_hook(self):
+        self.assertFalse(implements_hook(RowImport, "process_record_batch"))
+        self.assertTrue(implements_hook(BatchImport, "process_record_batch"))
+
+        with self.assertRaises(NotImplementedError):
+            RowImport.process_record_batch(SCHEMA, RecordBatch.from_records([]))
+
+    def test_process_records(self):
+        self.assertEqual([r.fields["name"] for r in process(RowImport, SCHEMA, self.records())], ["Ab", ""])
+
+    def test_prefers_process_record_batch(self):
+        records = process(BatchImport, SCHEMA, self.records())
+        self.assertEqual([r.fields["name"] for r in records], ["AB", ""])
+        self.assertEqual([r.drop for r in records], [False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
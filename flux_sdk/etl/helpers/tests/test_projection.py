@@ -0,0 +1,107 @@
+import sqlite3
+import unittest
+from dataclasses import replace
+
+from flux_sdk.etl.data_models.query import MongoQuery, SQLQuery
+from flux_sdk.etl.data_models.schema import (
+    CustomObjectReference,
+    EmployeeLookup,
+    EmployeeReference,
+    Schema,
+    SchemaDataType,
+    SchemaField,
+)
+from flux_sdk.etl.helpers.projection import project_mongo, project_sql, schema_columns
+
+SCHEMA = Schema(
+    name="invoice",
+    category_name="Billing",
+    category_description="Billing",
+    primary_key_field="id",
+    name_field="number",
+    fields=[
+        SchemaField(name="number", data_type=SchemaDataType.String),
+        SchemaField(name="total", data_type=SchemaDataType.Currency),
+    ],
+    references={"customer_id": CustomObjectReference(object="customer", lookup="id")},
+    owner=("owner_email", EmployeeReference(lookup=EmployeeLookup.WORK_EMAIL)),
+    created_date_field="created_at",
+    last_modified_date_field="updated_at",
+)
+
+COLUMNS = ["id", "number", "total", "customer_id", "owner_email", "created_at", "updated_at"]
+
+
+class TestSchemaColumns(unittest.TestCase):
+    def test_schema_columns(self):
+        self.assertEqual(schema_columns(SCHEMA), COLUMNS)
+
+
+class TestProjectSQL(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            "CREATE TABLE invoices (id TEXT, number TEXT, total REAL, customer_id TEXT, owner_email TEXT, "
+            "created_at TEXT, updated_at TEXT, notes TEXT, attachment BLOB)"
+        )
+        self.connection.execute("INSERT INTO invoices VALUES ('1', 'A-1', 9.5, 'c', 'o@x.com', 'd', 'd', 'n', x'00')")
+
+    def columns(self, query: SQLQuery) -> list[str]:
+        cursor = self.connection.execute(*query.bind("named"))
+        return [column[0] for column in cursor.description]
+
+    def test_select_star(self):
+        query = SQLQuery(text="select *  from invoices WHERE total > @minimum;", args={"minimum": 1})
+        query = project_sql(query, SCHEMA)
+
+        self.assertEqual(query.text, f"SELECT {', '.join(COLUMNS)} FROM invoices WHERE total > @minimum")
+        self.assertEqual(query.args, {"minimum": 1})
+        self.assertEqual(self.columns(query), COLUMNS)
+
+    def test_sub_query(self):
+        query = project_sql(SQLQuery(text="SELECT i.*, 1 AS extra FROM invoices i"), SCHEMA)
+        self.assertTrue(query.text.endswith("FROM (SELECT i.*, 1 AS extra FROM invoices i) AS flux_projection"))
+        self.assertEqual(self.columns(query), COLUMNS)
+
+    def test_quote(self):
+        with self.assertRaises(ValueError):
+            project_sql(SQLQuery(text="SELECT * FROM t"), replace(SCHEMA, name_field="the name"))
+
+        query = project_sql(SQLQuery(text="SELECT * FROM invoices"), SCHEMA, quote=lambda name: f'"{name}"')
+        self.assertTrue(query.text.startswith('SELECT "id", "number"'))
+        self.assertEqual(self.columns(query), COLUMNS)
+
+
+class TestProjectMongo(unittest.TestCase):
+    def test_find(self):
+        query = MongoQuery(
+            collection="invoices", filter={"paid": False}, projection={"total": {"$round": ["$total", 2]}}
+        )
+        projected = project_mongo(query, SCHEMA)
+
+        self.assertEqual(projected.filter, {"paid": False})
+        self.assertEqual(
+            projected.projection,
+            {
+                "id": 1,
+                "number": 1,
+                "total": {"$round": ["$total", 2]},
+                "customer_id": 1,
+                "owner_email": 1,
+                "created_at": 1,
+                "updated_at": 1,
+                "_id": 0,
+            },
+        )
+
+    def test_aggregate(self):
+        schema = replace(SCHEMA, primary_key_field="_id")
+        projected = project_mongo(MongoQuery(collection="invoices", aggregate=[{"$match": {"paid": False}}]), schema)
+
+        self.assertEqual(projected.aggregate[0], {"$match": {"paid": False}})
+        self.assertEqual(projected.aggregate[1]["$project"]["_id"], 1)
+        self.assertIsNone(projected.projection)
+
+
+if __name__ == '__main__':
+    unittest.main()
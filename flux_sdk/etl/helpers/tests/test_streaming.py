@@ -0,0 +1,114 @@
+import unittest
+from collections.abc import Iterator
+from typing import Optional
+
+from flux_sdk.etl.capabilities.single_object_import.interface import SingleObjectImport
+from flux_sdk.etl.data_models.query import Connector, Query, SQLQuery
+from flux_sdk.etl.data_models.record import Checkpoint, Record
+from flux_sdk.etl.data_models.schema import Schema, SchemaDataType, SchemaField
+from flux_sdk.etl.helpers.streaming import process_stream, run_stream
+
+SCHEMA = Schema(
+    name="item",
+    category_name="Items",
+    category_description="Items",
+    primary_key_field="id",
+    name_field="id",
+    fields=[SchemaField(name="id", data_type=SchemaDataType.Integer)],
+)
+
+
+def _id(record: Record) -> int:
+    value = record.fields["id"]
+    assert isinstance(value, int)
+    return value
+
+
+class BatchImport(SingleObjectImport):
+    @staticmethod
+    def get_schema() -> Schema:
+        return SCHEMA
+
+    @staticmethod
+    def prepare_query(connector: Connector, schema: Schema, checkpoint: Optional[Checkpoint]) -> Query:
+        return SQLQuery(text="SELECT id FROM items")
+
+    @staticmethod
+    def process_records(schema: Schema, records: list[Record]) -> list[Record]:
+        for record in records:
+            record.drop = _id(record) % 3 == 0
+        return records
+
+
+class StreamImport(BatchImport):
+    consumed = 0
+
+    @staticmethod
+    def process_record_stream(schema: Schema, records: Iterator[Record]) -> Iterator[Record]:
+        for record in records:
+            StreamImport.consumed += 1
+            record.checkpoint = _id(record)
+            yield record
+
+
+def _records(count: int, produced: Optional[list[int]] = None) -> Iterator[Record]:
+    for i in range(count):
+        if produced is not None:
+            produced[0] += 1
+        yield Record(primary_key=str(i), fields={"id": i})
+
+
+class TestRunStream(unittest.TestCase):
+    def test_process_stream_falls_back_to_batches(self):
+        records = list(process_stream(BatchImport, SCHEMA, _records(10), batch_size=4))
+        self.assertEqual([r.primary_key for r in records], [str(i) for i in range(10)])
+        self.assertEqual([r.drop for r in records[:4]], [True, False, False, True])
+
+    def test_batches(self):
+        loaded = []
+        stats = run_stream(BatchImport, SCHEMA, _records(25), loaded.append, buffer_size=3, batch_size=10)
+
+        self.assertEqual([len(batch) for batch in loaded], [10, 10, 5])
+        self.assertEqual([r.fields["id"] for batch in loaded for r in batch], list(range(25)))
+        self.assertEqual((stats.extracted, stats.loaded, stats.dropped, stats.batches), (25, 25, 9, 3))
+
+    def test_backpressure(self):
+        produced = [0]
+        leads = []
+        StreamImport.consumed = 0
+
+        def load(batch):
+            leads.append(produced[0] - StreamImport.consumed)
+
+        stats = run_stream(StreamImport, SCHEMA, _records(500, produced), load, buffer_size=5, batch_size=1)
+
+        self.assertEqual(stats.loaded, 500)
+        self.assertEqual(stats.checkpoints.highest, 499)
+        # at most a full buffer, plus the record being put by the extractor, is ahead of processing
+        self.assertLessEqual(max(leads), 5 + 1)
+
+    def test_extraction_error(self):
+        def records():
+            yield from _records(5)
+            raise RuntimeError("connection lost")
+
+        with self.assertRaisesRegex(RuntimeError, "connection lost"):
+            run_stream(BatchImport, SCHEMA, records(), lambda batch: None, batch_size=2)
+
+    def test_load_error_stops_extraction(self):
+        produced = [0]
+
+        def load(batch):
+            raise RuntimeError("load failed")
+
+        with self.assertRaisesRegex(RuntimeError, "load failed"):
+            run_stream(BatchImport, SCHEMA, _records(100_000, produced), load, buffer_size=10, batch_size=5)
+        self.assertLess(produced[0], 100)
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            run_stream(BatchImport, SCHEMA, [], lambda batch: None, buffer_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
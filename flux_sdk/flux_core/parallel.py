@@ -0,0 +1,170 @@
+import itertools
+import math
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Optional, Sequence, Type
+
+from flux_sdk.flux_core.validation import (
+    FieldError,
+    ValidationReport,
+    batch_columns,
+    field_rules,
+    validate_batch,
+    validate_columns,
+)
+
+PARALLEL_THRESHOLD = 50_000
+"""
+Below this number of rows, starting the pool costs more than validating them in-process. Validating a Record costs 2us
+(1 field) to 4us (20 fields) in-process, and a forked worker does about 1.5x that work, since the pages of the rows it
+reads are copied on write. Forking 4 workers costs 10ms from a small process, but 150ms from a process holding 1GB of
+rows, so the crossover with 4 workers is between 5k and 50k rows.
+"""
+
+MIN_SHARD_SIZE = 10_000
+"""The smallest shard sent to a worker, so each task does enough work to amortize its pickling."""
+
+
+def validate_batch_parallel(
+    cls: Type,
+    rows: Sequence[Any],
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    shard_size: Optional[int] = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> ValidationReport:
+    """
+    The equivalent of validate_batch which shards a large batch across a process pool, and merges the reports of the
+    shards back into the report validate_batch would have returned, with row indices in the original batch.
+
+    Where processes are forked (eg: on Linux), the pool started for this batch inherits the rows, so each worker splits
+    its own slice into columns and nothing but the reports is pickled. An existing executor is sent the values of the
+    fields with a FieldRule instead (one list per column, with the mappings flattened into their keys and a list of
+    values), which the parent process collects and pickles serially: for 20 fields per Record, that costs about as much
+    as validating the rows in-process, so an existing executor only pays off for models cheaper to pickle than to check.
+
+    Batches smaller than threshold, or runs with a single worker, are validated in-process. Since the workers check
+    copies of the values, the nested @validated instances constructed without validation are still not known to be
+    validated (see is_validated) in this process.
+
+    :param executor: An existing pool to submit the shards to, rather than starting (and stopping) one for this batch.
+    :param max_workers: The number of processes to start when no executor is given, defaults to the number of CPUs.
+    :param shard_size: The number of rows per task, defaults to about 4 tasks per worker (at least MIN_SHARD_SIZE).
+    :param threshold: The number of rows from which the batch is validated in parallel.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if len(rows) < threshold or (executor is None and workers == 1):
+        return validate_batch(cls, rows)
+
+    if shard_size is None:
+        shard_size = max(MIN_SHARD_SIZE, math.ceil(len(rows) / (workers * 4)))
+    elif shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+
+    starts = range(0, len(rows), shard_size)
+    if executor is None and _FORK is not None:
+        token = next(_tokens)
+        _inherited[token] = rows
+        try:
+            # the workers are forked on the first submission, after the rows were registered
+            with ProcessPoolExecutor(max_workers=min(workers, len(starts)), mp_context=_FORK) as pool:
+                stops = [start + shard_size for start in starts]
+                reports = pool.map(_validate_inherited, itertools.repeat(cls), itertools.repeat(token), starts, stops)
+                return merge_reports(cls, list(reports))
+        finally:
+            del _inherited[token]
+
+    columns = batch_columns(cls, rows)
+    shards = [[_flatten(column[start:start + shard_size]) for column in columns] for start in starts]
+
+    if executor is not None:
+        return merge_reports(cls, list(executor.map(_validate_shard, itertools.repeat(cls), shards)))
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+        return merge_reports(cls, list(pool.map(_validate_shard, itertools.repeat(cls), shards)))
+
+
+def merge_reports(cls: Type, reports: Sequence[ValidationReport]) -> ValidationReport:
+    """
+    Merge the reports of consecutive shards of a batch, in order, into the report of the whole batch. The row indices of
+    each shard are offset by the totals of the shards before it, and errors are grouped as validate_batch groups them.
+    """
+    merged: dict[str, dict[Any, FieldError]] = {rule.attr: {} for rule in field_rules(cls)}
+    offset = 0
+    for report in reports:
+        for error in report.errors:
+            errors = merged.setdefault(error.attr, {})
+            key = (error.code, error.message)
+            target = errors.get(key)
+            if target is None:
+                target = errors[key] = FieldError(attr=error.attr, message=error.message, code=error.code)
+            target.rows.extend(row + offset for row in error.rows)
+        offset += report.total
+
+    return ValidationReport(total=offset, errors=[error for errors in merged.values() for error in errors.values()])
+
+
+_FORK = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+_tokens = itertools.count()
+_inherited: dict[int, Sequence[Any]] = {}
+"""The batches being validated by a forked pool, which the workers inherit rather than unpickle."""
+
+
+def _validate_inherited(cls: Type, token: int, start: int, stop: int) -> ValidationReport:
+    return validate_batch(cls, _inherited[token][start:stop])
+
+
+class _FlatMappings:
+    """
+    A column of mappings, flattened into the distinct key layouts and a single list of values, which is much cheaper to
+    pickle than the dicts themselves. Values other than dicts (eg: None, or an invalid value) are kept as they are,
+    while subclasses of dict are shipped as plain dicts.
+    """
+
+    def __init__(self, layouts: list[tuple], rows: list[int], values: list[Any]):
+        self.layouts = layouts
+        """The distinct keys of the dicts, in order."""
+        self.rows = rows
+        """For each row, the index of its layout, or -1 when its value is not a dict."""
+        self.values = values
+        """The values of each row, in order: those of its dict, or the value itself."""
+
+    def expand(self) -> list[Any]:
+        column = []
+        position = 0
+        for layout in self.rows:
+            if layout < 0:
+                column.append(self.values[position])
+                position += 1
+            else:
+                keys = self.layouts[layout]
+                column.append(dict(zip(keys, self.values[position:position + len(keys)])))
+                position += len(keys)
+        return column
+
+
+def _flatten(column: list[Any]) -> Any:
+    if not any(isinstance(value, dict) for value in column):
+        return column
+
+    layouts: dict[tuple, int] = {}
+    rows = []
+    values: list[Any] = []
+    for value in column:
+        if isinstance(value, dict):
+            keys = tuple(value)
+            layout = layouts.get(keys)
+            if layout is None:
+                layout = layouts[keys] = len(layouts)
+            rows.append(layout)
+            values.extend(value.values())
+        else:
+            rows.append(-1)
+            values.append(value)
+    return _FlatMappings(list(layouts), rows, values)
+
+
+def _validate_shard(cls: Type, shard: list[Any]) -> ValidationReport:
+    return validate_columns(cls, [column.expand() if isinstance(column, _FlatMappings) else column for column in shard])
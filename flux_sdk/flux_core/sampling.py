@@ -0,0 +1,87 @@
+import random
+from typing import Any, Optional
+
+from flux_sdk.flux_core.validation import ValidationPolicy, shape_of
+
+
+class SamplingPolicy(ValidationPolicy):
+    """
+    A ValidationPolicy for high-volume syncs from a trusted source. Every instance whose shape (see shape_of) has not
+    been seen before is validated, so schema drift such as a new field is still detected, while instances with a known
+    shape are only validated every Nth time and/or with a random probability. A value of a known field with another type
+    is only caught when its instance is sampled.
+
+    Use it through validation_policy:
+
+    ```python
+    policy = SamplingPolicy(every=100)
+    with validation_policy(policy):
+        records = [Record(primary_key=row["id"], fields=row) for row in rows]
+    print(policy.checked, policy.skipped)
+    ```
+    """
+
+    def __init__(
+        self,
+        every: Optional[int] = None,
+        fraction: Optional[float] = None,
+        seed: Optional[int] = None,
+        max_shapes: int = 10_000,
+    ):
+        """
+        :param every: Validate every Nth instance with a known shape.
+        :param fraction: Validate this random fraction (0.0 - 1.0) of the instances with a known shape.
+        :param seed: Seeds the random sampling, to make it reproducible.
+        :param max_shapes: Bounds the number of remembered shapes. Once reached, further new shapes are still validated
+        but are not remembered, so they will be validated every time.
+        """
+        if every is not None and every < 1:
+            raise ValueError("every must be at least 1")
+        if fraction is not None and not 0.0 <= fraction <= 1.0:
+            raise ValueError("fraction must be between 0.0 and 1.0")
+
+        self.every = every
+        self.fraction = fraction
+        self.max_shapes = max_shapes
+        self._random = random.Random(seed)
+        self._shapes: set[tuple] = set()
+        self._pending: Optional[tuple] = None
+
+        self.seen = 0
+        """The number of instances constructed under this policy."""
+
+        self.checked = 0
+        """The number of instances which were fully validated."""
+
+        self.new_shapes = 0
+        """The number of instances validated because their shape had not been seen before."""
+
+    @property
+    def skipped(self) -> int:
+        """The number of instances which were not validated."""
+        return self.seen - self.checked
+
+    def should_validate(self, obj: Any) -> bool:
+        self.seen += 1
+        # an instance which failed validation never reached passed(), so its shape must not be left pending
+        self._pending = None
+
+        shape = shape_of(obj)
+        if shape not in self._shapes:
+            # only remembered once validation passes, so that a bad shape keeps failing
+            self._pending = shape
+            self.new_shapes += 1
+        elif not (
+            (self.every is not None and self.seen % self.every == 0)
+            or (self.fraction is not None and self._random.random() < self.fraction)
+        ):
+            return False
+
+        self.checked += 1
+        return True
+
+    def passed(self, obj: Any):
+        if self._pending is not None:
+            if len(self._shapes) < self.max_shapes:
+                self._shapes.add(self._pending)
+            self._pending = None
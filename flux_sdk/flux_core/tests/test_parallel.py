@@ -0,0 +1,76 @@
+import unittest
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+
+from flux_sdk.etl.data_models.record import Record
+from flux_sdk.flux_core import parallel
+from flux_sdk.flux_core.parallel import merge_reports, validate_batch_parallel
+from flux_sdk.flux_core.validation import validate_batch
+
+
+def _rows(count: int) -> list:
+    rows: list = []
+    for i in range(count):
+        if i % 7 == 3:
+            rows.append({"primary_key": i, "fields": {"i": i}})
+        elif i % 11 == 5:
+            rows.append({"fields": {"i": i}, "checkpoint": "yesterday"})
+        elif i % 13 == 0:
+            rows.append(Record.from_trusted(primary_key=f"record_{i}", fields={i: i}))
+        else:
+            rows.append(Record(primary_key=f"record_{i}", fields={"i": i}, checkpoint=datetime(2024, 1, 1)))
+    return rows
+
+
+class _NoExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise AssertionError("the batch should have been validated in-process")
+
+
+class TestValidateBatchParallel(unittest.TestCase):
+    def test_same_report_as_validate_batch(self):
+        rows = _rows(500)
+        expected = validate_batch(Record, rows)
+        self.assertFalse(expected.ok)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for shard_size in (1, 7, 100, 500, 1000):
+                report = validate_batch_parallel(Record, rows, executor=executor, shard_size=shard_size, threshold=0)
+                self.assertEqual(report, expected)
+
+    def test_process_pool(self):
+        rows = _rows(200)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            report = validate_batch_parallel(Record, rows, executor=executor, shard_size=50, threshold=0)
+        self.assertEqual(report, validate_batch(Record, rows))
+
+    def test_forked_pool(self):
+        rows = _rows(200)
+        report = validate_batch_parallel(Record, rows, max_workers=2, shard_size=50, threshold=0)
+        self.assertEqual(report, validate_batch(Record, rows))
+        self.assertEqual(parallel._inherited, {})
+
+    def test_flattened_mappings(self):
+        column = [{"a": 1, "b": "2"}, None, {"a": 3, "b": "4"}, "not,a,dict", {}, OrderedDict(c=[5]), {"b": 6}]
+        flat = parallel._flatten(column)
+        self.assertEqual(len(flat.layouts), 4)
+        self.assertEqual(flat.expand(), column)
+        # columns without any dict are shipped as they are
+        column = ["a", None]
+        self.assertIs(parallel._flatten(column), column)
+
+    def test_below_threshold_stays_in_process(self):
+        rows = _rows(100)
+        report = validate_batch_parallel(Record, rows, executor=_NoExecutor(), threshold=101)
+        self.assertEqual(report, validate_batch(Record, rows))
+
+    def test_invalid_shard_size(self):
+        with self.assertRaises(ValueError):
+            validate_batch_parallel(Record, _rows(10), executor=_NoExecutor(), shard_size=0, threshold=0)
+
+    def test_merge_reports(self):
+        rows = _rows(100)
+        reports = [validate_batch(Record, rows[:40]), validate_batch(Record, rows[40:])]
+        self.assertEqual(merge_reports(Record, reports), validate_batch(Record, rows))
+        self.assertEqual(merge_reports(Record, []).total, 0)
@@ -0,0 +1,99 @@
+import unittest
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from flux_sdk.flux_core.sampling import SamplingPolicy
+from flux_sdk.flux_core.validation import FieldRule, Validated, validated, validation_policy
+
+
+@dataclass(kw_only=True)
+@validated(
+    FieldRule("primary_key", str, required=True),
+    FieldRule("fields", dict[str, Any], required=True),
+    FieldRule("checkpoint", int),
+)
+class Row(Validated):
+    primary_key: str
+    fields: dict[str, Any]
+    checkpoint: Optional[int] = None
+
+
+class TestSamplingPolicy(unittest.TestCase):
+    def test_every_nth(self):
+        policy = SamplingPolicy(every=10)
+        with validation_policy(policy):
+            for i in range(100):
+                Row(primary_key=f"row_{i}", fields={"i": i})
+
+        self.assertEqual(policy.seen, 100)
+        self.assertEqual(policy.new_shapes, 1)
+        # the first row is new, then every 10th row
+        self.assertEqual(policy.checked, 11)
+        self.assertEqual(policy.skipped, 89)
+
+    def test_fraction(self):
+        policy = SamplingPolicy(fraction=0.5, seed=42)
+        with validation_policy(policy):
+            for i in range(1000):
+                Row(primary_key=f"row_{i}", fields={"i": i})
+
+        self.assertGreater(policy.checked, 400)
+        self.assertLess(policy.checked, 600)
+
+    def test_no_sampling_only_new_shapes(self):
+        policy = SamplingPolicy()
+        with validation_policy(policy):
+            for i in range(100):
+                Row(primary_key=f"row_{i}", fields={"i": i})
+            Row(primary_key="row_new_key", fields={"j": 1})
+            # the types of the values of fields are only checked on the sampled instances
+            Row(primary_key="row_float", fields={"j": 3.14})
+
+        self.assertEqual(policy.checked, 2)
+        self.assertEqual(policy.new_shapes, 2)
+
+    def test_detects_drift(self):
+        policy = SamplingPolicy(every=1_000)
+        with validation_policy(policy):
+            Row(primary_key="row_1", fields={"i": 1}, checkpoint=1)
+            Row(primary_key="row_2", fields={"i": 2}, checkpoint=2)
+
+            # a new type for checkpoint is a new shape, which always gets validated
+            for _ in range(2):
+                with self.assertRaises(TypeError):
+                    Row(primary_key="row_3", fields={"i": 3}, checkpoint="3")
+
+        self.assertEqual(policy.checked, 3)
+
+    def test_failed_shape_is_not_remembered(self):
+        policy = SamplingPolicy(every=1_000)
+        with validation_policy(policy):
+            Row(primary_key="row_1", fields={"i": 1})
+            with self.assertRaises(TypeError):
+                Row(primary_key="row_2", fields={"i": 2}, checkpoint="2")
+            # sampled with a known shape, which must not commit the shape of the failed row
+            for i in range(1_000):
+                Row(primary_key=f"row_{i}", fields={"i": i})
+
+            with self.assertRaises(TypeError):
+                Row(primary_key="row_3", fields={"i": 3}, checkpoint="3")
+
+    def test_max_shapes(self):
+        policy = SamplingPolicy(max_shapes=2)
+        with validation_policy(policy):
+            for i in range(10):
+                Row(primary_key="row", fields={f"field_{i}": i})
+            for i in range(10):
+                Row(primary_key="row", fields={f"field_{i}": i})
+
+        self.assertEqual(policy.checked, 18)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SamplingPolicy(every=0)
+        with self.assertRaises(ValueError):
+            SamplingPolicy(fraction=1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,22 @@
 import unittest
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional, Union
 
-from flux_sdk.flux_core.validation import check_field
+from flux_sdk.flux_core import validation
+from flux_sdk.flux_core.validation import (
+    FieldError,
+    FieldRule,
+    IssueCode,
+    Validated,
+    check_field,
+    compile_validator,
+    is_validated,
+    trusted_construction,
+    try_construct,
+    validate_batch,
+    validated,
+)
 
 Checkpoint = Union[str, int, datetime]
 
@@ -104,6 +117,348 @@ class TestCheckField(unittest.TestCase):
         check_field(r, "references", dict[Any, Any])
         check_field(r, "references", dict[Any, Any], required=True)
 
+    def test_list_of_dicts(self):
+        @dataclass
+        class Query:
+            aggregate: list[dict[str, Any]]
+
+        q = Query(aggregate=[{"foo": "bar"}, {"baz": 123}])
+        check_field(q, "aggregate", list[dict[str, Any]])
+
+        # invalid types
+        for value in [{"foo": "bar"}, ["AnyObject"], [{123: "bar"}]]:
+            q.aggregate = value
+            with self.assertRaises(TypeError):
+                check_field(q, "aggregate", list[dict[str, Any]])
+
+
+class TestCompileValidator(unittest.TestCase):
+    def test_cached_per_type(self):
+        self.assertIs(compile_validator(dict[str, str]), compile_validator(dict[str, str]))
+        self.assertIs(compile_validator(list[Checkpoint]), compile_validator(list[Checkpoint]))
+        self.assertIsNot(compile_validator(dict[str, str]), compile_validator(dict[str, int]))
+
+    def test_dict_with_union_values(self):
+        validate = compile_validator(dict[str, Union[str, int, None]])
+        validate({"a": "b", "c": 1, "d": None}, "fields")
+
+        with self.assertRaisesRegex(TypeError, "fields should be a dict with"):
+            validate({"a": 3.14}, "fields")
+
+    def test_union_order_in_messages(self):
+        with self.assertRaisesRegex(TypeError, r"^value should be a typing.Union\[int, str\]$"):
+            compile_validator(Union[int, str])(3.14, "value")
+
+        with self.assertRaisesRegex(TypeError, r"^value should be a typing.Union\[str, int\]$"):
+            compile_validator(Union[str, int])(3.14, "value")
+
+    def test_error_messages(self):
+        with self.assertRaisesRegex(TypeError, "^checkpoint should be a typing.Union"):
+            compile_validator(Checkpoint)(True, "checkpoint")
+
+        with self.assertRaisesRegex(TypeError, "^owner should be a tuple with <class 'int'> as element 1$"):
+            compile_validator(tuple[str, int])(("foo", "bar"), "owner")
+
+
+class TestValidated(unittest.TestCase):
+    def test_field_rules(self):
+        @dataclass(kw_only=True)
+        @validated(
+            FieldRule("name", str, required=True),
+            FieldRule("checkpoint", Checkpoint),
+            FieldRule("tags", list[str]),
+        )
+        class Object(Validated):
+            name: str
+            checkpoint: Optional[Checkpoint] = None
+            tags: list[str] = field(default_factory=list)
+
+        Object(name="hello world", checkpoint=123, tags=["foo"])
+
+        for value in [None, ""]:
+            with self.assertRaisesRegex(ValueError, "^name is required$"):
+                Object(name=value)
+
+        with self.assertRaisesRegex(TypeError, "^name should be a <class 'str'>$"):
+            Object(name=123)
+
+        with self.assertRaisesRegex(TypeError, "^checkpoint should be a typing.Union"):
+            Object(name="hello world", checkpoint=True)
+
+        with self.assertRaisesRegex(TypeError, "^tags should be a <class 'str'>$"):
+            Object(name="hello world", tags=[123])
+
+        self.assertEqual(Object.__field_rules__[0], FieldRule("name", str, required=True))
+
+    def test_custom_post_init_runs_after_rules(self):
+        @dataclass(kw_only=True)
+        @validated(FieldRule("name", str, required=True))
+        class Object(Validated):
+            name: str
+
+            def __post_init__(self):
+                """Perform validation."""
+                if self.name != self.name.strip():
+                    raise ValueError("name must be stripped")
+
+        Object(name="hello world")
+
+        with self.assertRaises(TypeError):
+            Object(name=123)
+
+        with self.assertRaisesRegex(ValueError, "^name must be stripped$"):
+            Object(name=" hello world ")
+
+    def test_must_be_beneath_dataclass(self):
+        with self.assertRaises(TypeError):
+            @validated(FieldRule("name", str, required=True))
+            @dataclass(kw_only=True)
+            class Object(Validated):
+                name: str
+
+
+@dataclass(kw_only=True)
+@validated(
+    FieldRule("primary_key", str, required=True),
+    FieldRule("fields", dict[str, Any], required=True),
+    FieldRule("checkpoint", Checkpoint),
+)
+class BatchRecord(Validated):
+    primary_key: str
+    fields: dict[str, Any]
+    checkpoint: Optional[Checkpoint] = None
+
+
+class TestTrustedConstruction(unittest.TestCase):
+    def test_from_trusted(self):
+        r = BatchRecord.from_trusted(primary_key=123, fields=None)
+        self.assertEqual(r.primary_key, 123)
+
+        with self.assertRaises(TypeError):
+            BatchRecord(primary_key=123, fields=None)
+
+        with self.assertRaises(TypeError):
+            r.validate()
+
+        r.primary_key = "record_1"
+        with self.assertRaisesRegex(ValueError, "^fields is required$"):
+            r.validate()
+
+        r.fields = {"foo": "bar"}
+        r.validate()
+
+    def test_context_manager(self):
+        with trusted_construction():
+            rows = [BatchRecord(primary_key=i, fields={"i": i}) for i in range(3)]
+
+        with self.assertRaises(TypeError):
+            BatchRecord(primary_key=123, fields={"foo": "bar"})
+
+        self.assertEqual(validate_batch(BatchRecord, rows).invalid_rows, [0, 1, 2])
+
+    def test_validate_runs_custom_post_init(self):
+        @dataclass(kw_only=True)
+        @validated(FieldRule("name", str, required=True))
+        class Object(Validated):
+            name: str
+
+            def __post_init__(self):
+                """Perform validation."""
+                if self.name != self.name.strip():
+                    raise ValueError("name must be stripped")
+
+        o = Object.from_trusted(name=" hello world ")
+        with self.assertRaisesRegex(ValueError, "^name must be stripped$"):
+            o.validate()
+
+
+class TestNestedValidation(unittest.TestCase):
+    def setUp(self):
+        calls = self.calls = []
+
+        @dataclass(kw_only=True)
+        @validated(FieldRule("name", str, required=True))
+        class Child(Validated):
+            name: str
+
+            def __post_init__(self):
+                """Perform validation."""
+                calls.append(self.name)
+
+        @dataclass(kw_only=True)
+        @validated(
+            FieldRule("children", list[Child]),
+            FieldRule("by_name", dict[str, Child]),
+            FieldRule("owner", tuple[str, Child]),
+        )
+        class Parent(Validated):
+            children: Optional[list[Child]] = None
+            by_name: Optional[dict[str, Child]] = None
+            owner: Optional[tuple[str, Child]] = None
+
+        self.Child = Child
+        self.Parent = Parent
+
+    def test_validated_children_are_not_validated_again(self):
+        children = [self.Child(name=f"child_{i}") for i in range(3)]
+        self.assertTrue(all(map(is_validated, children)))
+        self.calls.clear()
+
+        self.Parent(children=children, by_name={c.name: c for c in children}, owner=("owner", children[0]))
+        self.assertEqual(self.calls, [])
+
+    def test_trusted_children_are_validated(self):
+        child = self.Child.from_trusted(name="child")
+        self.assertFalse(is_validated(child))
+
+        self.Parent(children=[child])
+        self.assertEqual(self.calls, ["child"])
+        self.assertTrue(is_validated(child))
+
+        bad = self.Child.from_trusted(name=123)
+        for kwargs in [{"children": [bad]}, {"by_name": {"bad": bad}}, {"owner": ("owner", bad)}]:
+            with self.assertRaisesRegex(TypeError, "^name should be a <class 'str'>$"):
+                self.Parent(**kwargs)
+
+    def test_only_nested_classes_are_tracked(self):
+        self.assertTrue(self.Child.__tracked__)
+        self.assertFalse(self.Parent.__tracked__)
+
+        parent = self.Parent.from_trusted(children=[])
+        self.assertNotIn(id(parent), validation._unvalidated)
+        self.assertFalse(is_validated(parent))
+        self.assertFalse(is_validated(self.Parent(children=[])))
+
+    def test_flag_is_not_stored_on_instances(self):
+        self.assertNotIn(id(self.Child(name="child")), validation._unvalidated)
+
+        child = self.Child.from_trusted(name="child")
+        self.assertEqual(vars(child), {"name": "child"})
+        key = id(child)
+        self.assertIn(key, validation._unvalidated)
+        del child
+        self.assertNotIn(key, validation._unvalidated)
+
+    def test_foreign_objects(self):
+        @dataclass(kw_only=True)
+        class Child:
+            name: str
+
+        self.assertFalse(is_validated(Child(name="child")))
+        self.assertFalse(is_validated("child"))
+        with self.assertRaises(TypeError):
+            self.Parent(children=[Child(name="child")])
+
+
+class TestNonRaising(unittest.TestCase):
+    def test_check(self):
+        r = BatchRecord.from_trusted(primary_key=123, fields={"foo": "bar"})
+        issue = r.check()
+        self.assertEqual(issue.code, IssueCode.TYPE)
+        self.assertEqual(issue.attr, "primary_key")
+        self.assertEqual(issue.message, "primary_key should be a <class 'str'>")
+        self.assertIsInstance(issue.error(), TypeError)
+
+        r.primary_key = "record_1"
+        self.assertIsNone(r.check())
+
+    def test_check_custom_post_init(self):
+        @dataclass(kw_only=True)
+        @validated(FieldRule("name", str, required=True))
+        class Object(Validated):
+            name: str
+
+            def __post_init__(self):
+                """Perform validation."""
+                if self.name != self.name.strip():
+                    raise ValueError("name must be stripped")
+
+        issue = Object.from_trusted(name=" hello world ").check()
+        self.assertEqual(issue.code, IssueCode.INVALID)
+        self.assertEqual(issue.message, "name must be stripped")
+
+    def test_try_construct(self):
+        r, issue = try_construct(BatchRecord, {"primary_key": "record_1", "fields": {"foo": "bar"}})
+        self.assertIsNone(issue)
+        self.assertEqual(r.primary_key, "record_1")
+
+        r, issue = try_construct(BatchRecord, {"primary_key": "", "fields": {"foo": "bar"}})
+        self.assertIsNone(r)
+        self.assertEqual(issue.code, IssueCode.REQUIRED)
+        self.assertIsInstance(issue.error(), ValueError)
+
+        r, issue = try_construct(BatchRecord, {"primary_key": "record_1", "fields": {"foo": "bar"}, "checkpoint": 1.5})
+        self.assertIsNone(r)
+        self.assertEqual((issue.code, issue.attr), (IssueCode.TYPE, "checkpoint"))
+
+        r, issue = try_construct(BatchRecord, {"primary_key": "record_1"})
+        self.assertIsNone(r)
+        self.assertEqual(issue.code, IssueCode.INVALID)
+
+    def test_nested_issue_is_raised_as_is(self):
+        validate = compile_validator(list[BatchRecord])
+        bad = BatchRecord.from_trusted(primary_key="record_1", fields=None)
+
+        with self.assertRaisesRegex(ValueError, "^fields is required$"):
+            validate([bad], "records")
+
+
+class TestValidateBatch(unittest.TestCase):
+    def test_valid_instances(self):
+        rows = [BatchRecord(primary_key=f"record_{i}", fields={"i": i}, checkpoint=i) for i in range(10)]
+
+        report = validate_batch(BatchRecord, rows)
+        self.assertTrue(report.ok)
+        self.assertEqual(report.total, 10)
+        self.assertEqual(report.invalid_rows, [])
+
+    def test_raw_kwargs(self):
+        rows = [
+            {"primary_key": "record_1", "fields": {"foo": "bar"}},
+            {"primary_key": "", "fields": {"foo": "bar"}},
+            {"primary_key": 123, "fields": {"foo": "bar"}, "checkpoint": True},
+            {"fields": {"foo": "bar"}},
+            {"primary_key": 456, "fields": {"foo": "bar"}, "checkpoint": datetime.now()},
+        ]
+
+        report = validate_batch(BatchRecord, rows)
+        self.assertFalse(report.ok)
+        self.assertEqual(report.invalid_rows, [1, 2, 3, 4])
+        self.assertEqual(
+            report.errors,
+            [
+                FieldError(
+                    attr="primary_key", message="primary_key is required", code=IssueCode.REQUIRED, rows=[1]
+                ),
+                FieldError(
+                    attr="primary_key",
+                    message="primary_key should be a <class 'str'>",
+                    code=IssueCode.TYPE,
+                    rows=[2, 4],
+                ),
+                FieldError(attr="primary_key", message="primary_key is missing", code=IssueCode.MISSING, rows=[3]),
+                FieldError(
+                    attr="checkpoint", message=f"checkpoint should be a {Checkpoint}", code=IssueCode.TYPE, rows=[2]
+                ),
+            ],
+        )
+        self.assertEqual([e.attr for e in report.errors_for_row(2)], ["primary_key", "checkpoint"])
+
+    def test_mutated_instances(self):
+        rows = [BatchRecord(primary_key=f"record_{i}", fields={"i": i}) for i in range(3)]
+        rows[1].fields = None
+
+        report = validate_batch(BatchRecord, rows)
+        self.assertEqual(report.invalid_rows, [1])
+        self.assertEqual(report.errors[0].message, "fields is required")
+
+    def test_requires_field_rules(self):
+        @dataclass
+        class Object:
+            name: str
+
+        with self.assertRaises(TypeError):
+            validate_batch(Object, [Object(name="hello world")])
 
 
 if __name__ == '__main__':
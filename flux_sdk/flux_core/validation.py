@@ -1,4 +1,99 @@
-from typing import Any, Type, Union, get_args, get_origin
+import dataclasses
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+
+class IssueCode(Enum):
+    """The kinds of validation failures, see ValidationIssue."""
+    REQUIRED = "required"
+    MISSING = "missing"
+    TYPE = "type"
+    DICT = "dict"
+    DICT_KEYS = "dict_keys"
+    DICT_VALUES = "dict_values"
+    LIST = "list"
+    TUPLE = "tuple"
+    TUPLE_ELEMENT = "tuple_element"
+    INVALID = "invalid"
+
+
+_MESSAGES: dict[IssueCode, Callable[[str, Any], str]] = {
+    IssueCode.REQUIRED: lambda attr, detail: f"{attr} is required",
+    IssueCode.MISSING: lambda attr, detail: f"{attr} is missing",
+    IssueCode.TYPE: lambda attr, detail: f"{attr} should be a {detail}",
+    IssueCode.DICT: lambda attr, detail: f"{attr} should be a dict",
+    IssueCode.DICT_KEYS: lambda attr, detail: f"{attr} should be a dict with {detail} keys",
+    IssueCode.DICT_VALUES: lambda attr, detail: f"{attr} should be a dict with {detail} values",
+    IssueCode.LIST: lambda attr, detail: f"{attr} should be a list",
+    IssueCode.TUPLE: lambda attr, detail: f"{attr} should be a tuple",
+    IssueCode.TUPLE_ELEMENT: lambda attr, detail: f"{attr} should be a tuple with {detail[0]} as element {detail[1]}",
+    IssueCode.INVALID: lambda attr, detail: str(detail),
+}
+
+
+class ValidationIssue(NamedTuple):
+    """
+    A validation failure, returned rather than raised by the non-raising variants (eg: check(), try_construct). The
+    message is only formatted on demand, so dropping invalid rows does not pay for string formatting or exceptions.
+    """
+
+    code: IssueCode
+    attr: str
+    detail: Any = None
+    """The expected type for most codes, or the exception raised by a custom check for IssueCode.INVALID."""
+
+    @property
+    def message(self) -> str:
+        return _MESSAGES[self.code](self.attr, self.detail)
+
+    def error(self) -> Exception:
+        """The exception that the raising variants (eg: __post_init__, check_field) raise for this issue."""
+        if self.code == IssueCode.INVALID:
+            return self.detail
+        if self.code == IssueCode.REQUIRED:
+            return ValueError(self.message)
+        return TypeError(self.message)
+
+
+Failure = tuple[IssueCode, Any]
+"""The result of a Checker when the value is invalid, the attribute name is only added by the caller."""
+
+Checker = Callable[[Any], Optional[Failure]]
+"""A compiled, non-raising type check, which returns None when the value is valid."""
+
+Validator = Callable[[Any, str], None]
+"""A compiled type check, called with the value and the attribute name used in error messages."""
+
+_checkers: dict[Any, Any] = {}
+_validators: dict[Any, Any] = {}
+
+_shapers: dict[Type, Callable[[Any], tuple]] = {}
+
+_unvalidated: dict[int, weakref.ref] = {}
+"""
+The tracked instances (see is_validated) which were constructed without validation, keyed by id() with a weak reference
+to the instance: dataclasses are usually unhashable, and keeping the flag outside of the instance keeps it out of vars()
+and pickles.
+"""
 
 
 def check_field(obj: Any, attr: str, desired_type: Type, required: bool = False):
@@ -8,47 +103,647 @@ def check_field(obj: Any, attr: str, desired_type: Type, required: bool = False)
         raise ValueError(f"{attr} is required")
 
     if value:
-        _check_type(value, attr, desired_type)
+        compile_validator(desired_type)(value, attr)
+
+
+def compile_validator(desired_type: Type) -> Validator:
+    """
+    Turn a type annotation into a specialized validator. The typing introspection happens only once per annotation, the
+    result is cached so that repeated checks of the same type (eg: dict[str, Field]) only pay for the isinstance calls.
+    """
+    return _cached(_validators, desired_type, _compile_validator)
+
+
+def compile_checker(desired_type: Type) -> Checker:
+    """The non-raising equivalent of compile_validator, returning a Failure instead of raising."""
+    return _cached(_checkers, desired_type, _compile)
+
+
+def _cached(cache: dict[Any, Any], desired_type: Type, compile_type: Callable[[Type], Any]) -> Any:
+    try:
+        entry = cache.get(desired_type)
+    except TypeError:
+        # unhashable annotations cannot be cached, so they are compiled on every call
+        return compile_type(desired_type)
+
+    if entry is None:
+        compiled = compile_type(desired_type)
+        cache[desired_type] = (desired_type, compiled)
+        return compiled
+
+    (cached_type, compiled) = entry
+    if _same_spelling(cached_type, desired_type):
+        return compiled
+
+    # Unions are equal regardless of the order of their arguments, but error messages should use the given order.
+    key = ("spelling", repr(desired_type))
+    compiled = cache.get(key)
+    if compiled is None:
+        compiled = cache[key] = compile_type(desired_type)
+    return compiled
+
+
+def _same_spelling(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+
+    args_a = getattr(a, "__args__", None)
+    args_b = getattr(b, "__args__", None)
+    if args_a is None or args_b is None:
+        return args_a is args_b and a == b
+
+    return (
+        len(args_a) == len(args_b)
+        and getattr(a, "__origin__", None) == getattr(b, "__origin__", None)
+        and all(map(_same_spelling, args_a, args_b))
+    )
+
+
+def _compile_validator(desired_type: Type) -> Validator:
+    check = compile_checker(desired_type)
+
+    def validate(value: Any, attr: str):
+        failure = check(value)
+        if failure is not None:
+            raise ValidationIssue(failure[0], attr, failure[1]).error()
+
+    return validate
+
+
+class FieldRule(NamedTuple):
+    """A declarative equivalent of a check_field call, used to build the validation plan of a class."""
+
+    attr: str
+    desired_type: Any
+    required: bool = False
+
+
+V = TypeVar("V", bound="Validated")
+
+
+class Validated:
+    """
+    The base class of @validated classes. It declares the methods added by the decorator so that type checkers know
+    about them, and has no state or behaviour of its own.
+    """
+
+    __slots__ = ()
+    __field_rules__: ClassVar[tuple[FieldRule, ...]]
+    __tracked__: ClassVar[bool] = False
+
+    if TYPE_CHECKING:
+
+        @classmethod
+        def from_trusted(cls: Type[V], **kwargs: Any) -> V: ...
+
+        def validate(self) -> None: ...
+
+        def check(self) -> Optional["ValidationIssue"]: ...
+
+
+def validated(*rules: FieldRule):
+    """
+    Class decorator which compiles the field rules of a dataclass into a single straight-line function, run as the
+    first step of __post_init__. A __post_init__ defined in the class body is kept and runs after the field rules, so it
+    only needs to contain the checks that cannot be expressed as a FieldRule.
+
+    This must be applied beneath @dataclass, so that the generated __init__ calls the generated __post_init__, to a
+    subclass of Validated, so that type checkers know about the methods it adds.
+
+    The decorated class also gains:
+     - from_trusted(**kwargs): construct an instance without any validation, for data that was already validated
+     - validate(): run the full validation (field rules and __post_init__) on demand, eg: on a trusted instance
+     - check(): the non-raising variant of validate(), returning the first ValidationIssue or None
+
+    The classes used within the field rules of another @validated class are tracked (see is_validated), so that
+    checking their instances as part of another object, eg: the SchemaFields in Schema.fields, only validates the ones
+    which were constructed without validation.
+    """
+
+    def decorate(cls):
+        if "__dataclass_fields__" in cls.__dict__:
+            raise TypeError(f"{cls.__name__}: @validated must be applied beneath @dataclass")
+
+        check_fields = _compile_plan(cls.__qualname__, rules)
+        custom = cls.__dict__.get("__post_init__")
+        for rule in rules:
+            _track_nested(rule.desired_type)
+
+        def validate(self):
+            issue = check_fields(self)
+            if issue is not None:
+                raise issue.error()
+            if custom is not None:
+                custom(self)
+            if self.__tracked__:
+                _unvalidated.pop(id(self), None)
+
+        def check(self):
+            issue = check_fields(self)
+            if issue is not None:
+                return issue
+            if custom is not None:
+                try:
+                    custom(self)
+                except (TypeError, ValueError) as e:
+                    return ValidationIssue(IssueCode.INVALID, cls.__name__, e)
+            if self.__tracked__:
+                _unvalidated.pop(id(self), None)
+            return None
+
+        def __post_init__(self):
+            policy = _policy.get()
+            if policy is None:
+                validate(self)
+            elif policy.should_validate(self):
+                validate(self)
+                policy.passed(self)
+            elif self.__tracked__:
+                _flag_unvalidated(self)
+
+        def from_trusted(klass, **kwargs):
+            token = _policy.set(_TRUSTED)
+            try:
+                return klass(**kwargs)
+            finally:
+                _policy.reset(token)
+
+        __post_init__.__doc__ = custom.__doc__ if custom is not None else "Perform validation."
+        validate.__doc__ = "Run the validation that is normally performed by __post_init__."
+        check.__doc__ = "Run the validation without raising, returning the first ValidationIssue or None."
+        from_trusted.__doc__ = "Construct an instance without validation, see validate() to check it later on."
+
+        methods = {"__post_init__": __post_init__, "validate": validate, "check": check, "from_trusted": from_trusted}
+        for name, method in methods.items():
+            method.__name__ = name
+            method.__qualname__ = f"{cls.__qualname__}.{name}"
+
+        cls.__post_init__ = __post_init__
+        cls.__field_rules__ = rules
+        if not hasattr(cls, "__tracked__"):
+            cls.__tracked__ = False
+        if "validate" not in cls.__dict__:
+            cls.validate = validate
+        if "check" not in cls.__dict__:
+            cls.check = check
+        if "from_trusted" not in cls.__dict__:
+            cls.from_trusted = classmethod(from_trusted)
+        return cls
+
+    return decorate
+
+
+def try_construct(cls: Type[V], kwargs: Mapping[str, Any]) -> tuple[Optional[V], Optional[ValidationIssue]]:
+    """
+    Construct an instance of a @validated class without raising when the data is invalid. This returns either the
+    validated instance and None, or None and the first ValidationIssue, so that invalid rows can be dropped cheaply.
+    """
+    try:
+        obj = cls.from_trusted(**kwargs)
+    except TypeError as e:
+        # missing or unexpected constructor arguments
+        return None, ValidationIssue(IssueCode.INVALID, cls.__name__, e)
+
+    issue = obj.check()
+    if issue is not None:
+        return None, issue
+    return obj, None
+
+
+class ValidationPolicy(ABC):
+    """Decides which instances of @validated classes get validated while the policy is active."""
+
+    @abstractmethod
+    def should_validate(self, obj: Any) -> bool:
+        """Called from __post_init__, before any validation has been performed on obj."""
+
+    def passed(self, obj: Any):
+        """Called from __post_init__ once obj has been validated successfully."""
+
+
+class _Trusted(ValidationPolicy):
+    def should_validate(self, obj: Any) -> bool:
+        return False
+
+
+_TRUSTED = _Trusted()
+
+_policy: ContextVar[Optional[ValidationPolicy]] = ContextVar("validation_policy", default=None)
+
+
+@contextmanager
+def validation_policy(policy: Optional[ValidationPolicy]) -> Iterator[None]:
+    """Apply a ValidationPolicy to every @validated class constructed within this context."""
+    token = _policy.set(policy)
+    try:
+        yield
+    finally:
+        _policy.reset(token)
+
+
+def trusted_construction():
+    """
+    Skip the validation of every @validated class constructed within this context, for example while rebuilding
+    instances that were already validated by another process. Use validate() to check some of them afterwards.
+    """
+    return validation_policy(_TRUSTED)
+
+
+def is_validated(obj: Any) -> bool:
+    """
+    Whether obj is known to have passed validation: an instance of a tracked @validated class (one used within the
+    field rules of another) which was validated, rather than constructed by from_trusted, under trusted_construction or
+    skipped by a ValidationPolicy. Reassigning a field of a validated instance is not detected, call validate() again
+    after changing one. The instances of classes which are not tracked, eg: Record, are never known to be validated.
+    """
+    return getattr(type(obj), "__tracked__", False) and id(obj) not in _unvalidated
+
+
+def _track_nested(desired_type: Any):
+    # only the instances of the classes nested in others are tracked, so that the others (eg: the Records of a sync)
+    # cost nothing more to construct; instances without weak reference support are validated every time instead
+    if _is_validated_class(desired_type) and desired_type.__weakrefoffset__:
+        desired_type.__tracked__ = True
+    for arg in get_args(desired_type):
+        _track_nested(arg)
+
+
+def _flag_unvalidated(obj: Any):
+    key = id(obj)
+    _unvalidated[key] = weakref.ref(obj, partial(_unflag, key))
+
+
+def _unflag(key: int, ref: weakref.ref):
+    _unvalidated.pop(key, None)
+
+
+def _check_nested(value: Any) -> Optional[Failure]:
+    """Validate a nested instance of a @validated class, unless it is known to be validated."""
+    if value.__tracked__ and id(value) not in _unvalidated:
+        return None
+
+    try:
+        value.validate()
+    except (TypeError, ValueError) as e:
+        return (IssueCode.INVALID, e)
+    return None
+
+
+def _is_validated_class(desired_type: Any) -> bool:
+    return isinstance(desired_type, type) and hasattr(desired_type, "__field_rules__")
+
+
+def shape_of(obj: Any) -> tuple:
+    """
+    A cheap fingerprint of the shape of a @validated instance: the type of each ruled attribute, and for mappings their
+    keys. A shape that has not been seen before is a sign of schema drift, such as a new field or an attribute of a
+    different type. The types of the values of mappings are not part of it, since collecting them costs about as much
+    as checking them.
+    """
+    cls = type(obj)
+    shaper = _shapers.get(cls)
+    if shaper is None:
+        shaper = _shapers[cls] = _compile_shaper(cls)
+    return shaper(obj)
+
+
+def _compile_shaper(cls: Type) -> Callable[[Any], tuple]:
+    """Generate the source of one function building the shape_of tuple of the instances of cls."""
+    namespace: dict[str, Any] = {"_cls": cls, "Mapping": Mapping}
+    lines = ["def shape_of(self):"]
+    items = ["_cls"]
+    for i, rule in enumerate(cls.__field_rules__):
+        mappings = _mapping_types(rule.desired_type)
+        if not mappings:
+            items.append(f"type(self.{rule.attr})")
+            continue
+        lines.append(f"    value{i} = self.{rule.attr}")
+        if mappings == {dict}:
+            # much cheaper than the isinstance check of an ABC
+            items.append(f"tuple(value{i}) if type(value{i}) is dict else type(value{i})")
+        else:
+            items.append(f"tuple(value{i}) if isinstance(value{i}, Mapping) else type(value{i})")
+    lines.append(f"    return ({', '.join(items)},)")
+
+    exec(compile("\n".join(lines), f"<shape of {cls.__qualname__}>", "exec"), namespace)
+    return namespace["shape_of"]
+
+
+def _mapping_types(desired_type: Any) -> set[type]:
+    origin = get_origin(desired_type)
+    if origin == Union:
+        return set().union(*map(_mapping_types, get_args(desired_type)))
+    target = origin if origin is not None else desired_type
+    return {target} if isinstance(target, type) and issubclass(target, Mapping) else set()
+
+
+def _compile_plan(name: str, rules: tuple[FieldRule, ...]) -> Callable[[Any], Optional[ValidationIssue]]:
+    """
+    Generate the source of one function performing every rule in order, with the rule constants bound as globals. It
+    returns the first ValidationIssue, which are prepared in advance, or None. Plain classes and Unions are checked
+    inline, while containers delegate to their compiled checker.
+    """
+    namespace: dict[str, Any] = {"ValidationIssue": ValidationIssue}
+    lines = ["def check_fields(self):"]
+
+    for i, (attr, desired_type, required) in enumerate(rules):
+        if not attr.isidentifier():
+            raise ValueError(f"{name}: {attr!r} is not a valid attribute name")
+
+        namespace[f"_attr{i}"] = attr
+        namespace[f"_issue{i}"] = ValidationIssue(IssueCode.TYPE, attr, desired_type)
+        lines.append(f"    value = self.{attr}")
+
+        if required:
+            namespace[f"_required{i}"] = ValidationIssue(IssueCode.REQUIRED, attr)
+            lines.append("    if not value:")
+            lines.append(f"        return _required{i}")
+            indent = "    "
+        else:
+            lines.append("    if value:")
+            indent = "        "
+
+        origin = get_origin(desired_type)
+        args = get_args(desired_type)
+        if origin == Union and len(args) > 0 and not any(map(_is_validated_class, args)):
+            namespace[f"_type{i}"] = frozenset(args)
+            lines.append(f"{indent}if type(value) not in _type{i}:")
+            lines.append(f"{indent}    return _issue{i}")
+        elif origin is None and isinstance(desired_type, type) and not _is_validated_class(desired_type):
+            namespace[f"_type{i}"] = desired_type
+            lines.append(f"{indent}if not isinstance(value, _type{i}):")
+            lines.append(f"{indent}    return _issue{i}")
+        else:
+            namespace[f"_checker{i}"] = compile_checker(desired_type)
+            lines.append(f"{indent}failure = _checker{i}(value)")
+            lines.append(f"{indent}if failure is not None:")
+            lines.append(f"{indent}    return ValidationIssue(failure[0], _attr{i}, failure[1])")
+
+    lines.append("    return None")
+
+    exec(compile("\n".join(lines), f"<validation plan for {name}>", "exec"), namespace)
+    return namespace["check_fields"]
+
+
+@dataclass(kw_only=True)
+class FieldError:
+    """One failed rule in a batch, along with the index of every row that failed it the same way."""
+
+    attr: str
+    """The attribute which failed validation."""
+
+    message: str
+    """The same message check_field would have raised for these rows."""
+
+    code: Optional[IssueCode] = None
+    """The kind of failure, see IssueCode."""
+
+    rows: list[int] = field(default_factory=list)
+    """The indices (within the validated batch) of the rows with this error, in increasing order."""
+
+
+@dataclass(kw_only=True)
+class ValidationReport:
+    """The result of validate_batch. Errors are grouped by attribute and message, so a bad column stays compact."""
+
+    total: int
+    """The number of rows which were validated."""
+
+    errors: list[FieldError] = field(default_factory=list)
+    """The failed rules, in the order the columns were validated."""
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def invalid_rows(self) -> list[int]:
+        """The sorted indices of every row with at least one error."""
+        return sorted({row for error in self.errors for row in error.rows})
+
+    def errors_for_row(self, row: int) -> list[FieldError]:
+        return [error for error in self.errors if row in error.rows]
+
+
+class _Missing:
+    def __reduce__(self):
+        return "_MISSING"  # unpickles as the module singleton, so columns can be shipped to other processes
+
+
+_MISSING = _Missing()
+_MISSING_FAILURE = (IssueCode.MISSING, None)
+_REQUIRED_FAILURE = (IssueCode.REQUIRED, None)
+
+
+def validate_batch(cls: Type, rows: Sequence[Any]) -> ValidationReport:
+    """
+    Validate a batch of rows against the field rules of a @validated class without raising on the first bad row. Each
+    row can be an instance of the class, or a mapping of the keyword arguments that would be used to construct it.
+
+    Validation happens column by column (eg: every primary_key, then every checkpoint) so that the compiled checker for
+    each rule is looked up once per batch, and invalid values cost no exception. Only the FieldRules are checked, any
+    additional checks performed in the __post_init__ of the class are not.
+    """
+    return validate_columns(cls, batch_columns(cls, rows))
+
+
+def field_rules(cls: Type) -> tuple[FieldRule, ...]:
+    """The FieldRules declared by a @validated class."""
+    rules: Optional[tuple[FieldRule, ...]] = getattr(cls, "__field_rules__", None)
+    if rules is None:
+        raise TypeError(f"{cls.__name__} does not declare field rules, use @validated")
+    return rules
+
+
+def batch_columns(cls: Type, rows: Sequence[Any]) -> list[list[Any]]:
+    """
+    The values of rows (instances or keyword argument mappings, as for validate_batch) for each field rule of cls, in
+    rule order. Keys missing from a mapping take the default of the field, or a marker reported as IssueCode.MISSING.
+    """
+    defaults = _defaults(cls)
+    return [_column(rows, rule.attr, defaults.get(rule.attr, _MISSING)) for rule in field_rules(cls)]
+
+
+def validate_columns(cls: Type, columns: Sequence[list[Any]]) -> ValidationReport:
+    """validate_batch for a batch already split by batch_columns, eg: a shard shipped to another process."""
+    report = ValidationReport(total=len(columns[0]) if columns else 0)
+
+    for (attr, desired_type, required), column in zip(field_rules(cls), columns):
+        check = compile_checker(desired_type)
+        failure: Optional[Failure]
+        errors: dict[Any, FieldError] = {}
+
+        for i, value in enumerate(column):
+            if value is _MISSING:
+                failure = _MISSING_FAILURE
+            elif not value:
+                if not required:
+                    continue
+                failure = _REQUIRED_FAILURE
+            else:
+                failure = check(value)
+                if failure is None:
+                    continue
+
+            # failures are prepared in advance, apart from the exceptions of nested instances
+            key = failure if failure[0] != IssueCode.INVALID else str(failure[1])
+            error = errors.get(key)
+            if error is None:
+                issue = ValidationIssue(failure[0], attr, failure[1])
+                error = errors[key] = FieldError(attr=attr, message=issue.message, code=issue.code)
+            error.rows.append(i)
+
+        report.errors.extend(errors.values())
+
+    return report
+
+
+def _defaults(cls: Type) -> dict[str, Any]:
+    defaults = {}
+    if dataclasses.is_dataclass(cls):
+        for f in dataclasses.fields(cls):
+            if f.default is not dataclasses.MISSING:
+                defaults[f.name] = f.default
+            elif f.default_factory is not dataclasses.MISSING:
+                defaults[f.name] = f.default_factory()
+    return defaults
+
+
+def _column(rows: Sequence[Any], attr: str, default: Any) -> list[Any]:
+    return [row.get(attr, default) if isinstance(row, Mapping) else getattr(row, attr) for row in rows]
 
 
 def _check_type(value: Any, attr: str, desired_type: Type):
+    compile_validator(desired_type)(value, attr)
+
+
+def _isinstance_target(desired_type: Type) -> Any:
+    """Flatten a Union into a tuple of types, which isinstance handles much faster than the Union itself."""
+    if get_origin(desired_type) == Union:
+        return get_args(desired_type)
+    return desired_type
+
+
+def _compile(desired_type: Type) -> Checker:
     origin = get_origin(desired_type)
     args = get_args(desired_type)
 
     if origin == Union and len(args) > 0:
-        if type(value) not in args:
-            raise TypeError(f"{attr} should be a {desired_type}")
-
+        return _compile_union(desired_type, args)
     elif origin == dict:
-        if type(value) != origin:
-            raise TypeError(f"{attr} should be a dict")
+        return _compile_dict(origin, args)
+    elif origin == list:
+        return _compile_list(origin, args)
+    elif origin == tuple:
+        return _compile_tuple(origin, args)
 
-        if len(args) == 2:
-            (key_type, value_type) = args
+    failure = (IssueCode.TYPE, desired_type)
 
-            if key_type != Any and not all(map(lambda k: isinstance(k, key_type), value.keys())):
-                raise TypeError(f"{attr} should be a dict with {key_type} keys")
+    if _is_validated_class(desired_type):
+        def check(value: Any) -> Optional[Failure]:
+            if not isinstance(value, desired_type):
+                return failure
+            return _check_nested(value)
+    else:
+        def check(value: Any) -> Optional[Failure]:
+            if not isinstance(value, desired_type):
+                return failure
+            return None
 
-            if value_type != Any and not all(map(lambda k: isinstance(k, value_type), value.values())):
-                raise TypeError(f"{attr} should be a dict with {value_type} values")
+    return check
 
-    elif origin == list:
-        if type(value) != origin:
-            raise TypeError(f"{attr} should be a list")
 
-        if len(args) == 1:
-            (value_type,) = args
+def _compile_union(desired_type: Type, args: tuple) -> Checker:
+    allowed = frozenset(args)
+    nested = frozenset(filter(_is_validated_class, args))
+    failure = (IssueCode.TYPE, desired_type)
+
+    def check(value: Any) -> Optional[Failure]:
+        if type(value) not in allowed:
+            return failure
+        if type(value) in nested:
+            return _check_nested(value)
+        return None
+
+    return check
+
+
+def _compile_dict(origin: Type, args: tuple) -> Checker:
+    key_type = value_type = Any
+    if len(args) == 2:
+        (key_type, value_type) = args
+
+    key_target = _isinstance_target(key_type)
+    value_target = _isinstance_target(value_type)
+    check_keys = key_type != Any
+    check_values = value_type != Any
+    nested = tuple(filter(_is_validated_class, value_target if isinstance(value_target, tuple) else (value_target,)))
+
+    dict_failure = (IssueCode.DICT, None)
+    keys_failure = (IssueCode.DICT_KEYS, key_type)
+    values_failure = (IssueCode.DICT_VALUES, value_type)
+
+    def check(value: Any) -> Optional[Failure]:
+        if type(value) is not origin:
+            return dict_failure
+
+        if check_keys:
+            for k in value:
+                if not isinstance(k, key_target):
+                    return keys_failure
+
+        if check_values:
+            for v in value.values():
+                if not isinstance(v, value_target):
+                    return values_failure
+
+        if nested:
+            for v in value.values():
+                if isinstance(v, nested):
+                    failure = _check_nested(v)
+                    if failure is not None:
+                        return failure
+
+        return None
+
+    return check
+
+
+def _compile_list(origin: Type, args: tuple) -> Checker:
+    element = compile_checker(args[0]) if len(args) == 1 else None
+    list_failure = (IssueCode.LIST, None)
+
+    def check(value: Any) -> Optional[Failure]:
+        if type(value) is not origin:
+            return list_failure
+
+        if element is not None:
             for v in value:
-                _check_type(v, attr, value_type)
+                failure = element(v)
+                if failure is not None:
+                    return failure
+        return None
 
-    elif origin == tuple:
-        if type(value) != origin:
-            raise TypeError(f"{attr} should be a tuple")
+    return check
+
+
+def _compile_tuple(origin: Type, args: tuple) -> Checker:
+    nested = [_is_validated_class(value_type) for value_type in args]
+    tuple_failure = (IssueCode.TUPLE, None)
+    element_failures = [(IssueCode.TUPLE_ELEMENT, (value_type, i)) for i, value_type in enumerate(args)]
+
+    def check(value: Any) -> Optional[Failure]:
+        if type(value) is not origin:
+            return tuple_failure
 
         for i, v in enumerate(value):
             value_type = args[i]
             if not isinstance(v, value_type):
-                raise TypeError(f"{attr} should be a tuple with {value_type} as element {i}")
+                return element_failures[i]
+            if nested[i]:
+                failure = _check_nested(v)
+                if failure is not None:
+                    return failure
+        return None
 
-    elif not isinstance(value, desired_type):
-        raise TypeError(f"{attr} should be a {desired_type}")
+    return check
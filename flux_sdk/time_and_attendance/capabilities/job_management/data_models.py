@@ -4,7 +4,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional, Union
 
-from flux_sdk.flux_core.validation import check_field
+from flux_sdk.flux_core.validation import FieldRule, Validated, validated
 
 
 class RipplingAttribute(Enum):
@@ -47,7 +47,15 @@ class PayRateCompatibleValue:
 
 
 @dataclass(kw_only=True)
-class AddressCompatibleValue:
+@validated(
+    FieldRule("street_line_1", str, required=True),
+    FieldRule("street_line_2", str),
+    FieldRule("zip_code", str, required=True),
+    FieldRule("city", str, required=True),
+    FieldRule("state", str, required=True),
+    FieldRule("country_code", str, required=True),
+)
+class AddressCompatibleValue(Validated):
     """
     This represents an address compatible value.
     """
@@ -72,19 +80,17 @@ class AddressCompatibleValue:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "street_line_1", str, required=True)
-        check_field(self, "street_line_2", str)
-        check_field(self, "zip_code", str, required=True)
-        check_field(self, "city", str, required=True)
-        check_field(self, "state", str, required=True)
-        check_field(self, "country_code", str, required=True)
-
         if len(self.country_code) != 2 or self.country_code != self.country_code.upper():
             raise ValueError("AddressCompatibleValue error: country_code must be a 2 letter uppercase country code")
 
 
 @dataclass(kw_only=True)
-class AttributeValue:
+@validated(
+    FieldRule("id", str, required=True),
+    FieldRule("name", str, required=True),
+    FieldRule("associated_attribute_values", list, required=True),
+)
+class AttributeValue(Validated):
     """
     This represents an attribute value associated with an attribute.
 
@@ -116,10 +122,6 @@ class AttributeValue:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "id", str, required=True)
-        check_field(self, "name", str, required=True)
-        check_field(self, "associated_attribute_values", list, required=True)
-
         if len(self.associated_attribute_values) == 0:
             raise ValueError("AttributeValue error: associated_attribute_values must have at least 1 value")
 
@@ -132,7 +134,13 @@ class AttributeValue:
 
 
 @dataclass(kw_only=True)
-class Attribute:
+@validated(
+    FieldRule("id", str, required=True),
+    FieldRule("name", str, required=True),
+    FieldRule("description", str),
+    FieldRule("compatible_rippling_attributes", list, required=True),
+)
+class Attribute(Validated):
     """
     This represents an attribute from the third party system and how it is mapped to Rippling.
 
@@ -163,11 +171,6 @@ class Attribute:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "id", str, required=True)
-        check_field(self, "name", str, required=True)
-        check_field(self, "description", str)
-        check_field(self, "compatible_rippling_attributes", list, required=True)
-
         rippling_attributes_to_attribute_values = {
             RipplingAttribute.PAY_RATE: PayRateCompatibleValue,
             RipplingAttribute.JOB_SITE_LOCATION: AddressCompatibleValue,
@@ -253,7 +256,10 @@ class GetJobAttributesRequest:
 
 
 @dataclass(kw_only=True)
-class GetJobAttributesResponse:
+@validated(
+    FieldRule("attributes", list[Attribute], required=True),
+)
+class GetJobAttributesResponse(Validated):
     """
     This represents a response containing the attributes from the third party system, how they map to Rippling,
     and optionally their values.
@@ -269,8 +275,6 @@ class GetJobAttributesResponse:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "attributes", list[Attribute], required=True)
-
         if len(self.attributes) == 0:
             raise ValueError("GetJobAttributesResponse error: attributes must have at least 1 value")
 
@@ -286,7 +290,12 @@ class GetJobAttributesResponse:
 
 
 @dataclass(kw_only=True)
-class EmployeePayRateOverride:
+@validated(
+    FieldRule("employee_id", str, required=True),
+    FieldRule("attribute_value_id", str, required=True),
+    FieldRule("pay_rate", str, required=True),
+)
+class EmployeePayRateOverride(Validated):
     """
     This represents the pay rate override for a specific employee, tied to the attribute_id that maps to
      RipplingAttribute.PAY_RATE.
@@ -321,10 +330,6 @@ class EmployeePayRateOverride:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "employee_id", str, required=True)
-        check_field(self, "attribute_value_id", str, required=True)
-        check_field(self, "pay_rate", str, required=True)
-
         if not isinstance(self.pay_rate, str):
             raise ValueError("EmployeePayRateOverride error: pay_rate must be a str.")
 
@@ -340,7 +345,10 @@ class EmployeePayRateOverride:
 
 
 @dataclass(kw_only=True)
-class GetEmployeesPayRateOverridesResponse:
+@validated(
+    FieldRule("employee_pay_rate_overrides_per_attribute", dict, required=True),
+)
+class GetEmployeesPayRateOverridesResponse(Validated):
     """
     This represents a response containing the pay rates overrides for employees.
 
@@ -368,8 +376,6 @@ class GetEmployeesPayRateOverridesResponse:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "employee_pay_rate_overrides_per_attribute", dict, required=True)
-
         employee_id_to_attribute_value_id = defaultdict(set)
         for attribute_id, pay_rate_overrides in self.employee_pay_rate_overrides_per_attribute.items():
             if not isinstance(attribute_id, str):
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
-from flux_sdk.flux_core.validation import check_field
+from flux_sdk.flux_core.validation import FieldRule, Validated, validated
 
 
 @dataclass(kw_only=True)
@@ -20,7 +20,14 @@ class TimeEntriesQuery:
     """end_time: This field denotes the time entry end datetime with timezone (before) to filter for."""
 
 @dataclass(kw_only=True)
-class JobShift:
+@validated(
+    FieldRule("id", str, required=True),
+    FieldRule("job_attributes", dict[str, Any], required=True),
+    FieldRule("start_time", datetime, required=True),
+    FieldRule("end_time", datetime),
+    FieldRule("description", str),
+)
+class JobShift(Validated):
     """
     This class represents the equivalent of a Job Shift period. It may be called different
     names in different apps, but should reflect clocked in periods. Note that these may overlap
@@ -45,18 +52,20 @@ class JobShift:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "id", str, required=True)
-        check_field(self, "job_attributes", dict[str, Any], required=True)
-        check_field(self, "start_time", datetime, required=True)
         if self.start_time.tzinfo is None:
             raise ValueError("No time zone provided for start_time")
-        check_field(self, "end_time", datetime)
         if self.end_time is not None and self.end_time.tzinfo is None:
             raise ValueError("No time zone provided for end_time")
-        check_field(self, "description", str)
 
 @dataclass(kw_only=True)
-class Break:
+@validated(
+    FieldRule("id", str, required=True),
+    FieldRule("start_time", datetime, required=True),
+    FieldRule("end_time", datetime),
+    FieldRule("description", str),
+    FieldRule("break_type_id", str, required=True),
+)
+class Break(Validated):
     """
     This class represents the equivalent of a break duration. It may be called different
     names in different apps, but should reflect break periods. Note that these may overlap
@@ -80,19 +89,18 @@ class Break:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "id", str, required=True)
-        check_field(self, "start_time", datetime, required=True)
         if self.start_time.tzinfo is None:
             raise ValueError("No time zone provided for start_time")
-        check_field(self, "end_time", datetime)
         if self.end_time is not None and self.end_time.tzinfo is None:
             raise ValueError("No time zone provided for end_time")
-        check_field(self, "description", str)
-        check_field(self, "break_type_id", str, required=True)
 
 
 @dataclass(kw_only=True)
-class BreakType:
+@validated(
+    FieldRule("id", str, required=True),
+    FieldRule("name", str, required=True),
+)
+class BreakType(Validated):
     """
     This class represents the equivalent of a break type. It may be called different
     names in different apps, but should reflect the type of the break in the third party
@@ -105,14 +113,12 @@ class BreakType:
     name: str
     """name: This field denotes the break type name."""
 
-    def __post_init__(self):
-        """Perform validation."""
-        check_field(self, "id", str, required=True)
-        check_field(self, "name", str, required=True)
-
 
 @dataclass(kw_only=True)
-class GetBreakTypesResponse:
+@validated(
+    FieldRule("break_types", list[BreakType], required=True),
+)
+class GetBreakTypesResponse(Validated):
     """
     This class represents the response of the get_break_types hook.
     """
@@ -122,8 +128,6 @@ class GetBreakTypesResponse:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "break_types", list[BreakType], required=True)
-
         ids = set()
         names = set()
         for break_type in self.break_types:
@@ -136,7 +140,15 @@ class GetBreakTypesResponse:
 
 
 @dataclass(kw_only=True)
-class TimeEntry:
+@validated(
+    FieldRule("id", str, required=True),
+    FieldRule("user_id", str, required=True),
+    FieldRule("job_shifts", list[JobShift]),
+    FieldRule("breaks", list[Break]),
+    FieldRule("start_time", datetime, required=True),
+    FieldRule("end_time", datetime),
+)
+class TimeEntry(Validated):
     """
     This class represents the equivalent of overarching time entry object. It may be called different
     names in different apps, but should reflect the overarching record that tracks time segments of
@@ -164,13 +176,7 @@ class TimeEntry:
 
     def __post_init__(self):
         """Perform validation."""
-        check_field(self, "id", str, required=True)
-        check_field(self, "user_id", str, required=True)
-        check_field(self, "job_shifts", list[JobShift])
-        check_field(self, "breaks", list[Break])
-        check_field(self, "start_time", datetime, required=True)
         if self.start_time.tzinfo is None:
             raise ValueError("No time zone provided for start_time")
-        check_field(self, "end_time", datetime)
         if self.end_time is not None and self.end_time.tzinfo is None:
             raise ValueError("No time zone provided for end_time")